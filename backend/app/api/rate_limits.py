@@ -0,0 +1,121 @@
+"""Per-user request budgets for the endpoints that trigger LLM work.
+
+Budgets come from settings (`RATE_LIMIT_<ENDPOINT>`, e.g. "30/hour"), plus an optional
+`RATE_LIMIT_GLOBAL` shared by all users. With the default "memory" backend every process
+keeps its own token buckets (so each gunicorn worker grants the full budget); the
+"postgres" backend counts in fixed windows in `rate_limit_counters`, shared by all workers
+and instances. Over budget -> 429 with Retry-After.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from collections.abc import Callable
+from functools import lru_cache
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.metrics import rate_limit_requests
+from app.core.rate_limit import KeyedTokenBuckets, parse_rate
+from app.core.security import get_current_user
+from app.models.user import User
+from app.services.rate_limit_service import hit_shared_counter, refund_shared_counter
+
+logger = logging.getLogger(__name__)
+
+_GLOBAL_KEY = "*"
+
+_buckets_lock = threading.Lock()
+_buckets: dict[tuple[str, int, float], KeyedTokenBuckets] = {}
+
+
+@lru_cache(maxsize=32)
+def _budget(spec: str) -> tuple[int, float] | None:
+    return parse_rate(spec)
+
+
+def _memory_buckets(scope: str, budget: tuple[int, float]) -> KeyedTokenBuckets:
+    limit, period_s = budget
+    with _buckets_lock:
+        buckets = _buckets.get((scope, limit, period_s))
+        if buckets is None:
+            buckets = _buckets[(scope, limit, period_s)] = KeyedTokenBuckets(limit / period_s, capacity=limit)
+    return buckets
+
+
+def _wait(db: Session, scope: str, budget: tuple[int, float], key: str) -> tuple[float, Callable[[], None]]:
+    """Spend one request of `key`'s budget: (seconds to wait, 0 if allowed; a callable that refunds it)."""
+
+    if settings.rate_limit_backend == "postgres":
+        counter_key = f"{scope}:{key}"
+        try:
+            wait = hit_shared_counter(db, counter_key, *budget)
+            return wait, lambda: refund_shared_counter(db, counter_key, budget[1])
+        except Exception:
+            # Fail over to the per-process buckets rather than rejecting or waving everything through.
+            logger.exception("Shared rate limit counter failed; using the in-process limiter")
+            db.rollback()
+    buckets = _memory_buckets(scope, budget)
+    return buckets.try_acquire(key), lambda: buckets.release(key)
+
+
+def _refund(db: Session, refund: Callable[[], None]) -> None:
+    try:
+        refund()
+    except Exception:
+        logger.exception("Refunding a rate limit token failed")
+        db.rollback()
+
+
+def reset_rate_limits() -> None:
+    """Drop all in-process buckets (tests, or after changing budgets at runtime)."""
+
+    with _buckets_lock:
+        _buckets.clear()
+
+
+def check_rate_limit(db: Session, user: User, endpoint: str) -> None:
+    """Spend one request of `user`'s `RATE_LIMIT_<ENDPOINT>` budget (and the global one) or raise 429."""
+
+    if not settings.rate_limit_enabled:
+        return
+    wait = 0.0
+    refund_user = None
+    budget = _budget(getattr(settings, f"rate_limit_{endpoint}"))
+    if budget is not None:
+        wait, refund_user = _wait(db, endpoint, budget, str(user.id))
+    # Checked after the user's own budget, so a client that is over its budget does not
+    # also drain the budget shared with everyone else. If the global budget refuses the
+    # request, the user gets their token back: the request is not served.
+    global_budget = _budget(settings.rate_limit_global)
+    if not wait and global_budget is not None:
+        wait, _ = _wait(db, "global", global_budget, _GLOBAL_KEY)
+        if wait and refund_user is not None:
+            _refund(db, refund_user)
+
+    if wait > 0:
+        rate_limit_requests.inc(endpoint=endpoint, outcome="limited")
+        logger.info("Rate limited user %s on %s for %.1fs", user.id, endpoint, wait)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, please try again later",
+            headers={"Retry-After": str(max(1, math.ceil(wait)))},
+        )
+    rate_limit_requests.inc(endpoint=endpoint, outcome="allowed")
+
+
+def rate_limited(endpoint: str) -> Callable[..., None]:
+    """Route dependency: `dependencies=[Depends(rate_limited("journal_create"))]`."""
+
+    if not hasattr(settings, f"rate_limit_{endpoint}"):
+        raise ValueError(f"No budget setting 'rate_limit_{endpoint}'")
+
+    def dependency(db: Session = Depends(get_db), user: User = Depends(get_current_user)) -> None:
+        check_rate_limit(db, user, endpoint)
+
+    return dependency
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+
+from app.core import readiness
+from app.core.responses import FastJSONResponse
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/healthz")
+def healthz():
+    """Readiness: 503 until warm-up has finished, and while the database is unreachable."""
+
+    checks = readiness.checks()
+    ready = readiness.is_ready()
+    if ready and not readiness.ping_db():
+        checks["db"] = readiness.ERROR
+        ready = False
+    return FastJSONResponse(
+        {"status": "ready" if ready else "not_ready", "checks": checks},
+        status_code=200 if ready else 503,
+        headers={"Cache-Control": "no-store"},
+    )
@@ -1,52 +1,150 @@
 from __future__ import annotations
 
+import logging
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.api.rate_limits import check_rate_limit, rate_limited
 from app.core.database import get_db
+from app.core.http_cache import (
+    PRIVATE_IMMUTABLE,
+    PRIVATE_REVALIDATE,
+    etag_matches,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+)
+from app.core.responses import FastJSONResponse
 from app.core.security import get_current_user
+from app.core.singleflight import SingleFlight
+from app.models.entry_analysis import EntryAnalysis
+from app.models.entry_analysis_translation import EntryAnalysisTranslation
 from app.models.journal_entry import JournalEntry
 from app.models.user import User
 from app.schemas.analysis import EntryAnalysisOut
-from app.schemas.journal import JournalEntryCreate, JournalEntryCreatedResponse, JournalEntryOut
+from app.schemas.journal import (
+    JournalEntryCreate,
+    JournalEntryCreatedResponse,
+    JournalEntryOut,
+    JournalSearchHit,
+    JournalSearchOut,
+)
 from app.services.analysis_service import analyze_entry
+from app.services.embedding_service import store_entry_embedding
+from app.services.idempotency_service import (
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+    abandon_request,
+    begin_request,
+    complete_request,
+    request_fingerprint,
+)
+from app.services.payload_service import ENTRY_COLUMNS, entry_payload, fresh_translation, get_analysis_payload
+from app.services.search_service import search_entries
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/journal", tags=["journal"])
 
 
-@router.post("", response_model=JournalEntryCreatedResponse, status_code=status.HTTP_201_CREATED)
+_create_entry_flight: SingleFlight[tuple[dict, bool]] = SingleFlight()
+
+
+def _create_entry_once(
+    db: Session,
+    user: User,
+    data: JournalEntryCreate,
+    idempotency_key: str | None,
+    request_hash: str,
+) -> tuple[dict, bool]:
+    if idempotency_key:
+        try:
+            stored = begin_request(db, user.id, idempotency_key, request_hash)
+        except IdempotencyKeyReused:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used for a different request",
+            )
+        except IdempotencyKeyInProgress:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "5"},
+            )
+        if stored is not None:
+            return stored[1], True
+
+    try:
+        # Spent only for requests that create an entry: replays of a stored response are free.
+        check_rate_limit(db, user, "journal_create")
+        entry = JournalEntry(
+            id=uuid.uuid4(),
+            user_id=user.id,
+            text=data.text,
+            mood_score=data.mood_score,
+            energy_score=data.energy_score,
+            language=user.preferred_language,
+        )
+        db.add(entry)
+        db.commit()
+        db.refresh(entry)
+
+        try:
+            store_entry_embedding(db, entry)
+        except Exception:
+            # Only feeds "similar entries" retrieval; the entry itself is already saved.
+            logger.exception("Embedding failed for entry %s", entry.id)
+            db.rollback()
+
+        # Run analysis synchronously so the user sees results immediately after saving.
+        analyze_entry(db, entry, user.preferred_language)
+
+        payload = JournalEntryCreatedResponse(
+            entry=JournalEntryOut(
+                id=str(entry.id),
+                text=entry.text,
+                mood_score=entry.mood_score,
+                energy_score=entry.energy_score,
+                created_at=entry.created_at,
+            ),
+            analysis_status="ready",
+        ).model_dump(mode="json")
+    except Exception:
+        if idempotency_key:
+            abandon_request(db, user.id, idempotency_key)
+        raise
+
+    if idempotency_key:
+        complete_request(db, user.id, idempotency_key, status.HTTP_201_CREATED, payload)
+    return payload, False
+
+
+@router.post(
+    "",
+    response_model=JournalEntryCreatedResponse,
+    status_code=status.HTTP_201_CREATED,
+)
 def create_entry(
     data: JournalEntryCreate,
+    response: Response,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key", max_length=255),
 ):
-    entry = JournalEntry(
-        id=uuid.uuid4(),
-        user_id=user.id,
-        text=data.text,
-        mood_score=data.mood_score,
-        energy_score=data.energy_score,
-    )
-    db.add(entry)
-    db.commit()
-    db.refresh(entry)
-
-    # Run analysis synchronously so the user sees results immediately after saving.
-    analyze_entry(db, entry, user.preferred_language)
-
-    return JournalEntryCreatedResponse(
-        entry=JournalEntryOut(
-            id=str(entry.id),
-            text=entry.text,
-            mood_score=entry.mood_score,
-            energy_score=entry.energy_score,
-            created_at=entry.created_at,
-        ),
-        analysis_status="ready",
+    request_hash = request_fingerprint(data.model_dump())
+    # Identical submissions that are in flight at the same time share one entry and one
+    # analysis, with or without a key. With a key, later replays get the stored response.
+    flight_key = (user.id, idempotency_key, request_hash)
+    (payload, replayed), joined = _create_entry_flight.do(
+        flight_key,
+        lambda: _create_entry_once(db, user, data, idempotency_key, request_hash),
     )
+    if replayed or joined:
+        response.headers["Idempotent-Replayed"] = "true"
+    return payload
 
 
 @router.get("", response_model=list[JournalEntryOut])
@@ -55,23 +153,44 @@ def list_entries(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    stmt = select(JournalEntry).where(JournalEntry.user_id == user.id).order_by(JournalEntry.created_at.desc()).limit(limit)
-    entries = db.scalars(stmt).all()
-    return [
-        JournalEntryOut(
-            id=str(e.id),
-            text=e.text,
-            mood_score=e.mood_score,
-            energy_score=e.energy_score,
-            created_at=e.created_at,
-        )
-        for e in entries
-    ]
+    stmt = select(*ENTRY_COLUMNS).where(JournalEntry.user_id == user.id).order_by(JournalEntry.created_at.desc()).limit(limit)
+    # Trusted rows from our own table: skip response_model validation and encode with orjson.
+    return FastJSONResponse([entry_payload(r) for r in db.execute(stmt)])
+
+
+@router.get("/search", response_model=JournalSearchOut)
+def search_journal(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=50),
+    offset: int = Query(default=0, ge=0, le=1000),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    rows, has_more = search_entries(db, user.id, q, limit, offset)
+    return JournalSearchOut(
+        query=q,
+        limit=limit,
+        offset=offset,
+        has_more=has_more,
+        results=[
+            JournalSearchHit(
+                id=str(r.id),
+                created_at=r.created_at,
+                mood_score=r.mood_score,
+                energy_score=r.energy_score,
+                rank=r.rank,
+                snippet=r.snippet,
+            )
+            for r in rows
+        ],
+    )
 
 
 @router.get("/{entry_id}", response_model=JournalEntryOut)
 def get_entry(
     entry_id: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -80,9 +199,16 @@ def get_entry(
     except ValueError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
 
-    entry = db.get(JournalEntry, entry_uuid)
-    if not entry or entry.user_id != user.id:
+    # Entries are never edited, so the ownership check doubles as the version check.
+    owner_id = db.scalar(select(JournalEntry.user_id).where(JournalEntry.id == entry_uuid))
+    if owner_id != user.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
+    etag = make_etag("entry", entry_uuid)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, PRIVATE_IMMUTABLE)
+
+    entry = db.get(JournalEntry, entry_uuid)
+    set_cache_headers(response, etag, PRIVATE_IMMUTABLE)
     return JournalEntryOut(
         id=str(entry.id),
         text=entry.text,
@@ -95,6 +221,7 @@ def get_entry(
 @router.get("/{entry_id}/analysis", response_model=EntryAnalysisOut | None)
 def get_entry_analysis(
     entry_id: str,
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -103,32 +230,41 @@ def get_entry_analysis(
     except ValueError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
 
-    entry = db.get(JournalEntry, entry_uuid)
-    if not entry or entry.user_id != user.id:
+    language = user.preferred_language
+    version = db.execute(
+        select(
+            JournalEntry.user_id,
+            EntryAnalysis.id,
+            EntryAnalysis.updated_at,
+            EntryAnalysisTranslation.created_at.label("translated_at"),
+        )
+        .outerjoin(EntryAnalysis, EntryAnalysis.entry_id == JournalEntry.id)
+        .outerjoin(EntryAnalysisTranslation, fresh_translation(language))
+        .where(JournalEntry.id == entry_uuid)
+    ).first()
+    if version is None or version.user_id != user.id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Entry not found")
 
-    if not entry.analysis:
-        return None
+    # Covers the "not analyzed yet" state too, so polling clients mostly get 304s. The language
+    # and variant stamp change the tag when the user switches language or a translation lands.
+    etag = make_etag("analysis", entry_uuid, version.id, version.updated_at, language, version.translated_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, PRIVATE_REVALIDATE)
 
-    a = entry.analysis
-    return EntryAnalysisOut(
-        id=str(a.id),
-        entry_id=str(a.entry_id),
-        user_id=str(a.user_id),
-        language=a.language,
-        emotions=a.emotions,
-        themes=a.themes,
-        pillar_weights=a.pillar_weights,
-        pillar_scores=a.pillar_scores,
-        reflection=a.reflection,
-        recommendations=a.recommendations,
-        signals=a.signals,
-        rationale_summary=a.rationale_summary,
-        risk_flags=a.risk_flags,
-    )
+    payload = None
+    if version.id is not None:
+        # The variant in the user's language when the background job has stored one.
+        payload = get_analysis_payload(db, version.id, language if version.translated_at is not None else None)
+    out = FastJSONResponse(payload)
+    set_cache_headers(out, etag, PRIVATE_REVALIDATE)
+    return out
 
 
-@router.post("/{entry_id}/analysis/recompute", response_model=EntryAnalysisOut)
+@router.post(
+    "/{entry_id}/analysis/recompute",
+    response_model=EntryAnalysisOut,
+    dependencies=[Depends(rate_limited("analysis_recompute"))],
+)
 def recompute_entry_analysis(
     entry_id: str,
     db: Session = Depends(get_db),
@@ -2,24 +2,30 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 
+from app.api.rate_limits import check_rate_limit, rate_limited
 from app.core.database import get_db
+from app.core.http_cache import PRIVATE_REVALIDATE, etag_matches, make_etag, not_modified, set_cache_headers
 from app.core.security import get_current_user
-from app.models.entry_analysis import EntryAnalysis
-from app.models.journal_entry import JournalEntry
 from app.models.user import User
-from app.schemas.report import CurrentReportOut, TrendPoint
+from app.schemas.report import CurrentReportOut, DailyStatPoint, StatsRangeOut, TrendPoint, TrendsOut
 from app.schemas.common import Language
-from app.services.report_service import compute_weekly_report
+from app.services.report_service import (
+    get_fresh_weekly_report,
+    get_or_compute_weekly_report,
+    latest_weekly_report_id,
+)
+from app.services.stats_service import get_daily_stats, get_trend_buckets, pillar_means, summarize, stats_version
 
 router = APIRouter(prefix="/api/report", tags=["report"])
 
 
 @router.get("/current", response_model=CurrentReportOut)
 def get_current_report(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
@@ -27,37 +33,24 @@ def get_current_report(
     week_start = today - timedelta(days=6)
     week_end = today
 
-    stmt = select(JournalEntry).where(
-        JournalEntry.user_id == user.id,
-        JournalEntry.created_at >= week_start,
-        JournalEntry.created_at < week_end + timedelta(days=1),
-    ).order_by(JournalEntry.created_at)
-    entries = db.scalars(stmt).all()
+    # Any new or recomputed analysis in the window changes the rollup version, and a stored
+    # report is only ever replaced after such a change, so these two stamps version the page.
+    version = stats_version(db, user.id, week_start, week_end)
+    stored_id = latest_weekly_report_id(db, user.id, user.preferred_language, week_end)
+    etag = make_etag("report", user.preferred_language, week_end, stored_id, *version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, PRIVATE_REVALIDATE)
 
-    stmt_a = select(EntryAnalysis).where(
-        EntryAnalysis.user_id == user.id,
-        EntryAnalysis.entry_id.in_([e.id for e in entries]),
-    )
-    analyses = {a.entry_id: a for a in db.scalars(stmt_a).all()}
-
-    # Build series
+    # One rollup row per day instead of re-reading every entry and analysis of the week.
+    days = get_daily_stats(db, user.id, week_start, week_end)
     series: list[TrendPoint] = []
-    for e in entries:
-        a = analyses.get(e.id)
-        if a:
-            series.append(
-                TrendPoint(
-                    date=e.created_at.date(),
-                    geist=a.pillar_scores.get("geist", 5),
-                    herz=a.pillar_scores.get("herz", 5),
-                    seele=a.pillar_scores.get("seele", 5),
-                    koerper=a.pillar_scores.get("koerper", 5),
-                    aura=a.pillar_scores.get("aura", 5),
-                )
-            )
+    for d in days:
+        means = pillar_means(d)
+        series.append(TrendPoint(date=d.day, **{p: round(v) for p, v in means.items()}))
 
-    if not analyses:
+    if not days:
         # Fallback
+        set_cache_headers(response, etag, PRIVATE_REVALIDATE)
         return CurrentReportOut(
             language=Language(user.preferred_language),
             week_start_date=week_start,
@@ -72,7 +65,17 @@ def get_current_report(
             series=series,
         )
 
-    report = compute_weekly_report(db, user.id, user.preferred_language)
+    # Usually precomputed by the nightly job (app.tools.precompute_reports); compute lazily otherwise.
+    report = get_fresh_weekly_report(db, user.id, user.preferred_language)
+    if report is None:
+        check_rate_limit(db, user, "report_current")
+        report = get_or_compute_weekly_report(db, user.id, user.preferred_language)
+        # A fallback report (LLM failure) is not stored and must not be cached.
+        if report.created_at is not None:
+            etag = make_etag("report", user.preferred_language, week_end, report.id, *version)
+            set_cache_headers(response, etag, PRIVATE_REVALIDATE)
+    else:
+        set_cache_headers(response, etag, PRIVATE_REVALIDATE)
 
     return CurrentReportOut(
         language=Language(report.language),
@@ -89,10 +92,61 @@ def get_current_report(
     )
 
 
-@router.post("/recompute")
+@router.post("/recompute", dependencies=[Depends(rate_limited("report_recompute"))])
 def recompute_report(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    report = compute_weekly_report(db, user.id, user.preferred_language)
+    report = get_or_compute_weekly_report(db, user.id, user.preferred_language)
     return {"status": "ok", "report_id": str(report.id)}
+
+
+@router.get("/stats", response_model=StatsRangeOut)
+def get_stats(
+    days: int = Query(default=30, ge=1, le=366),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    end = date.today()
+    start = end - timedelta(days=days - 1)
+    rows = get_daily_stats(db, user.id, start, end)
+    return StatsRangeOut(
+        start_date=start,
+        end_date=end,
+        **summarize(rows),
+        days=[
+            DailyStatPoint(
+                date=r.day,
+                entry_count=r.entry_count,
+                mood_min=r.mood_min,
+                mood_avg=round(r.mood_sum / r.entry_count, 2),
+                mood_max=r.mood_max,
+                energy_min=r.energy_min,
+                energy_avg=round(r.energy_sum / r.entry_count, 2),
+                energy_max=r.energy_max,
+                **{p: round(v, 2) for p, v in pillar_means(r).items()},
+            )
+            for r in rows
+        ],
+    )
+
+
+@router.get("/trends", response_model=TrendsOut)
+def get_trends(
+    response: Response,
+    days: int = Query(default=90, ge=7, le=366),
+    points: int = Query(default=60, ge=2, le=366),
+    if_none_match: str | None = Header(default=None),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    end = date.today()
+    start = end - timedelta(days=days - 1)
+
+    # Validate the client's copy against the rollup version before doing the bucketing.
+    etag = make_etag("trends", user.id, start, days, points, *stats_version(db, user.id, start, end))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    set_cache_headers(response, etag)
+    return TrendsOut(start_date=start, end_date=end, **get_trend_buckets(db, user.id, start, end, points))
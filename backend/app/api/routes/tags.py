@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.models.user import User
+from app.schemas.journal import JournalEntryOut
+from app.schemas.tags import TagFrequenciesOut, TagFrequency, TaggedEntriesOut, TagKind
+from app.services.tag_service import entries_by_tag, tag_frequencies
+
+router = APIRouter(prefix="/api/tags", tags=["tags"])
+
+
+@router.get("", response_model=TagFrequenciesOut)
+def list_tag_frequencies(
+    kind: TagKind = "theme",
+    limit: int = Query(default=30, ge=1, le=200),
+    days: int | None = Query(default=None, ge=1, le=3660),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    since = datetime.now(timezone.utc) - timedelta(days=days) if days else None
+    rows = tag_frequencies(db, user.id, kind, limit, since)
+    return TagFrequenciesOut(
+        kind=kind,
+        tags=[TagFrequency(value=r.value, entry_count=r.entry_count, last_seen=r.last_seen) for r in rows],
+    )
+
+
+@router.get("/entries", response_model=TaggedEntriesOut)
+def list_entries_by_tag(
+    value: str = Query(min_length=1, max_length=200),
+    kind: TagKind = "theme",
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    entries, has_more = entries_by_tag(db, user.id, kind, value, limit, offset)
+    return TaggedEntriesOut(
+        kind=kind,
+        value=value,
+        limit=limit,
+        offset=offset,
+        has_more=has_more,
+        entries=[
+            JournalEntryOut(
+                id=str(e.id),
+                text=e.text,
+                mood_score=e.mood_score,
+                energy_score=e.energy_score,
+                created_at=e.created_at,
+            )
+            for e in entries
+        ],
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -8,7 +9,8 @@ from app.core.security import get_current_user
 from app.models.user import User
 from app.schemas.auth import UpdateLanguageRequest, UserOut
 from app.schemas.common import Language
-from app.services.user_service import delete_user_account, export_user_data
+from app.services.translation_service import translate_user_analyses
+from app.services.user_service import delete_user_account, iter_user_export
 
 router = APIRouter(tags=["user"])
 
@@ -21,23 +23,25 @@ def get_me(user: User = Depends(get_current_user)):
 @router.patch("/api/me", response_model=UserOut)
 def update_me(
     data: UpdateLanguageRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
+    changed = user.preferred_language != data.preferred_language.value
     user.preferred_language = data.preferred_language.value
     db.add(user)
     db.commit()
     db.refresh(user)
+    if changed:
+        # Existing analyses stay in the old language; variants are generated after the response.
+        background_tasks.add_task(translate_user_analyses, user.id, user.preferred_language)
     return UserOut(id=str(user.id), email=user.email, preferred_language=Language(user.preferred_language))
 
 
 @router.get("/api/export")
-def export_data(
-    db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
-):
-    data = export_user_data(db, user.id)
-    return data
+def export_data(user: User = Depends(get_current_user)):
+    # Streamed in batches; the compression middleware compresses it chunk by chunk.
+    return StreamingResponse(iter_user_export(user.id), media_type="application/json")
 
 
 @router.delete("/api/account", status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,180 @@
+"""gzip/brotli response compression (pure ASGI, works with streaming responses).
+
+Compared to Starlette's GZipMiddleware this adds brotli, negotiates by Accept-Encoding
+q-values, only touches compressible content types, and honours a per-route opt-out
+(`@skip_compression`) and excluded path prefixes. brotli is optional: without the
+package only gzip is offered.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+_SKIP_ATTR = "__skip_compression__"
+
+
+def skip_compression(endpoint: Callable) -> Callable:
+    """Route decorator (apply below `@router.get(...)`): never compress this endpoint's responses."""
+
+    setattr(endpoint, _SKIP_ATTR, True)
+    return endpoint
+
+
+def choose_encoding(accept_encoding: str, *, brotli_available: bool) -> str | None:
+    """Pick "br" or "gzip" from an Accept-Encoding header (q=0 excludes; ties prefer br)."""
+
+    offered = {"gzip": 0.0}
+    if brotli_available:
+        offered["br"] = 0.0
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name == "*":
+            for enc in offered:
+                offered[enc] = max(offered[enc], q)
+        elif name in offered:
+            offered[name] = q
+    best = max(offered, key=lambda enc: (offered[enc], enc == "br"))
+    return best if offered[best] > 0 else None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self._br.process(data)
+            return out + (self._br.finish() if final else self._br.flush())
+        out = self._gz.compress(data)
+        # Sync-flush intermediate chunks so streamed responses reach the client progressively.
+        return out + self._gz.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        excluded_paths: tuple[str, ...] = (),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or (self.excluded_paths and scope["path"].startswith(self.excluded_paths)):
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), brotli_available=brotli is not None
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponder(self, scope, encoding)(receive, send)
+
+
+class _CompressedResponder:
+    def __init__(self, config: CompressionMiddleware, scope: Scope, encoding: str) -> None:
+        self.config = config
+        self.scope = scope
+        self.encoding = encoding
+        self.start: Message | None = None
+        self.buffer = bytearray()
+        self.compressor: _Compressor | None = None
+        self.passthrough = False
+        self.send: Send | None = None
+
+    async def __call__(self, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.config.app(self.scope, receive, self._send)
+
+    def _eligible(self, start: Message) -> bool:
+        if start["status"] < 200 or start["status"] in (204, 304):
+            return False
+        headers = Headers(raw=start["headers"])
+        if "content-encoding" in headers:
+            return False
+        if not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES):
+            return False
+        # The router has filled in scope["endpoint"] by the time the response starts.
+        endpoint: Any = self.scope.get("endpoint")
+        return not getattr(endpoint, _SKIP_ATTR, False)
+
+    async def _send(self, message: Message) -> None:
+        assert self.send is not None
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = not self._eligible(message)
+            if self.passthrough:
+                await self.send(message)
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            # Buffer until the threshold is reached or the body ends, then decide once.
+            self.buffer += body
+            if more_body and len(self.buffer) < self.config.minimum_size:
+                return
+            if not more_body and len(self.buffer) < self.config.minimum_size:
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": bytes(self.buffer)})
+                return
+            self.compressor = _Compressor(self.encoding, self.config.gzip_level, self.config.brotli_quality)
+            chunk = self.compressor.compress(bytes(self.buffer), final=not more_body)
+            self.buffer = bytearray()
+            await self.send(self._compressed_start(None if more_body else len(chunk)))
+        else:
+            chunk = self.compressor.compress(body, final=not more_body)
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _compressed_start(self, content_length: int | None) -> Message:
+        assert self.start is not None
+        headers = MutableHeaders(raw=list(self.start["headers"]))
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        # Different bytes per encoding: a strong validator must not be shared, so weaken it.
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        if content_length is None:
+            if "content-length" in headers:
+                del headers["content-length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        return {**self.start, "headers": headers.raw}
@@ -33,6 +33,19 @@ class Settings(BaseSettings):
 
         return url
 
+    # Worker processes serving the app (gunicorn.conf.py exports the resolved count).
+    web_concurrency: int = 1
+    # Postgres max_connections shared by all workers; DB_RESERVED_CONNECTIONS are kept free
+    # for migrations, cron jobs and psql. DB_POOL_SIZE > 0 overrides the derived per-worker pool.
+    db_max_connections: int = 100
+    db_reserved_connections: int = 10
+    db_pool_size: int = 0
+    db_pool_timeout_seconds: int = 30
+    # Startup waits this long (jittered backoff) for Postgres, then requires the schema to be at
+    # the migration head of this build (migrations run separately: `python -m app.tools.migrate`).
+    db_startup_timeout_seconds: float = 30.0
+    schema_check_enabled: bool = True
+
     jwt_secret: str = "change-me"
     jwt_algorithm: str = "HS256"
     jwt_access_token_expires_minutes: int = 60 * 24 * 7
@@ -41,6 +54,58 @@ class Settings(BaseSettings):
 
     groq_api_key: str | None = None
     groq_model_name: str = "openai/gpt-oss-120b"
+    # Process-wide cap on LLM calls (0 = unlimited); batch tools can override it per run.
+    llm_requests_per_minute: int = 0
+
+    # Entries estimated above this many tokens are digested in chunks before analysis.
+    analysis_chunk_threshold_tokens: int = 2500
+    analysis_chunk_tokens: int = 1200
+    analysis_chunk_workers: int = 4
+
+    # Idempotency-Key support for POST /api/journal.
+    idempotency_ttl_hours: int = 24
+    # An in-progress key older than this is considered abandoned and may be taken over.
+    idempotency_lock_timeout_seconds: int = 300
+
+    # Similar past entries (local embeddings) added to the scores prompt; 0 disables.
+    similar_entries_k: int = 3
+    similar_entries_min_score: float = 0.3
+
+    # Per-user budgets for LLM-backed endpoints as "<requests>/<period>" (second, minute, hour,
+    # day; e.g. "30/hour" or "5/10min"); empty disables. RATE_LIMIT_GLOBAL is shared by all users.
+    # The report_current budget is only spent when the report has to be computed, and the
+    # journal_create budget not for Idempotency-Key replays.
+    # Backend "memory" limits per process; "postgres" shares fixed-window counts across workers.
+    rate_limit_enabled: bool = True
+    rate_limit_backend: str = "memory"
+    rate_limit_journal_create: str = "30/hour"
+    rate_limit_analysis_recompute: str = "20/hour"
+    rate_limit_report_current: str = "20/hour"
+    rate_limit_report_recompute: str = "10/hour"
+    rate_limit_global: str = ""
+
+    # GET /metrics is off unless enabled; with METRICS_TOKEN set, scrapers must send it as a
+    # bearer token. Without one, keep the endpoint off the public network.
+    metrics_enabled: bool = False
+    metrics_token: str = ""
+
+    # Translated analysis variants after a language change: characters of source text per
+    # LLM call, and analyses fetched per round of the background job. The translation of a
+    # batch has to fit the chat model's output limit, so larger values are capped to it.
+    translation_batch_chars: int = 3000
+    translation_job_size: int = 50
+
+    # A report stored less than this many seconds ago (and still fresh) is returned by
+    # recompute instead of making another LLM call; 0 disables.
+    report_debounce_seconds: int = 60
+
+    # Response compression (gzip, and brotli when the package is installed).
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    # Comma-separated path prefixes that are never compressed.
+    compression_excluded_paths: str = ""
 
 
 settings = Settings()  # singleton
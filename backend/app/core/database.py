@@ -7,8 +7,34 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 
+# A worker runs sync routes on AnyIO's default thread limiter (40 threads), so more
+# connections than that per worker would never be checked out at once.
+MAX_CONNECTIONS_PER_WORKER = 40
 
-engine = create_engine(settings.sqlalchemy_database_url, pool_pre_ping=True)
+
+def pool_limits(max_connections: int, reserved: int, workers: int) -> tuple[int, int]:
+    """(pool_size, max_overflow) so that `workers` pools together stay within max_connections.
+
+    Half of a worker's share is kept open, the rest is overflow that is closed when returned.
+    """
+
+    workers = max(1, workers)
+    share = max(2, (max_connections - reserved) // workers)
+    share = min(share, MAX_CONNECTIONS_PER_WORKER)
+    pool_size = max(1, share // 2)
+    return pool_size, share - pool_size
+
+
+def _engine_pool_kwargs() -> dict[str, int]:
+    pool_size, max_overflow = pool_limits(
+        settings.db_max_connections, settings.db_reserved_connections, settings.web_concurrency
+    )
+    if settings.db_pool_size > 0:
+        pool_size, max_overflow = settings.db_pool_size, 0
+    return {"pool_size": pool_size, "max_overflow": max_overflow, "pool_timeout": settings.db_pool_timeout_seconds}
+
+
+engine = create_engine(settings.sqlalchemy_database_url, pool_pre_ping=True, **_engine_pool_kwargs())
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
 
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Response
+
+# Per-user data: browsers may keep it but must revalidate before reuse.
+PRIVATE_REVALIDATE = "private, no-cache"
+# Per-user data that never changes once written (journal entries).
+PRIVATE_IMMUTABLE = "private, max-age=86400, immutable"
+
+
+def make_etag(*parts: object, weak: bool = False) -> str:
+    """ETag from the parts that identify a representation's version (row ids, version stamps)."""
+
+    digest = hashlib.blake2b("|".join(str(p) for p in parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """RFC 9110 weak comparison of an If-None-Match header against `etag`."""
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str, cache_control: str = PRIVATE_REVALIDATE) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str = PRIVATE_REVALIDATE) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
@@ -0,0 +1,51 @@
+"""Minimal in-process counters, rendered in the Prometheus text format at GET /metrics.
+
+Counters live per process: under gunicorn every worker reports its own totals (scrape each
+worker, or sum over instances/pids), and they reset when a worker is recycled.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values: dict[tuple[str, ...], int] = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, amount: int = 1, **labels: str) -> None:
+        key = tuple(labels[name] for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> int:
+        return self._values.get(tuple(labels[name] for name in self.label_names), 0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            labels = ",".join(f'{n}="{v}"' for n, v in zip(self.label_names, (*key,)))
+            lines.append(f"{self.name}{{{labels},pid=\"{os.getpid()}\"}} {value}")
+        return lines
+
+
+REGISTRY: list[Counter] = []
+
+
+def render_metrics() -> str:
+    return "\n".join(line for counter in REGISTRY for line in counter.render()) + "\n"
+
+
+rate_limit_requests = Counter(
+    "rate_limit_requests_total",
+    "Requests to rate-limited endpoints by outcome (allowed, limited).",
+    ("endpoint", "outcome"),
+)
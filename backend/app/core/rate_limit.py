@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take `tokens` if available and return 0, otherwise return the seconds to wait."""
+
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def release(self, tokens: float = 1.0) -> None:
+        """Give back `tokens` taken by `try_acquire` for work that did not happen."""
+
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+class KeyedTokenBuckets:
+    """One TokenBucket per key (e.g. user id); least recently used keys beyond `max_keys` are dropped.
+
+    A dropped key starts again with a full bucket, so `max_keys` should comfortably exceed
+    the number of users active within one refill period.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None, max_keys: int = 10_000) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = float(rate)
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[Hashable, TokenBucket] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, key: Hashable, tokens: float = 1.0) -> float:
+        """Take `tokens` from `key`'s bucket and return 0, otherwise return the seconds to wait."""
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+        return bucket.try_acquire(tokens)
+
+    def release(self, key: Hashable, tokens: float = 1.0) -> None:
+        with self._lock:
+            bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.release(tokens)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+_PERIODS = {
+    "s": 1, "sec": 1, "second": 1,
+    "m": 60, "min": 60, "minute": 60,
+    "h": 3600, "hour": 3600,
+    "d": 86400, "day": 86400,
+}
+
+
+def parse_rate(spec: str) -> tuple[int, float] | None:
+    """Parse "30/hour" into (30, 3600.0); "5/10s" and "100/day" work too. Empty or "0/..." -> None."""
+
+    spec = spec.strip().lower()
+    if not spec:
+        return None
+    count, sep, period = spec.partition("/")
+    unit = period.lstrip("0123456789.")
+    multiple = period[: len(period) - len(unit)]
+    if not sep or unit not in _PERIODS:
+        raise ValueError(f"Invalid rate {spec!r}, expected e.g. '30/hour'")
+    limit = int(count)
+    if limit <= 0:
+        return None
+    return limit, float(multiple or 1) * _PERIODS[unit]
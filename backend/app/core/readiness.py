@@ -0,0 +1,94 @@
+"""Per-process warm-up for readiness probes (/healthz).
+
+At startup a background thread opens the first pooled DB connection and imports/builds
+the LLM client, each retried with backoff until it succeeds. `/` stays a plain liveness check;
+`/healthz` only reports ready once both are done, so a new instance gets no traffic
+while it would still be paying those costs on its first requests.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from sqlalchemy import text
+
+from app.core.database import engine
+from app.core.schema import backoff_delays
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+OK = "ok"
+# No GROQ_API_KEY: analyses fall back, which must not keep the instance out of rotation.
+DISABLED = "disabled"
+ERROR = "error"
+
+_lock = threading.Lock()
+_checks: dict[str, str] = {"db": PENDING, "llm": PENDING}
+
+
+def _set(check: str, state: str) -> None:
+    with _lock:
+        _checks[check] = state
+
+
+def checks() -> dict[str, str]:
+    with _lock:
+        return dict(_checks)
+
+
+def is_ready() -> bool:
+    return all(state in (OK, DISABLED) for state in checks().values())
+
+
+def ping_db() -> bool:
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def _warm_up_db(max_delay_s: float) -> None:
+    delays = backoff_delays(max_s=max_delay_s)
+    while not ping_db():
+        delay = next(delays)
+        logger.warning("Database not reachable yet, retrying in %.2fs", delay)
+        time.sleep(delay)
+    _set("db", OK)
+
+
+def _warm_up_llm(max_delay_s: float) -> None:
+    from app.llm.client import warm_up
+
+    # Reported as ERROR while failing, but retried: a provider hiccup at boot must not keep
+    # the instance unready until it restarts.
+    delays = backoff_delays(max_s=max_delay_s)
+    while True:
+        try:
+            _set("llm", OK if warm_up() else DISABLED)
+            return
+        except Exception:  # noqa: BLE001
+            _set("llm", ERROR)
+            delay = next(delays)
+            logger.exception("LLM client warm-up failed, retrying in %.2fs", delay)
+            time.sleep(delay)
+
+
+def warm_up(*, max_delay_s: float = 10.0) -> None:
+    t0 = time.perf_counter()
+    # In parallel, so a failing LLM warm-up does not hold up the DB check (or vice versa).
+    llm = threading.Thread(target=_warm_up_llm, args=(max_delay_s,), name="warm-up-llm", daemon=True)
+    llm.start()
+    _warm_up_db(max_delay_s)
+    llm.join()
+    logger.info("Warm-up finished in %.2fs: %s", time.perf_counter() - t0, checks())
+
+
+def start_warm_up() -> threading.Thread:
+    thread = threading.Thread(target=warm_up, name="warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+# OPT_UTC_Z renders UTC datetimes with "Z" like pydantic does, so switching a route
+# between the validated and the trusted path does not change its output.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class FastJSONResponse(ORJSONResponse):
+    """Default response class (orjson).
+
+    Routes may also return it directly with a payload built from their own DB rows: a
+    returned Response bypasses FastAPI's response_model validation and re-encoding, while
+    the `response_model` on the route still documents the shape. Only do this for trusted,
+    already well-shaped data.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def dumps(content: Any) -> bytes:
+    """Encode like FastJSONResponse (for streamed bodies assembled piece by piece)."""
+
+    return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+def raw_json(text: str | None) -> orjson.Fragment | None:
+    """Embed already-serialized JSON (e.g. a JSONB column selected as text) without re-parsing it."""
+
+    return None if text is None else orjson.Fragment(text)
@@ -0,0 +1,107 @@
+"""Database reachability and schema-version checks for startup and the migrate tool.
+
+Migrations are not run when the app starts (see `app.tools.migrate`). Instead, each process
+checks once that the database is at the migration head of this build. If it is behind, the
+process refuses to start, so a deploy that skipped migrations fails loudly rather than
+serving errors.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+class SchemaOutOfDateError(RuntimeError):
+    pass
+
+
+def backoff_delays(
+    base_s: float = 0.2, max_s: float = 5.0, *, rng: Callable[[], float] = random.random
+) -> Iterator[float]:
+    """Exponential backoff with full jitter: uniform in [0, min(max_s, base_s * 2**n)]."""
+
+    n = 0
+    while True:
+        yield rng() * min(max_s, base_s * (2**n))
+        n += 1
+
+
+def wait_for_db(engine: Engine, timeout_s: float) -> None:
+    """Return once `SELECT 1` succeeds; raise the last error after `timeout_s`."""
+
+    deadline = time.monotonic() + timeout_s
+    delays = backoff_delays()
+    while True:
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return
+        except Exception as exc:  # noqa: BLE001
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise
+            delay = min(next(delays), remaining)
+            logger.warning("Database not reachable (%s), retrying in %.2fs", exc.__class__.__name__, delay)
+            time.sleep(delay)
+
+
+def script_directory():
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+
+
+def current_revision(engine: Engine) -> str | None:
+    with engine.connect() as conn:
+        has_table = conn.execute(text("SELECT to_regclass('alembic_version') IS NOT NULL")).scalar()
+        if not has_table:
+            return None
+        return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+
+def compare_revision(current: str | None, heads: set[str], known: Callable[[str], bool]) -> str:
+    """Classify the database revision as "current", or "ahead" if this build does not know it.
+
+    A revision this build does not know means a newer deploy has already migrated.
+
+    Raises SchemaOutOfDateError when the database is behind this build.
+    """
+
+    if current in heads:
+        return "current"
+    if current is None:
+        raise SchemaOutOfDateError("Database has no schema version; run `python -m app.tools.migrate`")
+    if not known(current):
+        return "ahead"
+    raise SchemaOutOfDateError(
+        f"Database schema is at {current}, this build expects {', '.join(sorted(heads))}; "
+        "run `python -m app.tools.migrate`"
+    )
+
+
+def verify_schema_version(engine: Engine, *, timeout_s: float) -> None:
+    wait_for_db(engine, timeout_s)
+    script = script_directory()
+
+    def known(rev: str) -> bool:
+        try:
+            return script.get_revision(rev) is not None
+        except Exception:  # noqa: BLE001 - alembic raises for unknown revision ids
+            return False
+
+    current = current_revision(engine)
+    status = compare_revision(current, set(script.get_heads()), known)
+    if status == "ahead":
+        logger.warning("Database schema %s is newer than this build; continuing", current)
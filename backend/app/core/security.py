@@ -34,7 +34,7 @@ def create_access_token(*, user_id: str, email: str) -> str:
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
-def _get_bearer_token(request: Request) -> str | None:
+def get_bearer_token(request: Request) -> str | None:
     auth = request.headers.get("Authorization")
     if not auth:
         return None
@@ -55,7 +55,7 @@ def get_current_user(
     db: Session = Depends(get_db),
     access_token: str | None = Cookie(default=None),
 ) -> User:
-    token = _get_bearer_token(request) or access_token
+    token = get_bearer_token(request) or access_token
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
 
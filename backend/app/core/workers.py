@@ -0,0 +1,16 @@
+"""gunicorn worker class for serving the ASGI app (see gunicorn.conf.py)."""
+
+from __future__ import annotations
+
+import os
+
+from uvicorn.workers import UvicornWorker as _UvicornWorker
+
+
+class UvicornWorker(_UvicornWorker):
+    """uvloop + httptools by default; UVICORN_LOOP / UVICORN_HTTP override ("auto", "asyncio", "h11")."""
+
+    CONFIG_KWARGS = {
+        "loop": os.environ.get("UVICORN_LOOP", "uvloop"),
+        "http": os.environ.get("UVICORN_HTTP", "httptools"),
+    }
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import math
+import re
+
+# Rough average for German/English prose on current tokenizers. We only need the
+# order of magnitude to decide between the single-pass and the chunked analysis.
+CHARS_PER_TOKEN = 4
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?…])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text or "") / CHARS_PER_TOKEN)
+
+
+def _hard_split(text: str, max_chars: int) -> list[str]:
+    return [text[i : i + max_chars] for i in range(0, len(text), max_chars)]
+
+
+def _pieces(text: str, max_chars: int) -> list[str]:
+    """Break text into paragraph, then sentence, then fixed-size pieces no longer than max_chars."""
+
+    out: list[str] = []
+    for paragraph in _PARAGRAPH_RE.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            out.append(paragraph)
+            continue
+        for sentence in _SENTENCE_RE.split(paragraph):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if len(sentence) <= max_chars:
+                out.append(sentence)
+            else:
+                out.extend(_hard_split(sentence, max_chars))
+    return out
+
+
+def split_into_chunks(text: str, max_tokens: int) -> list[str]:
+    """Greedily pack paragraphs/sentences into chunks of at most `max_tokens` (estimated)."""
+
+    max_chars = max(1, max_tokens * CHARS_PER_TOKEN)
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for piece in _pieces(text or "", max_chars):
+        extra = len(piece) + (2 if current else 0)
+        if current and size + extra > max_chars:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+            extra = len(piece)
+        current.append(piece)
+        size += extra
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
@@ -1,17 +1,95 @@
 from __future__ import annotations
 
-from langchain_groq import ChatGroq
+import threading
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
+from app.core.rate_limit import TokenBucket
 
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+    from langchain_groq import ChatGroq
 
-def get_chat() -> ChatGroq:
+# langchain/Groq are imported on first use (get_chat / chat_messages), not when the app
+# is imported: routes that never call the LLM should not pay ~0.5s of imports at cold start.
+
+# Completion budget of every chat call; callers that batch work must fit their reply into it.
+MAX_OUTPUT_TOKENS = 1200
+
+_limiter_lock = threading.Lock()
+_limiter: TokenBucket | None = None
+_limiter_rpm: int | None = None
+
+_stats_lock = threading.Lock()
+_llm_calls = 0
+
+
+class RateLimitedChat:
+    """Wraps a chat model so every `invoke` waits for the process-wide LLM budget and is counted."""
+
+    def __init__(self, chat: ChatGroq, limiter: TokenBucket | None) -> None:
+        self._chat = chat
+        self._limiter = limiter
+
+    def invoke(self, *args, **kwargs):
+        global _llm_calls
+        if self._limiter is not None:
+            self._limiter.acquire()
+        with _stats_lock:
+            _llm_calls += 1
+        return self._chat.invoke(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._chat, name)
+
+
+def set_llm_rate_limit(requests_per_minute: int) -> None:
+    """Override LLM_REQUESTS_PER_MINUTE for this process (0 disables the limit)."""
+
+    global _limiter, _limiter_rpm
+    with _limiter_lock:
+        _limiter_rpm = requests_per_minute
+        _limiter = TokenBucket(requests_per_minute / 60.0) if requests_per_minute > 0 else None
+
+
+def _get_limiter() -> TokenBucket | None:
+    if _limiter_rpm is None:
+        set_llm_rate_limit(settings.llm_requests_per_minute)
+    return _limiter
+
+
+def llm_call_count() -> int:
+    return _llm_calls
+
+
+def chat_messages(system: str, user: str) -> list[BaseMessage]:
+    """[system, human] message list for `RateLimitedChat.invoke`."""
+
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    return [SystemMessage(content=system), HumanMessage(content=user)]
+
+
+def get_chat() -> RateLimitedChat:
     if not settings.groq_api_key:
         raise RuntimeError("GROQ_API_KEY is not set")
 
-    return ChatGroq(
+    from langchain_groq import ChatGroq
+
+    chat = ChatGroq(
         api_key=settings.groq_api_key,
         model=settings.groq_model_name,
         temperature=0.2,
-        max_tokens=1200,
+        max_tokens=MAX_OUTPUT_TOKENS,
     )
+    return RateLimitedChat(chat, _get_limiter())
+
+
+def warm_up() -> bool:
+    """Import the LLM stack and build a client (no request is sent); False without an API key."""
+
+    chat_messages("", "")
+    if not settings.groq_api_key:
+        return False
+    get_chat()
+    return True
@@ -0,0 +1,106 @@
+"""Local, network-free text embeddings for "similar past entries" retrieval.
+
+Tokens (word unigrams, prefixes and bigrams) are feature-hashed into a fixed number of buckets
+with a sign bit, weighted sublinearly, and mapped to `DIM` dimensions by a fixed random
+±1 projection (Johnson-Lindenstrauss). Nothing is fitted on the corpus, so a stored
+vector never goes stale as a user writes more entries. Vectors are L2-normalized and
+stored as int8 (`DIM` bytes per entry); cosine similarity is scale-invariant, so search
+works on the quantized values directly.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+# Bump when the tokenizer, hashing or projection changes; vectors of other versions are ignored.
+EMBEDDING_VERSION = 1
+DIM = 256
+N_BUCKETS = 1 << 16
+_PROJECTION_SEED = 1405
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+_STOPWORDS = frozenset(
+    """
+    der die das den dem des ein eine einer eines einem einen und oder aber auch nicht noch nur
+    ich du er sie es wir ihr mich mir dich dir sich uns euch mein meine dein deine sein seine
+    ist bin bist sind war waren hat habe hast haben hatte wird werde wurde mit von zu zum zur im in
+    am an auf aus bei für fur um so wie was wenn dass als da dann heute sehr mal schon ja nein
+    the a an and or but not no yes i you he she it we they me my your his her its our their
+    is am are was were be been have has had do did to of in on at for with as so if that this
+    then than today very just really
+    """.split()
+)
+
+
+def _tokens(text: str) -> list[str]:
+    words = [w for w in _WORD_RE.findall(text.lower()) if len(w) > 1 and w not in _STOPWORDS and not w.isdigit()]
+    # 5-letter prefixes act as a crude stemmer for German/English inflections.
+    prefixes = [f"{w[:5]}~" for w in words if len(w) > 5]
+    return words + prefixes + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+@lru_cache(maxsize=1)
+def _projection() -> np.ndarray:
+    rng = np.random.default_rng(_PROJECTION_SEED)
+    return (rng.integers(0, 2, size=(N_BUCKETS, DIM), dtype=np.int8) * 2 - 1).astype(np.int8)
+
+
+def embed(text: str) -> np.ndarray:
+    """Unit-length float32 vector of shape (DIM,); all zeros for text without content words."""
+
+    counts: dict[int, float] = {}
+    for tok in _tokens(text):
+        # crc32 rather than hash(): it must be stable across processes.
+        h = zlib.crc32(tok.encode("utf-8"))
+        bucket = h % N_BUCKETS
+        counts[bucket] = counts.get(bucket, 0.0) + (1.0 if h & 0x80000000 else -1.0)
+    if not counts:
+        return np.zeros(DIM, dtype=np.float32)
+
+    idx = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    raw = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+    # Sublinear term frequency so one repeated word does not dominate a long entry.
+    weights = np.sign(raw) * np.log1p(np.abs(raw))
+    vec = weights @ _projection()[idx].astype(np.float32)
+    norm = float(np.linalg.norm(vec))
+    return (vec / norm).astype(np.float32) if norm > 0 else np.zeros(DIM, dtype=np.float32)
+
+
+def quantize(vec: np.ndarray) -> bytes:
+    peak = float(np.max(np.abs(vec))) if vec.size else 0.0
+    if peak == 0.0 or math.isnan(peak):
+        return bytes(DIM)
+    return np.round(vec * (127.0 / peak)).astype(np.int8).tobytes()
+
+
+def stack(blobs: list[bytes]) -> np.ndarray:
+    """Stored vectors as one (n, DIM) int8 matrix."""
+
+    if not blobs:
+        return np.zeros((0, DIM), dtype=np.int8)
+    return np.frombuffer(b"".join(blobs), dtype=np.int8).reshape(len(blobs), DIM)
+
+
+def top_k(matrix: np.ndarray, query: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Brute-force cosine top-k over an (n, DIM) int8 matrix: (row indices, scores), best first."""
+
+    n = matrix.shape[0]
+    if n == 0 or k <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+    m = matrix.astype(np.float32)
+    norms = np.sqrt(np.einsum("ij,ij->i", m, m))  # ~3x faster than np.linalg.norm(axis=1)
+    norms[norms == 0] = 1.0
+    q_norm = float(np.linalg.norm(query)) or 1.0
+    scores = (m @ query.astype(np.float32)) / (norms * q_norm)
+
+    k = min(k, n)
+    idx = np.argpartition(-scores, k - 1)[:k] if k < n else np.arange(n)
+    idx = idx[np.argsort(-scores[idx], kind="stable")]
+    return idx, scores[idx]
@@ -52,6 +52,21 @@ The JSON MUST include ALL of these top-level keys:
 If any key is missing, add it with reasonable defaults.
 """.strip()
 
+ENTRY_CHUNK_JSON_FIX_SYSTEM = """
+You are a strict JSON repair tool.
+You will be given text that SHOULD describe the condensed summary of one part of a long journal entry.
+
+Return ONLY a valid JSON object. No markdown. No explanation. No code fences.
+
+The JSON MUST include ALL of these top-level keys:
+- summary (string, max 600 chars)
+- emotions (list of objects with keys: name (string), intensity (number 0..1))
+- themes (list of strings, up to 6)
+- signals (object with keys keywords, phrases, triggers; each is a list of strings)
+
+If any key is missing, add it with reasonable defaults.
+""".strip()
+
 WEEKLY_REPORT_JSON_FIX_SYSTEM = """
 You are a strict JSON repair tool.
 You will be given text that SHOULD describe a Weekly Report JSON object.
@@ -2,42 +2,129 @@ from __future__ import annotations
 
 import json
 import re
-from typing import TypeVar
+from collections.abc import Iterator
+from typing import Any, TypeVar
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, ValidationError
 
-from app.llm.client import get_chat
+from app.llm.client import chat_messages, get_chat
 from app.llm.prompts import JSON_FIX_SYSTEM
 
 T = TypeVar("T", bound=BaseModel)
 
 
-_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+# Characters that matter to the scanner; everything between them is skipped by the regex engine.
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+
+
+def _span_end(text: str, start: int) -> int | None:
+    """End (exclusive) of the balanced `{...}` that opens at `text[start]`, or None if unclosed.
+
+    One pass, string-aware: braces inside JSON strings (including after escaped quotes) do
+    not count.
+    """
+
+    depth = 0
+    in_string = False
+    escaped_at = -1
+    for m in _JSON_TOKEN_RE.finditer(text, start):
+        ch, i = m.group(), m.start()
+        if in_string:
+            if i == escaped_at:
+                continue
+            if ch == "\\":
+                escaped_at = i + 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return None
+
+
+_decoder = json.JSONDecoder()
+
+
+def _json_candidates(text: str) -> Iterator[tuple[str, Any]]:
+    """(json_text, parsed) for each top-level `{...}` in `text`, in order; parsed is None if it does not parse.
+
+    Only top-level candidates are produced: braces nested in a candidate that does not parse
+    are skipped, so a truncated reply never yields one of its inner objects (e.g. just the
+    "recommendations" of a narrative). Stops at an unclosed brace, e.g. a reply cut off.
+    """
+
+    pos = text.find("{")
+    while pos != -1:
+        try:
+            # The decoder is string-aware and stops at the end of the object: trailing prose is never read.
+            data, end = _decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            end = _span_end(text, pos)
+            if end is None:
+                return
+            data = None
+        yield text[pos:end], data
+        pos = text.find("{", end)
+
+
+def _find_json_object(text: str) -> tuple[str, Any]:
+    """(json_text, parsed) of the first top-level object in `text` that parses.
+
+    If nothing parses, returns the longest candidate with `None`: an error (and the repair
+    prompt) is then about the most complete object. Raises ValueError if there is no
+    complete candidate.
+    """
+
+    longest: str | None = None
+    for json_text, data in _json_candidates(text.strip()):
+        if data is not None:
+            return json_text, data
+        if longest is None or len(json_text) > len(longest):
+            longest = json_text
+    if longest is None:
+        raise ValueError("No complete JSON object found")
+    return longest, None
 
 
 def extract_json_object(text: str) -> str:
-    text = text.strip()
-    if text.startswith("{") and text.endswith("}"):
-        return text
-    m = _JSON_RE.search(text)
-    if not m:
-        raise ValueError("No JSON object found")
-    return m.group(0)
+    """The first JSON object in a model reply, without the prose or code fences around it."""
+
+    return _find_json_object(text)[0]
 
 
 def parse_and_validate(model: type[T], raw_text: str) -> T:
-    json_text = extract_json_object(raw_text)
-    data = json.loads(json_text)
-    return model.model_validate(data)
+    """Validate the first top-level object in `raw_text` that has any of `model`'s fields.
+
+    Models whose fields all have defaults would accept any object, so objects with none of
+    their fields (a fragment, an example in the prose) are skipped rather than validated.
+    """
+
+    fields = model.model_fields.keys()
+    longest_broken: str | None = None
+    skipped = False
+    for json_text, data in _json_candidates(raw_text.strip()):
+        if data is None:
+            if longest_broken is None or len(json_text) > len(longest_broken):
+                longest_broken = json_text
+        elif data.keys() & fields:
+            return model.model_validate(data)
+        else:
+            skipped = True
+    if longest_broken is not None:
+        json.loads(longest_broken)  # raises the JSONDecodeError for the repair loop
+    if skipped:
+        raise ValueError(f"No JSON object has any of the {model.__name__} fields")
+    raise ValueError("No complete JSON object found")
 
 
 def repair_json(raw_text: str, *, system_prompt: str = JSON_FIX_SYSTEM) -> str:
     chat = get_chat()
-    resp = chat.invoke([
-        SystemMessage(content=system_prompt),
-        HumanMessage(content=raw_text),
-    ])
+    resp = chat.invoke(chat_messages(system_prompt, raw_text))
     return str(resp.content)
 
 
@@ -68,6 +68,25 @@ JSON skeleton (fill values, keep keys exactly):
 }}
 """.strip()
 
+ENTRY_CHUNK_USER_TEMPLATE = """
+User language: {language}
+
+This is part {index} of {total} of one long journal entry.
+
+Entry part:
+{chunk_text}
+
+Task:
+Condense this part for a later analysis of the whole entry. Keep what matters emotionally:
+events, feelings, needs, body signals, and anything that sounds like risk.
+
+Return STRICT JSON with fields:
+- summary: str (<=600 chars, in the user's language, neutral and descriptive)
+- emotions: list of {{name, intensity(0..1)}}
+- themes: list[str] (<=6)
+- signals: {{keywords:[<=8], phrases:[<=5], triggers:[<=5]}}
+""".strip()
+
 WEEKLY_REPORT_SYSTEM = """
 You are Lebensschule-KI. You MUST output valid JSON matching the requested schema exactly.
 No markdown. No code fences. No extra keys.
@@ -1,15 +1,39 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
-from app.api.routes import auth, journal, report, user
+from app.api.routes import auth, health, journal, metrics, report, tags, user
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.database import engine
 from app.core.logging import configure_logging
+from app.core.readiness import start_warm_up
+from app.core.responses import FastJSONResponse
+from app.core.schema import verify_schema_version
 
 configure_logging()
 
-app = FastAPI(title="Lebensschule API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Runs per worker (after the fork under gunicorn). A schema behind this build aborts startup;
+    # /healthz turns ready once warm-up is done.
+    if settings.schema_check_enabled:
+        await run_in_threadpool(verify_schema_version, engine, timeout_s=settings.db_startup_timeout_seconds)
+    start_warm_up()
+    yield
+
+
+app = FastAPI(
+    title="Lebensschule API",
+    version="0.1.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -18,10 +42,21 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+        excluded_paths=tuple(p for p in settings.compression_excluded_paths.split(",") if p),
+    )
 
+app.include_router(health.router)
 app.include_router(auth.router)
 app.include_router(journal.router)
+app.include_router(metrics.router)
 app.include_router(report.router)
+app.include_router(tags.router)
 app.include_router(user.router)
 
 
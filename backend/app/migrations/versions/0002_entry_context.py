@@ -0,0 +1,46 @@
+"""entry context snapshots
+
+Revision ID: 0002_entry_context
+Revises: 0001_init
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0002_entry_context"
+down_revision = "0001_init"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves "latest N entries for a user" without sorting all of the user's rows.
+    op.create_index(
+        "ix_journal_entries_user_id_created_at",
+        "journal_entries",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+    op.create_table(
+        "user_context_snapshots",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("entry_ids", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("context", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_context_snapshots")
+    op.drop_index("ix_journal_entries_user_id_created_at", table_name="journal_entries")
@@ -0,0 +1,42 @@
+"""user memory
+
+Revision ID: 0003_user_memory
+Revises: 0002_entry_context
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0003_user_memory"
+down_revision = "0002_entry_context"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rows are built lazily from a user's analysis history on their next new entry.
+    op.create_table(
+        "user_memory",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("analysis_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("mood_avg", sa.Float(), nullable=False),
+        sa.Column("energy_avg", sa.Float(), nullable=False),
+        sa.Column("pillar_avgs", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("themes", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("triggers", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_memory")
@@ -0,0 +1,71 @@
+"""daily user stats rollup
+
+Revision ID: 0005_daily_user_stats
+Revises: 0004_idempotency_keys
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0005_daily_user_stats"
+down_revision = "0004_idempotency_keys"
+branch_labels = None
+depends_on = None
+
+PILLARS = ("geist", "herz", "seele", "koerper", "aura")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "daily_user_stats",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.Column("mood_min", sa.SmallInteger(), nullable=False),
+        sa.Column("mood_max", sa.SmallInteger(), nullable=False),
+        sa.Column("mood_sum", sa.Integer(), nullable=False),
+        sa.Column("energy_min", sa.SmallInteger(), nullable=False),
+        sa.Column("energy_max", sa.SmallInteger(), nullable=False),
+        sa.Column("energy_sum", sa.Integer(), nullable=False),
+        sa.Column("geist_sum", sa.Integer(), nullable=False),
+        sa.Column("herz_sum", sa.Integer(), nullable=False),
+        sa.Column("seele_sum", sa.Integer(), nullable=False),
+        sa.Column("koerper_sum", sa.Integer(), nullable=False),
+        sa.Column("aura_sum", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.PrimaryKeyConstraint("user_id", "day"),
+    )
+
+    # Backfill from existing analyses. Scores are read like 0006 reads them into the typed
+    # columns (numeric strings such as "7.0" are accepted, a missing pillar counts as 5), so
+    # the daily sums agree with entry_analysis.<pillar>_score.
+    pillar_sums = ",\n            ".join(
+        f"sum(COALESCE((ea.pillar_scores->>'{p}')::numeric::smallint, 5))" for p in PILLARS
+    )
+    op.execute(
+        f"""
+        INSERT INTO daily_user_stats (
+            user_id, day, entry_count,
+            mood_min, mood_max, mood_sum, energy_min, energy_max, energy_sum,
+            geist_sum, herz_sum, seele_sum, koerper_sum, aura_sum
+        )
+        SELECT
+            je.user_id,
+            date(je.created_at),
+            count(*),
+            min(je.mood_score), max(je.mood_score), sum(je.mood_score),
+            min(je.energy_score), max(je.energy_score), sum(je.energy_score),
+            {pillar_sums}
+        FROM journal_entries je
+        JOIN entry_analysis ea ON ea.entry_id = je.id
+        GROUP BY je.user_id, date(je.created_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("daily_user_stats")
@@ -0,0 +1,50 @@
+"""typed pillar columns on entry_analysis
+
+Revision ID: 0006_typed_pillar_columns
+Revises: 0005_daily_user_stats
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0006_typed_pillar_columns"
+down_revision = "0005_daily_user_stats"
+branch_labels = None
+depends_on = None
+
+PILLARS = ("geist", "herz", "seele", "koerper", "aura")
+
+
+def upgrade() -> None:
+    for p in PILLARS:
+        op.add_column("entry_analysis", sa.Column(f"{p}_score", sa.SmallInteger(), nullable=True))
+        op.add_column("entry_analysis", sa.Column(f"{p}_weight", sa.REAL(), nullable=True))
+
+    # Backfill from the JSONB blobs (defaults match the app's fallback analysis).
+    assignments = ",\n            ".join(
+        [f"{p}_score = COALESCE((pillar_scores->>'{p}')::numeric::smallint, 5)" for p in PILLARS]
+        + [f"{p}_weight = COALESCE((pillar_weights->>'{p}')::real, 0.2)" for p in PILLARS]
+    )
+    op.execute(f"UPDATE entry_analysis SET\n            {assignments}")
+
+    for p in PILLARS:
+        op.alter_column("entry_analysis", f"{p}_score", nullable=False)
+        op.alter_column("entry_analysis", f"{p}_weight", nullable=False)
+
+    op.create_index(
+        "ix_entry_analysis_user_id_created_at_scores",
+        "entry_analysis",
+        ["user_id", "created_at"],
+        unique=False,
+        postgresql_include=[f"{p}_score" for p in PILLARS],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entry_analysis_user_id_created_at_scores", table_name="entry_analysis")
+    for p in PILLARS:
+        op.drop_column("entry_analysis", f"{p}_weight")
+        op.drop_column("entry_analysis", f"{p}_score")
@@ -0,0 +1,61 @@
+"""journal entry language and full-text search vector
+
+Revision ID: 0007_entry_search
+Revises: 0006_typed_pillar_columns
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0007_entry_search"
+down_revision = "0006_typed_pillar_columns"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "to_tsvector(CASE WHEN language = 'en' THEN 'english'::regconfig ELSE 'german'::regconfig END, text)"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "journal_entries",
+        sa.Column("language", sa.String(length=2), nullable=False, server_default="de"),
+    )
+    # Best guess for existing entries: the analysis language, else the user's preference.
+    op.execute(
+        """
+        UPDATE journal_entries e
+        SET language = COALESCE(
+            (SELECT a.language FROM entry_analysis a WHERE a.entry_id = e.id),
+            (SELECT u.preferred_language FROM users u WHERE u.id = e.user_id),
+            'de'
+        )
+        """
+    )
+
+    # Stored generated column: rewrites the table once, then stays in sync on every write.
+    op.add_column(
+        "journal_entries",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        ),
+    )
+    op.create_index(
+        "ix_journal_entries_search_vector",
+        "journal_entries",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_journal_entries_search_vector", table_name="journal_entries")
+    op.drop_column("journal_entries", "search_vector")
+    op.drop_column("journal_entries", "language")
@@ -0,0 +1,67 @@
+"""entry_tags inverted index of analysis themes and signals
+
+Revision ID: 0008_entry_tags
+Revises: 0007_entry_search
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0008_entry_tags"
+down_revision = "0007_entry_search"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entry_tags",
+        sa.Column("entry_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("journal_entries.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("kind", sa.String(length=16), primary_key=True),
+        sa.Column("value_norm", sa.String(length=200), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_entry_tags_user_kind_value_created_at",
+        "entry_tags",
+        ["user_id", "kind", "value_norm", "created_at"],
+        postgresql_include=["entry_id", "value"],
+    )
+
+    # Backfill from existing analyses; normalization matches tag_service.normalize_tag.
+    op.execute(
+        r"""
+        INSERT INTO entry_tags (entry_id, kind, value_norm, user_id, value, created_at)
+        SELECT DISTINCT ON (t.entry_id, t.kind, t.value_norm)
+            t.entry_id, t.kind, t.value_norm, t.user_id, t.value, t.created_at
+        FROM (
+            SELECT a.entry_id, a.user_id, e.created_at, src.kind, btrim(src.value) AS value,
+                   left(lower(regexp_replace(btrim(src.value), '\s+', ' ', 'g')), 200) AS value_norm
+            FROM entry_analysis a
+            JOIN journal_entries e ON e.id = a.entry_id
+            CROSS JOIN LATERAL (
+                SELECT 'theme' AS kind, v AS value FROM jsonb_array_elements_text(
+                    CASE WHEN jsonb_typeof(a.themes) = 'array' THEN a.themes ELSE '[]'::jsonb END) AS v
+                UNION ALL
+                SELECT 'keyword', v FROM jsonb_array_elements_text(COALESCE(a.signals->'keywords', '[]'::jsonb)) AS v
+                UNION ALL
+                SELECT 'phrase', v FROM jsonb_array_elements_text(COALESCE(a.signals->'phrases', '[]'::jsonb)) AS v
+                UNION ALL
+                SELECT 'trigger', v FROM jsonb_array_elements_text(COALESCE(a.signals->'triggers', '[]'::jsonb)) AS v
+            ) src
+        ) t
+        WHERE t.value_norm <> ''
+        ORDER BY t.entry_id, t.kind, t.value_norm
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entry_tags_user_kind_value_created_at", table_name="entry_tags")
+    op.drop_table("entry_tags")
@@ -0,0 +1,41 @@
+"""entry_embeddings for similar-entry retrieval
+
+Revision ID: 0009_entry_embeddings
+Revises: 0008_entry_tags
+Create Date: 2026-10-19
+
+Vectors are computed in Python; fill them for existing entries with
+`python -m app.tools.embed_entries`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0009_entry_embeddings"
+down_revision = "0008_entry_tags"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entry_embeddings",
+        sa.Column(
+            "entry_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("journal_entries.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("version", sa.SmallInteger(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+    op.create_index("ix_entry_embeddings_user_id", "entry_embeddings", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entry_embeddings_user_id", table_name="entry_embeddings")
+    op.drop_table("entry_embeddings")
@@ -0,0 +1,29 @@
+"""entry_analysis.updated_at
+
+Revision ID: 0010_entry_analysis_updated_at
+Revises: 0009_entry_embeddings
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0010_entry_analysis_updated_at"
+down_revision = "0009_entry_embeddings"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "entry_analysis",
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True, server_default=sa.text("now()")),
+    )
+    op.execute("UPDATE entry_analysis SET updated_at = created_at")
+    op.alter_column("entry_analysis", "updated_at", nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_column("entry_analysis", "updated_at")
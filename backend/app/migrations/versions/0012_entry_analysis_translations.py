@@ -0,0 +1,50 @@
+"""entry_analysis_translations
+
+Revision ID: 0012_entry_analysis_translations
+Revises: 0011_rate_limit_counters
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0012_entry_analysis_translations"
+down_revision = "0011_rate_limit_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entry_analysis_translations",
+        sa.Column(
+            "analysis_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("entry_analysis.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("language", sa.String(length=2), primary_key=True),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("source_updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("emotions", postgresql.JSONB(), nullable=False),
+        sa.Column("themes", postgresql.JSONB(), nullable=False),
+        sa.Column("reflection", sa.Text(), nullable=False),
+        sa.Column("recommendations", postgresql.JSONB(), nullable=False),
+        sa.Column("signals", postgresql.JSONB(), nullable=False),
+        sa.Column("rationale_summary", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+    op.create_index("ix_entry_analysis_translations_user_id", "entry_analysis_translations", ["user_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_entry_analysis_translations_user_id", table_name="entry_analysis_translations")
+    op.drop_table("entry_analysis_translations")
@@ -0,0 +1,40 @@
+"""composite (user_id, search_vector) GIN index for per-user search
+
+Revision ID: 0013_entry_search_user_index
+Revises: 0012_entry_analysis_translations
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0013_entry_search_user_index"
+down_revision = "0012_entry_analysis_translations"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Search always filters by user. With search_vector alone, a common word matches rows of
+    # every user in the index and they are discarded afterwards; btree_gin lets the user_id
+    # equality be part of the same GIN scan. The extension is trusted (PG 13+), so the
+    # database owner can create it.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.create_index(
+        "ix_journal_entries_user_id_search_vector",
+        "journal_entries",
+        ["user_id", "search_vector"],
+        postgresql_using="gin",
+    )
+    op.drop_index("ix_journal_entries_search_vector", table_name="journal_entries")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_journal_entries_search_vector",
+        "journal_entries",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.drop_index("ix_journal_entries_user_id_search_vector", table_name="journal_entries")
@@ -0,0 +1,38 @@
+"""drop user_context_snapshots
+
+Revision ID: 0014_drop_context_snapshots
+Revises: 0013_entry_search_user_index
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0014_drop_context_snapshots"
+down_revision = "0013_entry_search_user_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The rolling user memory (0003) replaced the last-entries snapshot in the prompts.
+    op.drop_table("user_context_snapshots")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "user_context_snapshots",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("entry_ids", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("context", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
@@ -0,0 +1,48 @@
+"""rebuild daily_user_stats from the typed pillar score columns
+
+Revision ID: 0015_rebuild_daily_user_stats
+Revises: 0014_drop_context_snapshots
+Create Date: 2026-10-19
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0015_rebuild_daily_user_stats"
+down_revision = "0014_drop_context_snapshots"
+branch_labels = None
+depends_on = None
+
+PILLARS = ("geist", "herz", "seele", "koerper", "aura")
+
+
+def upgrade() -> None:
+    # Databases that ran the original 0005 backfill skipped pillars missing from the JSONB,
+    # while 0006 stored them as 5. Recompute every day from the typed columns, as the app does.
+    pillar_sums = ", ".join(f"sum(ea.{p}_score)" for p in PILLARS)
+    op.execute("DELETE FROM daily_user_stats")
+    op.execute(
+        f"""
+        INSERT INTO daily_user_stats (
+            user_id, day, entry_count,
+            mood_min, mood_max, mood_sum, energy_min, energy_max, energy_sum,
+            geist_sum, herz_sum, seele_sum, koerper_sum, aura_sum
+        )
+        SELECT
+            je.user_id,
+            date(je.created_at),
+            count(*),
+            min(je.mood_score), max(je.mood_score), sum(je.mood_score),
+            min(je.energy_score), max(je.energy_score), sum(je.energy_score),
+            {pillar_sums}
+        FROM journal_entries je
+        JOIN entry_analysis ea ON ea.entry_id = je.id
+        GROUP BY je.user_id, date(je.created_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    # The rebuilt rows are valid for the previous revision too.
+    pass
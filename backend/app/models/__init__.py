@@ -1,7 +1,27 @@
 from app.models.base import Base
+from app.models.daily_user_stats import DailyUserStats
 from app.models.entry_analysis import EntryAnalysis
+from app.models.entry_analysis_translation import EntryAnalysisTranslation
+from app.models.entry_embedding import EntryEmbedding
+from app.models.entry_tag import EntryTag
+from app.models.idempotency_key import IdempotencyKey
 from app.models.journal_entry import JournalEntry
+from app.models.rate_limit_counter import RateLimitCounter
 from app.models.user import User
+from app.models.user_memory import UserMemory
 from app.models.weekly_report import WeeklyReport
 
-__all__ = ["Base", "User", "JournalEntry", "EntryAnalysis", "WeeklyReport"]
+__all__ = [
+    "Base",
+    "User",
+    "JournalEntry",
+    "EntryAnalysis",
+    "WeeklyReport",
+    "UserMemory",
+    "IdempotencyKey",
+    "DailyUserStats",
+    "EntryTag",
+    "EntryEmbedding",
+    "RateLimitCounter",
+    "EntryAnalysisTranslation",
+]
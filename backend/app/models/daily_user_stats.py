@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+import uuid
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, SmallInteger, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class DailyUserStats(Base):
+    """Per-user, per-day rollup of entries and their analyses (one row per calendar day).
+
+    Sums are stored instead of means so rows can be combined into any range exactly.
+    """
+
+    __tablename__ = "daily_user_stats"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    entry_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    mood_min: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    mood_max: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    mood_sum: Mapped[int] = mapped_column(Integer, nullable=False)
+    energy_min: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    energy_max: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    energy_sum: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    geist_sum: Mapped[int] = mapped_column(Integer, nullable=False)
+    herz_sum: Mapped[int] = mapped_column(Integer, nullable=False)
+    seele_sum: Mapped[int] = mapped_column(Integer, nullable=False)
+    koerper_sum: Mapped[int] = mapped_column(Integer, nullable=False)
+    aura_sum: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import REAL, DateTime, ForeignKey, Index, SmallInteger, String, Text, func
 from sqlalchemy import Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -14,6 +14,14 @@ from app.models.base import Base
 
 class EntryAnalysis(Base):
     __tablename__ = "entry_analysis"
+    __table_args__ = (
+        Index(
+            "ix_entry_analysis_user_id_created_at_scores",
+            "user_id",
+            "created_at",
+            postgresql_include=["geist_score", "herz_score", "seele_score", "koerper_score", "aura_score"],
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -29,6 +37,18 @@ class EntryAnalysis(Base):
     pillar_weights: Mapped[dict] = mapped_column(JSONB, nullable=False)
     pillar_scores: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
+    # Typed copies of pillar_scores/pillar_weights for SQL aggregates and covering indexes.
+    geist_score: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    herz_score: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    seele_score: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    koerper_score: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    aura_score: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    geist_weight: Mapped[float] = mapped_column(REAL, nullable=False)
+    herz_weight: Mapped[float] = mapped_column(REAL, nullable=False)
+    seele_weight: Mapped[float] = mapped_column(REAL, nullable=False)
+    koerper_weight: Mapped[float] = mapped_column(REAL, nullable=False)
+    aura_weight: Mapped[float] = mapped_column(REAL, nullable=False)
+
     reflection: Mapped[str] = mapped_column(Text, nullable=False)
     recommendations: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
@@ -37,6 +57,10 @@ class EntryAnalysis(Base):
     risk_flags: Mapped[dict] = mapped_column(JSONB, nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Bumped whenever the analysis is replaced (recompute, bulk re-analysis); part of its ETag.
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
 
     user = relationship("User", back_populates="entry_analyses")
     entry = relationship("JournalEntry", back_populates="analysis")
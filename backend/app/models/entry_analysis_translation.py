@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import datetime
+import uuid
+
+from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.models.base import Base
+
+
+class EntryAnalysisTranslation(Base):
+    """An analysis' user-facing text in another language (scores, weights and flags are not copied).
+
+    Written by the background translation job after a language change; only served while
+    `source_updated_at` still matches the analysis' `updated_at`.
+    """
+
+    __tablename__ = "entry_analysis_translations"
+
+    analysis_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("entry_analysis.id", ondelete="CASCADE"), primary_key=True
+    )
+    language: Mapped[str] = mapped_column(String(2), primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False)
+    source_updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    emotions: Mapped[list] = mapped_column(JSONB, nullable=False)
+    themes: Mapped[list] = mapped_column(JSONB, nullable=False)
+    reflection: Mapped[str] = mapped_column(Text, nullable=False)
+    recommendations: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    signals: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    rationale_summary: Mapped[str] = mapped_column(Text, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from datetime import datetime
+import uuid
+
+from sqlalchemy import DateTime, ForeignKey, LargeBinary, SmallInteger, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class EntryEmbedding(Base):
+    """Quantized local embedding of a journal entry (see app.llm.embeddings)."""
+
+    __tablename__ = "entry_embeddings"
+
+    entry_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("journal_entries.id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False)
+    version: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    # int8[DIM] as raw bytes
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
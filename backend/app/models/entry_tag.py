@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import datetime
+import uuid
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class EntryTag(Base):
+    """Inverted index of analysis themes and signals: one row per (entry, kind, normalized value).
+
+    Derived from `entry_analysis.themes`/`signals` and rewritten whenever an analysis is.
+    """
+
+    __tablename__ = "entry_tags"
+    __table_args__ = (
+        # Serves both tag frequencies and entries-by-tag (newest first) as index-only scans.
+        Index(
+            "ix_entry_tags_user_kind_value_created_at",
+            "user_id",
+            "kind",
+            "value_norm",
+            "created_at",
+            postgresql_include=["entry_id", "value"],
+        ),
+    )
+
+    entry_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("journal_entries.id", ondelete="CASCADE"), primary_key=True
+    )
+    kind: Mapped[str] = mapped_column(String(16), primary_key=True)  # theme | keyword | phrase | trigger
+    value_norm: Mapped[str] = mapped_column(String(200), primary_key=True)
+
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    value: Mapped[str] = mapped_column(Text, nullable=False)
+    # Copy of the entry's created_at so entries-by-tag can be ordered from the index alone.
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
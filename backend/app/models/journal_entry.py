@@ -3,15 +3,25 @@ from __future__ import annotations
 from datetime import datetime
 import uuid
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Text, func
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy import Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
 
+SEARCH_VECTOR_EXPRESSION = (
+    "to_tsvector(CASE WHEN language = 'en' THEN 'english'::regconfig ELSE 'german'::regconfig END, text)"
+)
+
 
 class JournalEntry(Base):
     __tablename__ = "journal_entries"
+    __table_args__ = (
+        Index("ix_journal_entries_user_id_created_at", "user_id", "created_at"),
+        # GIN over (user_id, search_vector) needs the btree_gin extension (migration 0013).
+        Index("ix_journal_entries_user_id_search_vector", "user_id", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False)
@@ -21,5 +31,14 @@ class JournalEntry(Base):
     energy_score: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    # Language the entry was written in (the user's preferred language at the time); it
+    # picks the text search configuration used for `search_vector`.
+    language: Mapped[str] = mapped_column(String(2), nullable=False, server_default="de")
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+    )
+
     user = relationship("User", back_populates="journal_entries")
     analysis = relationship("EntryAnalysis", back_populates="entry", uselist=False, cascade="all, delete-orphan")
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime
+import uuid
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.models.base import Base
+
+
+class UserMemory(Base):
+    """Compact rolling summary of a user's analyses, folded in locally after each new analysis."""
+
+    __tablename__ = "user_memory"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    analysis_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    mood_avg: Mapped[float] = mapped_column(Float, nullable=False)
+    energy_avg: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # Exponential moving averages per pillar, e.g. {"geist": 6.2, ...}
+    pillar_avgs: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Decayed frequencies keyed by normalized label, e.g. {"work": 2.7, ...}
+    themes: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    triggers: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
@@ -22,3 +22,21 @@ class JournalEntryOut(BaseModel):
 class JournalEntryCreatedResponse(BaseModel):
     entry: JournalEntryOut
     analysis_status: str
+
+
+class JournalSearchHit(BaseModel):
+    id: str
+    created_at: datetime
+    mood_score: int
+    energy_score: int
+    rank: float
+    # HTML-escaped excerpt; matched terms are wrapped in <mark>…</mark>.
+    snippet: str
+
+
+class JournalSearchOut(BaseModel):
+    query: str
+    limit: int
+    offset: int
+    has_more: bool
+    results: list[JournalSearchHit]
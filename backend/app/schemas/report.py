@@ -38,3 +38,46 @@ class CurrentReportOut(BaseModel):
     daily_recommendation: str
     weekly_goal: str
     series: list[TrendPoint]
+
+
+class DailyStatPoint(BaseModel):
+    date: date
+    entry_count: int
+    mood_min: int
+    mood_avg: float
+    mood_max: int
+    energy_min: int
+    energy_avg: float
+    energy_max: int
+    geist: float
+    herz: float
+    seele: float
+    koerper: float
+    aura: float
+
+
+class StatsRangeOut(BaseModel):
+    start_date: date
+    end_date: date
+    entry_count: int
+    mood_avg: float | None
+    energy_avg: float | None
+    pillar_scores_avg: dict
+    days: list[DailyStatPoint]
+
+
+class TrendsOut(BaseModel):
+    """Columnar trend series: index i of every list belongs to the bucket starting at dates[i]."""
+
+    start_date: date
+    end_date: date
+    bucket_days: int
+    dates: list[date]
+    entry_count: list[int]
+    mood: list[float]
+    energy: list[float]
+    geist: list[float]
+    herz: list[float]
+    seele: list[float]
+    koerper: list[float]
+    aura: list[float]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+from app.schemas.journal import JournalEntryOut
+
+TagKind = Literal["theme", "keyword", "phrase", "trigger"]
+
+
+class TagFrequency(BaseModel):
+    value: str
+    entry_count: int
+    last_seen: datetime
+
+
+class TagFrequenciesOut(BaseModel):
+    kind: TagKind
+    tags: list[TagFrequency]
+
+
+class TaggedEntriesOut(BaseModel):
+    kind: TagKind
+    value: str
+    limit: int
+    offset: int
+    has_more: bool
+    entries: list[JournalEntryOut]
@@ -3,24 +3,35 @@ from __future__ import annotations
 import logging
 import re
 import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from app.llm.client import get_chat
+from app.llm.chunking import estimate_tokens, split_into_chunks
+from app.llm.client import chat_messages, get_chat
 from app.llm.parsers import parse_with_repair
-from app.llm.prompts import ENTRY_ANALYSIS_SYSTEM, ENTRY_ANALYSIS_USER_TEMPLATE
+from app.llm.prompts import ENTRY_ANALYSIS_SYSTEM, ENTRY_ANALYSIS_USER_TEMPLATE, ENTRY_CHUNK_USER_TEMPLATE
 from app.llm.fix_prompts import (
     ENTRY_ANALYSIS_JSON_FIX_SYSTEM,
+    ENTRY_CHUNK_JSON_FIX_SYSTEM,
     ENTRY_ANALYSIS_PART1_JSON_FIX_SYSTEM,
     ENTRY_ANALYSIS_PART2_JSON_FIX_SYSTEM,
 )
+from app.core.config import settings
 from app.core.database import SessionLocal
 from app.models.entry_analysis import EntryAnalysis
 from app.models.journal_entry import JournalEntry
+from app.services.context_service import LAST_ENTRIES_LIMIT, render_last_entries_context
+from app.services.embedding_service import render_similar_entries_context
 from app.services.language_utils import detect_language, translate_lines, translate_text
+from app.services.memory_service import get_user_memory, memory_predates, render_user_memory, update_user_memory
+from app.services.stats_service import rebuild_days_for_entries, record_new_analysis
+from app.services.tag_service import replace_entry_tags
+from app.schemas.common import PILLARS
 from app.schemas.analysis import (
     Emotion,
     EntryAnalysisLLMOutput,
@@ -135,10 +146,7 @@ def _default_pillar_scores() -> PillarScores:
 
 def _run_micro_call(chat, prompt: str, model: type[BaseModel], *, fix_prompt: str) -> BaseModel:
     """Single micro-call with strict repair (one repair pass only)."""
-    resp = chat.invoke([
-        SystemMessage(content=ENTRY_ANALYSIS_SYSTEM),
-        HumanMessage(content=prompt),
-    ])
+    resp = chat.invoke(chat_messages(ENTRY_ANALYSIS_SYSTEM, prompt))
     raw = str(resp.content)
     # One repair attempt keeps latency low and avoids the model wandering.
     return parse_with_repair(model, raw, system_prompt=fix_prompt, max_attempts=1)
@@ -159,20 +167,88 @@ class _NarrativeOut(BaseModel):
     risk_flags: RiskFlags = Field(default_factory=RiskFlags)
 
 
-def _get_last_entries_context(db: Session, user_id: uuid.UUID, exclude_entry_id: uuid.UUID, limit: int = 5) -> str:
-    stmt = (
-        select(JournalEntry)
-        .where(JournalEntry.user_id == user_id, JournalEntry.id != exclude_entry_id)
-        .order_by(JournalEntry.created_at.desc())
-        .limit(limit)
-    )
-    entries = db.scalars(stmt).all()
-    if not entries:
-        return "No prior entries."
-    lines = []
-    for e in entries:
-        lines.append(f"- {e.created_at.isoformat()}: mood={e.mood_score}, energy={e.energy_score}, text={e.text[:100]}...")
-    return "\n".join(lines)
+class _ChunkDigestOut(BaseModel):
+    summary: str = Field(default="", max_length=600)
+    emotions: list[Emotion] = Field(default_factory=list)
+    themes: list[str] = Field(default_factory=list, max_length=6)
+    signals: Signals = Field(default_factory=Signals)
+
+
+def _digest_chunk(
+    chat, chunk_text: str, *, index: int, total: int, language: str, allow_fallback: bool = True
+) -> _ChunkDigestOut:
+    prompt = ENTRY_CHUNK_USER_TEMPLATE.format(language=language, index=index, total=total, chunk_text=chunk_text)
+    try:
+        return _run_micro_call(chat, prompt, _ChunkDigestOut, fix_prompt=ENTRY_CHUNK_JSON_FIX_SYSTEM)
+    except Exception:
+        if not allow_fallback:
+            raise
+        logger.warning("Chunk digest %s/%s failed, keeping the head of the chunk", index, total)
+        return _ChunkDigestOut(summary=chunk_text[:600])
+
+
+def _merge_labels(groups: list[list[str]], limit: int) -> list[str]:
+    seen: dict[str, str] = {}
+    for group in groups:
+        for label in group:
+            key = label.strip().lower()
+            if key and key not in seen:
+                seen[key] = label.strip()
+    return list(seen.values())[:limit]
+
+
+def _condense_long_entry(chat, text: str, language: str, *, allow_fallback: bool = True) -> str:
+    """Map-reduce preparation for entries too long to inline into every prompt.
+
+    Short entries are returned unchanged. Long ones are split on paragraph/sentence
+    boundaries, each chunk is digested in parallel, and the digests are joined into a
+    compact stand-in text that the regular scores/narrative calls analyze. A failed digest
+    falls back to the head of its chunk, or raises with `allow_fallback=False`.
+    """
+
+    if estimate_tokens(text) <= settings.analysis_chunk_threshold_tokens:
+        return text
+
+    chunks = split_into_chunks(text, settings.analysis_chunk_tokens)
+    total = len(chunks)
+    workers = max(1, min(settings.analysis_chunk_workers, total))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = list(
+            pool.map(
+                lambda item: _digest_chunk(
+                    chat, item[1], index=item[0], total=total, language=language, allow_fallback=allow_fallback
+                ),
+                enumerate(chunks, start=1),
+            )
+        )
+
+    lines = [f"(Long entry, {len(text)} characters, condensed from {total} consecutive parts.)", ""]
+    for i, d in enumerate(digests, start=1):
+        lines.append(f"Part {i}: {d.summary.strip()}")
+    emotions = _merge_labels([[f"{e.name} ({e.intensity:.1f})" for e in d.emotions] for d in digests], 10)
+    themes = _merge_labels([d.themes for d in digests], 10)
+    triggers = _merge_labels([d.signals.triggers for d in digests], 8)
+    phrases = _merge_labels([d.signals.phrases for d in digests], 8)
+    lines.append("")
+    if emotions:
+        lines.append("Emotions noticed: " + ", ".join(emotions))
+    if themes:
+        lines.append("Themes noticed: " + ", ".join(themes))
+    if triggers:
+        lines.append("Triggers noticed: " + ", ".join(triggers))
+    if phrases:
+        lines.append("Notable phrases: " + "; ".join(phrases))
+    return "\n".join(lines).strip()
+
+
+def _get_last_entries_context(db: Session, entry: JournalEntry, limit: int = LAST_ENTRIES_LIMIT) -> str:
+    """The user's latest entries written before `entry`."""
+
+    return render_last_entries_context(db, entry.user_id, entry.id, limit=limit, before=entry.created_at)
+
+
+class AnalysisFailedError(RuntimeError):
+    """The LLM could not produce an analysis and the caller asked for no fallback."""
 
 
 def _fallback_analysis(language: str) -> EntryAnalysisLLMOutput:
@@ -204,20 +280,56 @@ def _inject_emergency_message(reflection: str, language: str) -> str:
     return f"{reflection}\n\n{msg}"
 
 
-def analyze_entry(db: Session, entry: JournalEntry, user_language: str) -> EntryAnalysis:
-    last_entries_context = _get_last_entries_context(db, entry.user_id, entry.id)
-
-    user_prompt = ENTRY_ANALYSIS_USER_TEMPLATE.format(
-        language=user_language,
-        timestamp=entry.created_at.isoformat(),
-        mood_score=entry.mood_score,
-        energy_score=entry.energy_score,
-        entry_text=entry.text,
-        last_entries=last_entries_context,
-    )
+def _get_user_context(db: Session, entry: JournalEntry) -> tuple[str, str]:
+    """Return (scores context, narrative context) for the micro-call prompts.
+
+    The compact rolling memory replaces the raw last-entries dump once a user has one;
+    until then the scores call keeps seeing the recent entries. A re-analysis uses the
+    entries written before this one instead: the memory already contains this entry's
+    analysis and later ones. Similar older entries (by local embedding) are added to the
+    scores context either way.
+    """
 
+    memory = get_user_memory(db, entry.user_id) if memory_predates(db, entry) else None
+    if memory is not None:
+        scores_context = narrative_context = render_user_memory(memory)
+    else:
+        last_entries = _get_last_entries_context(db, entry)
+        scores_context, narrative_context = f"Last 5 entries (most recent first):\n{last_entries}", "No prior entries."
+
+    try:
+        similar = render_similar_entries_context(db, entry)
+    except Exception:
+        logger.exception("Similar entries lookup failed for entry %s", entry.id)
+        db.rollback()
+        similar = ""
+    if similar:
+        scores_context = f"{scores_context}\n\n{similar}"
+    return scores_context, narrative_context
+
+
+def generate_analysis(
+    entry: JournalEntry,
+    user_language: str,
+    *,
+    scores_context: str,
+    narrative_context: str,
+    fallback_context: Callable[[], str],
+    chat=None,
+    allow_fallback: bool = True,
+) -> EntryAnalysisLLMOutput:
+    """Run the LLM part of an analysis for `entry` without touching the database.
+
+    With `allow_fallback=False` (bulk re-analysis, which would overwrite a good stored
+    analysis) a failed LLM call raises AnalysisFailedError instead of returning the generic
+    fallback analysis or default scores.
+    """
+
+    entry_text = entry.text
     try:
-        chat = get_chat()
+        chat = chat or get_chat()
+        # In strict mode a failed digest raises, and the single-call path below gets the full text.
+        entry_text = _condense_long_entry(chat, entry.text, user_language, allow_fallback=allow_fallback)
 
         # Preferred path: structured output (tool/function calling) with smaller schemas.
         # This avoids relying on the model to produce a complete JSON blob in one go.
@@ -230,8 +342,8 @@ Energy (1-10): {energy_score}
 Entry text:
 {entry_text}
 
-Optional context: last 5 entries:
-{last_entries}
+Optional context: what we know about this user so far:
+{user_context}
 
 Task:
 1) Identify emotions (name + intensity 0..1)
@@ -251,8 +363,8 @@ Be kind, non-judgmental, and not medical. Use the user's language.
             timestamp=entry.created_at.isoformat(),
             mood_score=entry.mood_score,
             energy_score=entry.energy_score,
-            entry_text=entry.text,
-            last_entries=last_entries_context,
+            entry_text=entry_text,
+            user_context=scores_context,
         )
 
         narrative_prompt = """
@@ -264,6 +376,9 @@ Energy (1-10): {energy_score}
 Entry text:
 {entry_text}
 
+Optional context about this user (for continuity only; focus on today's entry):
+{user_context}
+
 Task:
 Write a comforting, structured reflection for a German/Swiss German audience (standard German wording is fine).
 
@@ -304,7 +419,8 @@ No diagnosis. No clinical advice. If risk is present, keep it supportive and sug
             timestamp=entry.created_at.isoformat(),
             mood_score=entry.mood_score,
             energy_score=entry.energy_score,
-            entry_text=entry.text,
+            entry_text=entry_text,
+            user_context=narrative_context,
         )
 
         scores_prompt = (
@@ -326,6 +442,8 @@ No diagnosis. No clinical advice. If risk is present, keep it supportive and sug
             try:
                 part1 = _run_micro_call(chat, narrowed, _SignalsAndScoresOut, fix_prompt=ENTRY_ANALYSIS_PART1_JSON_FIX_SYSTEM)
             except Exception:
+                if not allow_fallback:
+                    raise
                 part1 = _SignalsAndScoresOut()
 
         # Part 2: narrative + recommendations
@@ -337,6 +455,8 @@ No diagnosis. No clinical advice. If risk is present, keep it supportive and sug
             try:
                 part2 = _run_micro_call(chat, narrowed, _NarrativeOut, fix_prompt=ENTRY_ANALYSIS_PART2_JSON_FIX_SYSTEM)
             except Exception:
+                if not allow_fallback:
+                    raise
                 part2 = _NarrativeOut()
 
         result = EntryAnalysisLLMOutput.model_validate(
@@ -365,11 +485,16 @@ No diagnosis. No clinical advice. If risk is present, keep it supportive and sug
     except Exception:
         # Fallback path: single-call + robust JSON repair.
         try:
-            chat = get_chat()
-            resp = chat.invoke([
-                SystemMessage(content=ENTRY_ANALYSIS_SYSTEM),
-                HumanMessage(content=user_prompt),
-            ])
+            user_prompt = ENTRY_ANALYSIS_USER_TEMPLATE.format(
+                language=user_language,
+                timestamp=entry.created_at.isoformat(),
+                mood_score=entry.mood_score,
+                energy_score=entry.energy_score,
+                entry_text=entry_text,
+                last_entries=fallback_context(),
+            )
+            chat = chat or get_chat()
+            resp = chat.invoke(chat_messages(ENTRY_ANALYSIS_SYSTEM, user_prompt))
             raw = str(resp.content)
             result = parse_with_repair(EntryAnalysisLLMOutput, raw, system_prompt=ENTRY_ANALYSIS_JSON_FIX_SYSTEM)
             result = _ensure_output_language(chat, result, user_language)
@@ -377,7 +502,9 @@ No diagnosis. No clinical advice. If risk is present, keep it supportive and sug
             result.rationale_summary = _strip_meta_labels(result.rationale_summary)
             result.recommendations.daily = [_strip_meta_labels(x) for x in result.recommendations.daily]
             result.recommendations.weekly = [_strip_meta_labels(x) for x in result.recommendations.weekly]
-        except Exception:
+        except Exception as e:
+            if not allow_fallback:
+                raise AnalysisFailedError(f"LLM analysis failed for entry {entry.id}") from e
             logger.exception("LLM analysis failed for entry %s", entry.id)
             result = _fallback_analysis(user_language)
 
@@ -387,43 +514,118 @@ No diagnosis. No clinical advice. If risk is present, keep it supportive and sug
         result.recommendations.daily = []
         result.recommendations.weekly = []
 
+    return result
+
+
+def analysis_row_values(
+    entry_id: uuid.UUID, user_id: uuid.UUID, user_language: str, result: EntryAnalysisLLMOutput
+) -> dict:
+    """Column values for an `entry_analysis` row built from an LLM result."""
+
+    pillar_weights = result.pillar_weights.model_dump()
+    pillar_scores = result.pillar_scores.model_dump()
+    return {
+        "entry_id": entry_id,
+        "user_id": user_id,
+        "language": user_language,
+        "emotions": [e.model_dump() for e in result.emotions],
+        "themes": result.themes,
+        "pillar_weights": pillar_weights,
+        "pillar_scores": pillar_scores,
+        **{f"{p}_score": pillar_scores[p] for p in PILLARS},
+        **{f"{p}_weight": pillar_weights[p] for p in PILLARS},
+        "reflection": result.reflection,
+        "recommendations": result.recommendations.model_dump(),
+        "signals": result.signals.model_dump(),
+        "rationale_summary": result.rationale_summary,
+        "risk_flags": result.risk_flags.model_dump(),
+    }
+
+
+def upsert_analyses(db: Session, rows: list[dict]) -> None:
+    """Insert or replace many analyses in one statement (keyed by entry_id)."""
+
+    if not rows:
+        return
+    stmt = insert(EntryAnalysis).values([{"id": uuid.uuid4(), **r} for r in rows])
+    immutable = {"id", "entry_id", "user_id", "created_at"}
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[EntryAnalysis.entry_id],
+        set_={c.name: stmt.excluded[c.name] for c in EntryAnalysis.__table__.columns if c.name not in immutable},
+    )
+    db.execute(stmt)
+    db.commit()
+    rebuild_days_for_entries(db, [r["entry_id"] for r in rows])
+    replace_entry_tags(db, rows)
+
+
+def _refresh_entry_tags(db: Session, values: dict) -> None:
+    try:
+        replace_entry_tags(db, [values])
+    except Exception:
+        logger.exception("Tag index update failed for entry %s", values["entry_id"])
+        db.rollback()
+
+
+def _store_analysis(db: Session, entry: JournalEntry, user_language: str, result: EntryAnalysisLLMOutput) -> EntryAnalysis:
+    values = analysis_row_values(entry.id, entry.user_id, user_language, result)
+
     existing = db.scalars(select(EntryAnalysis).where(EntryAnalysis.entry_id == entry.id)).first()
     if existing:
-        existing.language = user_language
-        existing.emotions = [e.model_dump() for e in result.emotions]
-        existing.themes = result.themes
-        existing.pillar_weights = result.pillar_weights.model_dump()
-        existing.pillar_scores = result.pillar_scores.model_dump()
-        existing.reflection = result.reflection
-        existing.recommendations = result.recommendations.model_dump()
-        existing.signals = result.signals.model_dump()
-        existing.rationale_summary = result.rationale_summary
-        existing.risk_flags = result.risk_flags.model_dump()
+        for key, value in values.items():
+            setattr(existing, key, value)
         db.commit()
         db.refresh(existing)
+        try:
+            rebuild_days_for_entries(db, [entry.id])
+        except Exception:
+            logger.exception("Daily stats rebuild failed for entry %s", entry.id)
+            db.rollback()
+        _refresh_entry_tags(db, values)
         return existing
 
-    analysis = EntryAnalysis(
-        id=uuid.uuid4(),
-        entry_id=entry.id,
-        user_id=entry.user_id,
-        language=user_language,
-        emotions=[e.model_dump() for e in result.emotions],
-        themes=result.themes,
-        pillar_weights=result.pillar_weights.model_dump(),
-        pillar_scores=result.pillar_scores.model_dump(),
-        reflection=result.reflection,
-        recommendations=result.recommendations.model_dump(),
-        signals=result.signals.model_dump(),
-        rationale_summary=result.rationale_summary,
-        risk_flags=result.risk_flags.model_dump(),
-    )
+    analysis = EntryAnalysis(id=uuid.uuid4(), **values)
     db.add(analysis)
     db.commit()
     db.refresh(analysis)
+
+    try:
+        record_new_analysis(db, entry, analysis.pillar_scores)
+    except Exception:
+        logger.exception("Daily stats update failed for entry %s", entry.id)
+        db.rollback()
+    _refresh_entry_tags(db, values)
+    try:
+        update_user_memory(db, entry, analysis)
+    except Exception:
+        # Memory is a prompt optimization; never let it fail the analysis itself.
+        logger.exception("User memory update failed for entry %s", entry.id)
+        db.rollback()
     return analysis
 
 
+def analyze_entry_output(
+    db: Session, entry: JournalEntry, user_language: str, *, chat=None, allow_fallback: bool = True
+) -> EntryAnalysisLLMOutput:
+    """Generate an analysis for `entry` with its usual prompt context, without storing it."""
+
+    scores_context, narrative_context = _get_user_context(db, entry)
+    return generate_analysis(
+        entry,
+        user_language,
+        scores_context=scores_context,
+        narrative_context=narrative_context,
+        fallback_context=lambda: _get_last_entries_context(db, entry),
+        chat=chat,
+        allow_fallback=allow_fallback,
+    )
+
+
+def analyze_entry(db: Session, entry: JournalEntry, user_language: str) -> EntryAnalysis:
+    result = analyze_entry_output(db, entry, user_language)
+    return _store_analysis(db, entry, user_language, result)
+
+
 def analyze_entry_background(entry_id: str, user_language: str) -> None:
     try:
         entry_uuid = uuid.UUID(entry_id)
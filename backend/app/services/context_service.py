@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.journal_entry import JournalEntry
+
+LAST_ENTRIES_LIMIT = 5
+LAST_ENTRIES_TEXT_CHARS = 100
+
+NO_PRIOR_ENTRIES = "No prior entries."
+
+
+def _last_entries_rows(
+    db: Session,
+    user_id: uuid.UUID,
+    *,
+    exclude_entry_id: uuid.UUID | None,
+    limit: int,
+    before: datetime | None = None,
+):
+    # Narrow projection: only the columns the prompt needs, with the text truncated in SQL
+    # so we never ship up to 20k characters per row just to keep the first 100.
+    stmt = (
+        select(
+            JournalEntry.id,
+            JournalEntry.created_at,
+            JournalEntry.mood_score,
+            JournalEntry.energy_score,
+            func.left(JournalEntry.text, LAST_ENTRIES_TEXT_CHARS).label("text_head"),
+        )
+        .where(JournalEntry.user_id == user_id)
+        .order_by(JournalEntry.created_at.desc())
+        .limit(limit)
+    )
+    if exclude_entry_id is not None:
+        stmt = stmt.where(JournalEntry.id != exclude_entry_id)
+    if before is not None:
+        stmt = stmt.where(JournalEntry.created_at < before)
+    return db.execute(stmt).all()
+
+
+def _render_last_entries(rows) -> str:
+    if not rows:
+        return NO_PRIOR_ENTRIES
+    lines = []
+    for r in rows:
+        lines.append(f"- {r.created_at.isoformat()}: mood={r.mood_score}, energy={r.energy_score}, text={r.text_head}...")
+    return "\n".join(lines)
+
+
+def render_last_entries_context(
+    db: Session,
+    user_id: uuid.UUID,
+    exclude_entry_id: uuid.UUID,
+    limit: int = LAST_ENTRIES_LIMIT,
+    *,
+    before: datetime | None = None,
+) -> str:
+    """The user's latest entries as prompt lines; with `before`, only entries written before it."""
+
+    rows = _last_entries_rows(db, user_id, exclude_entry_id=exclude_entry_id, limit=limit, before=before)
+    return _render_last_entries(rows)
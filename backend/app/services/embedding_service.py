@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.llm.embeddings import EMBEDDING_VERSION, embed, quantize, stack, top_k
+from app.models.entry_embedding import EntryEmbedding
+from app.models.journal_entry import JournalEntry
+
+
+def upsert_entry_embeddings(db: Session, entries: list[JournalEntry]) -> None:
+    """Embed and store many entries in one statement (replacing older vectors)."""
+
+    if not entries:
+        return
+    stmt = insert(EntryEmbedding).values(
+        [
+            {"entry_id": e.id, "user_id": e.user_id, "version": EMBEDDING_VERSION, "vector": quantize(embed(e.text))}
+            for e in entries
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[EntryEmbedding.entry_id],
+        set_={"version": stmt.excluded.version, "vector": stmt.excluded.vector},
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def store_entry_embedding(db: Session, entry: JournalEntry) -> None:
+    upsert_entry_embeddings(db, [entry])
+
+
+def entries_missing_embeddings(db: Session, limit: int) -> list[JournalEntry]:
+    stmt = (
+        select(JournalEntry)
+        .outerjoin(EntryEmbedding, EntryEmbedding.entry_id == JournalEntry.id)
+        .where((EntryEmbedding.entry_id.is_(None)) | (EntryEmbedding.version != EMBEDDING_VERSION))
+        .order_by(JournalEntry.created_at, JournalEntry.id)
+        .limit(limit)
+    )
+    return list(db.scalars(stmt).all())
+
+
+def find_similar_entries(
+    db: Session,
+    user_id: uuid.UUID,
+    text: str,
+    exclude_entry_id: uuid.UUID,
+    k: int,
+    min_score: float,
+    *,
+    before: datetime,
+) -> list[tuple[float, object]]:
+    """Top-k entries of a user written before `before`, by cosine similarity to `text`, best first.
+
+    Brute force over the user's stored vectors (DIM bytes each); only the winners' texts
+    are loaded. Returns (score, row) with row.created_at/mood_score/energy_score/text.
+    """
+
+    query = embed(text)
+    if not query.any():
+        return []
+
+    rows = db.execute(
+        select(EntryEmbedding.entry_id, EntryEmbedding.vector)
+        .join(JournalEntry, JournalEntry.id == EntryEmbedding.entry_id)
+        .where(
+            EntryEmbedding.user_id == user_id,
+            EntryEmbedding.version == EMBEDDING_VERSION,
+            EntryEmbedding.entry_id != exclude_entry_id,
+            # A re-analysis of an old entry must not see what was written after it.
+            JournalEntry.created_at < before,
+        )
+    ).all()
+    if not rows:
+        return []
+
+    idx, scores = top_k(stack([r.vector for r in rows]), query, k)
+    hits = {rows[i].entry_id: float(s) for i, s in zip(idx, scores) if s >= min_score}
+    if not hits:
+        return []
+
+    entries = db.execute(
+        select(
+            JournalEntry.id,
+            JournalEntry.created_at,
+            JournalEntry.mood_score,
+            JournalEntry.energy_score,
+            func.left(JournalEntry.text, 200).label("text"),
+        ).where(JournalEntry.id.in_(hits))
+    ).all()
+    return sorted(((hits[e.id], e) for e in entries), key=lambda pair: -pair[0])
+
+
+def render_similar_entries_context(db: Session, entry: JournalEntry) -> str:
+    """Prompt block of similar past entries, or "" when disabled or nothing is similar enough."""
+
+    if settings.similar_entries_k <= 0:
+        return ""
+    similar = find_similar_entries(
+        db,
+        entry.user_id,
+        entry.text,
+        entry.id,
+        settings.similar_entries_k,
+        settings.similar_entries_min_score,
+        before=entry.created_at,
+    )
+    if not similar:
+        return ""
+    lines = [
+        f"- {e.created_at.isoformat()}: mood={e.mood_score}, energy={e.energy_score}, text={e.text}..."
+        for _, e in similar
+    ]
+    return "Similar past entries (most similar first):\n" + "\n".join(lines)
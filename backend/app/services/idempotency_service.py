@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.idempotency_key import IdempotencyKey
+
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+
+
+class IdempotencyKeyReused(ValueError):
+    """The key was already used for a different request payload."""
+
+
+class IdempotencyKeyInProgress(ValueError):
+    """Another worker is still processing a request with this key."""
+
+
+def request_fingerprint(payload: dict) -> str:
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _claim(db: Session, user_id: uuid.UUID, key: str, request_hash: str, now: datetime) -> None:
+    db.add(
+        IdempotencyKey(
+            user_id=user_id,
+            key=key,
+            request_hash=request_hash,
+            status=STATUS_IN_PROGRESS,
+            expires_at=now + timedelta(hours=settings.idempotency_ttl_hours),
+        )
+    )
+    db.commit()
+
+
+def begin_request(db: Session, user_id: uuid.UUID, key: str, request_hash: str) -> tuple[int, dict] | None:
+    """Claim `key` for this request.
+
+    Returns the stored (status_code, response) when the key has already completed, or
+    None when the caller now owns the key and must call `complete_request`/`abandon_request`.
+    """
+
+    for _ in range(2):
+        now = datetime.now(UTC)
+        record = db.get(IdempotencyKey, (user_id, key), populate_existing=True)
+        if record is not None and record.expires_at <= now:
+            db.delete(record)
+            db.commit()
+            record = None
+
+        if record is None:
+            try:
+                _claim(db, user_id, key, request_hash, now)
+                return None
+            except IntegrityError:
+                # Another worker claimed it between our read and insert; re-read its state.
+                db.rollback()
+                continue
+
+        if record.request_hash != request_hash:
+            raise IdempotencyKeyReused(key)
+        if record.status == STATUS_COMPLETED:
+            return record.status_code, record.response
+
+        stale_after = timedelta(seconds=settings.idempotency_lock_timeout_seconds)
+        if record.created_at + stale_after > now:
+            raise IdempotencyKeyInProgress(key)
+        # The owner died mid-request; take the key over. Conditional on the claim we read, so
+        # when several workers find the same stale key only one of them wins.
+        taken = db.execute(
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                IdempotencyKey.status == STATUS_IN_PROGRESS,
+                IdempotencyKey.created_at == record.created_at,
+            )
+            .values(created_at=now)
+            .returning(IdempotencyKey.key)
+            .execution_options(synchronize_session=False)
+        ).first()
+        db.commit()
+        if taken is None:
+            raise IdempotencyKeyInProgress(key)
+        return None
+
+    raise IdempotencyKeyInProgress(key)
+
+
+def complete_request(db: Session, user_id: uuid.UUID, key: str, status_code: int, response: dict) -> None:
+    record = db.get(IdempotencyKey, (user_id, key))
+    if record is None:
+        return
+    record.status = STATUS_COMPLETED
+    record.status_code = status_code
+    record.response = response
+    db.commit()
+
+
+def abandon_request(db: Session, user_id: uuid.UUID, key: str) -> None:
+    """Release a claimed key after a failure so the client can retry with it."""
+
+    db.rollback()
+    db.execute(
+        delete(IdempotencyKey).where(
+            IdempotencyKey.user_id == user_id,
+            IdempotencyKey.key == key,
+            IdempotencyKey.status == STATUS_IN_PROGRESS,
+        )
+    )
+    db.commit()
+
+
+def purge_expired_keys(db: Session, *, batch_size: int = 5000) -> int:
+    """Delete expired keys in batches of `batch_size` (one commit each); returns the number deleted."""
+
+    now = datetime.now(UTC)
+    total = 0
+    while True:
+        expired = (
+            select(IdempotencyKey.user_id, IdempotencyKey.key)
+            .where(IdempotencyKey.expires_at <= now)
+            .limit(batch_size)
+        )
+        result = db.execute(
+            delete(IdempotencyKey).where(tuple_(IdempotencyKey.user_id, IdempotencyKey.key).in_(expired))
+        )
+        db.commit()
+        total += result.rowcount or 0
+        if (result.rowcount or 0) < batch_size:
+            return total
@@ -3,10 +3,10 @@ from __future__ import annotations
 import json
 from typing import TypeVar
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field, ValidationError
 
-from app.llm.parsers import extract_json_object
+from app.llm.client import chat_messages
+from app.llm.parsers import parse_and_validate
 from app.schemas.common import Language
 
 T = TypeVar("T", bound=BaseModel)
@@ -82,21 +82,10 @@ class _TranslatedLinesOut(BaseModel):
 
 
 def _repair_json_with_chat(chat, raw_text: str, system_prompt: str) -> str:
-    resp = chat.invoke(
-        [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=raw_text),
-        ]
-    )
+    resp = chat.invoke(chat_messages(system_prompt, raw_text))
     return str(resp.content)
 
 
-def _parse_and_validate(model: type[T], raw_text: str) -> T:
-    json_text = extract_json_object(raw_text)
-    data = json.loads(json_text)
-    return model.model_validate(data)
-
-
 def _parse_with_repair_using_chat(
     chat,
     model: type[T],
@@ -109,7 +98,7 @@ def _parse_with_repair_using_chat(
     text = raw_text
     for _ in range(max_attempts + 1):
         try:
-            return _parse_and_validate(model, text)
+            return parse_and_validate(model, text)
         except (json.JSONDecodeError, ValueError, ValidationError) as e:
             last_err = e
             text = _repair_json_with_chat(chat, text, repair_system_prompt)
@@ -122,12 +111,7 @@ def detect_language(chat, text: str) -> str:
         return "unknown"
 
     try:
-        resp = chat.invoke(
-            [
-                SystemMessage(content=_LANGUAGE_DETECT_SYSTEM),
-                HumanMessage(content=s),
-            ]
-        )
+        resp = chat.invoke(chat_messages(_LANGUAGE_DETECT_SYSTEM, s))
         raw = str(resp.content)
         out = _parse_with_repair_using_chat(
             chat,
@@ -150,12 +134,7 @@ def translate_text(chat, text: str, target_language: str) -> str:
         return s
 
     try:
-        resp = chat.invoke(
-            [
-                SystemMessage(content=_TRANSLATE_TEXT_SYSTEM),
-                HumanMessage(content=f"Target language: {target}\n\nText:\n{s}"),
-            ]
-        )
+        resp = chat.invoke(chat_messages(_TRANSLATE_TEXT_SYSTEM, f"Target language: {target}\n\nText:\n{s}"))
         raw = str(resp.content)
         out = _parse_with_repair_using_chat(
             chat,
@@ -169,6 +148,34 @@ def translate_text(chat, text: str, target_language: str) -> str:
         return s
 
 
+def _translate_line_list(chat, lines: list[str], target_language: str) -> list[str]:
+    payload = json.dumps({"lines": lines}, ensure_ascii=False)
+    resp = chat.invoke(
+        chat_messages(_TRANSLATE_LINES_SYSTEM, f"Target language: {target_language}\n\nInput JSON:\n{payload}")
+    )
+    out = _parse_with_repair_using_chat(
+        chat,
+        _TranslatedLinesOut,
+        str(resp.content),
+        max_attempts=1,
+        repair_system_prompt=_TRANSLATE_LINES_JSON_FIX_SYSTEM,
+    )
+    return [(ln or "").strip() for ln in out.lines or []]
+
+
+def translate_batch(chat, lines: list[str], target_language: str) -> list[str]:
+    """Translate `lines` in one call; raises ValueError unless the model returns as many lines.
+
+    Positions matter here (callers split the result back by layout), so empty lines in the
+    reply are kept and counted, unlike in `translate_lines`.
+    """
+
+    out_lines = _translate_line_list(chat, lines, target_language)
+    if len(out_lines) != len(lines):
+        raise ValueError(f"Expected {len(lines)} translated lines, got {len(out_lines)}")
+    return out_lines
+
+
 def translate_lines(chat, items: list[str], target_language: str, *, max_items: int) -> list[str]:
     target = (target_language or "").strip().lower()
     cleaned = [i.strip() for i in (items or []) if i and i.strip()]
@@ -179,24 +186,9 @@ def translate_lines(chat, items: list[str], target_language: str, *, max_items:
         return cleaned
 
     try:
-        payload = json.dumps({"lines": cleaned}, ensure_ascii=False)
-        resp = chat.invoke(
-            [
-                SystemMessage(content=_TRANSLATE_LINES_SYSTEM),
-                HumanMessage(content=f"Target language: {target}\n\nInput JSON:\n{payload}"),
-            ]
-        )
-        raw = str(resp.content)
-        out = _parse_with_repair_using_chat(
-            chat,
-            _TranslatedLinesOut,
-            raw,
-            max_attempts=1,
-            repair_system_prompt=_TRANSLATE_LINES_JSON_FIX_SYSTEM,
-        )
-        out_lines = [ln.strip() for ln in (out.lines or []) if ln and ln.strip()]
+        out_lines = [ln for ln in _translate_line_list(chat, cleaned, target) if ln]
         if len(out_lines) != len(cleaned):
             return cleaned
-        return out_lines[: len(cleaned)]
+        return out_lines
     except Exception:
         return cleaned
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.entry_analysis import EntryAnalysis
+from app.models.journal_entry import JournalEntry
+from app.models.user_memory import UserMemory
+from app.schemas.common import PILLARS
+
+# Weight of the newest analysis in the moving averages.
+EMA_ALPHA = 0.2
+# Frequencies are multiplied by this on every update, so old themes fade out.
+FREQUENCY_DECAY = 0.9
+FREQUENCY_MIN = 0.25
+MAX_TRACKED_LABELS = 12
+MAX_RENDERED_LABELS = 6
+
+
+def _normalize_label(label: str) -> str:
+    return " ".join(str(label).strip().lower().split())[:60]
+
+
+def _ema(previous: float | None, value: float) -> float:
+    if previous is None:
+        return float(value)
+    return previous + EMA_ALPHA * (float(value) - previous)
+
+
+def _fold_frequencies(freqs: dict, labels: list[str]) -> dict:
+    out = {k: v * FREQUENCY_DECAY for k, v in (freqs or {}).items()}
+    for label in {_normalize_label(x) for x in labels or []}:
+        if label:
+            out[label] = out.get(label, 0.0) + 1.0
+    kept = sorted(((k, v) for k, v in out.items() if v >= FREQUENCY_MIN), key=lambda kv: kv[1], reverse=True)
+    return {k: round(v, 3) for k, v in kept[:MAX_TRACKED_LABELS]}
+
+
+def _top_labels(freqs: dict | None) -> list[str]:
+    # JSONB does not keep key order (keys come back sorted by length), so rank by count here.
+    ranked = sorted((freqs or {}).items(), key=lambda kv: (-kv[1], kv[0]))
+    return [label for label, _ in ranked[:MAX_RENDERED_LABELS]]
+
+
+def fold_analysis(
+    memory: UserMemory,
+    *,
+    mood: int,
+    energy: int,
+    pillar_scores: dict,
+    themes: list[str],
+    triggers: list[str],
+) -> UserMemory:
+    """Fold one analysis into `memory` in place. Pure bookkeeping, no I/O and no LLM."""
+
+    first = not memory.analysis_count
+    memory.analysis_count = (memory.analysis_count or 0) + 1
+    memory.mood_avg = _ema(None if first else memory.mood_avg, mood)
+    memory.energy_avg = _ema(None if first else memory.energy_avg, energy)
+
+    previous = {} if first else (memory.pillar_avgs or {})
+    memory.pillar_avgs = {
+        p: round(_ema(previous.get(p), (pillar_scores or {}).get(p, 5)), 3) for p in PILLARS
+    }
+    memory.themes = _fold_frequencies({} if first else memory.themes, themes)
+    memory.triggers = _fold_frequencies({} if first else memory.triggers, triggers)
+    return memory
+
+
+def render_user_memory(memory: UserMemory | None) -> str:
+    if memory is None or not memory.analysis_count:
+        return "No prior entries."
+
+    pillars = ", ".join(f"{p} {memory.pillar_avgs.get(p, 5):.1f}" for p in PILLARS)
+    lines = [
+        f"Entries so far: {memory.analysis_count}",
+        f"Pillar averages (recent-weighted, 1-10): {pillars}",
+        f"Mood avg: {memory.mood_avg:.1f}, energy avg: {memory.energy_avg:.1f}",
+    ]
+    themes = _top_labels(memory.themes)
+    if themes:
+        lines.append("Recurring themes: " + ", ".join(themes))
+    triggers = _top_labels(memory.triggers)
+    if triggers:
+        lines.append("Frequent triggers: " + ", ".join(triggers))
+    return "\n".join(lines)
+
+
+def get_user_memory(db: Session, user_id: uuid.UUID) -> UserMemory | None:
+    return db.get(UserMemory, user_id)
+
+
+def memory_predates(db: Session, entry: JournalEntry) -> bool:
+    """True while neither `entry` nor any later entry of its user has been analyzed.
+
+    Only then does the rolling memory describe just the entries before `entry`. On a
+    recompute or bulk re-analysis it already contains this entry's result, and possibly later ones.
+    """
+
+    stmt = (
+        select(EntryAnalysis.id)
+        .join(JournalEntry, JournalEntry.id == EntryAnalysis.entry_id)
+        .where(JournalEntry.user_id == entry.user_id, JournalEntry.created_at >= entry.created_at)
+        .limit(1)
+    )
+    return db.scalar(stmt) is None
+
+
+def _rebuild_from_history(db: Session, user_id: uuid.UUID, *, exclude_entry_id: uuid.UUID) -> UserMemory:
+    memory = UserMemory(user_id=user_id, analysis_count=0)
+    stmt = (
+        select(
+            JournalEntry.mood_score,
+            JournalEntry.energy_score,
+            EntryAnalysis.pillar_scores,
+            EntryAnalysis.themes,
+            EntryAnalysis.signals["triggers"].label("triggers"),
+        )
+        .join(EntryAnalysis, EntryAnalysis.entry_id == JournalEntry.id)
+        .where(JournalEntry.user_id == user_id, JournalEntry.id != exclude_entry_id)
+        .order_by(JournalEntry.created_at)
+    )
+    for row in db.execute(stmt):
+        fold_analysis(
+            memory,
+            mood=row.mood_score,
+            energy=row.energy_score,
+            pillar_scores=row.pillar_scores,
+            themes=row.themes,
+            triggers=row.triggers or [],
+        )
+    return memory
+
+
+def update_user_memory(db: Session, entry: JournalEntry, analysis: EntryAnalysis) -> None:
+    memory = db.get(UserMemory, entry.user_id, with_for_update=True)
+    if memory is None:
+        # First update for this user since memory was introduced: replay their history once.
+        memory = _rebuild_from_history(db, entry.user_id, exclude_entry_id=entry.id)
+        db.add(memory)
+
+    fold_analysis(
+        memory,
+        mood=entry.mood_score,
+        energy=entry.energy_score,
+        pillar_scores=analysis.pillar_scores,
+        themes=analysis.themes,
+        triggers=(analysis.signals or {}).get("triggers", []),
+    )
+    db.commit()
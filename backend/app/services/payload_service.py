@@ -0,0 +1,110 @@
+"""Response payloads built straight from DB rows for the trusted serialization path.
+
+JSONB columns are selected as text and embedded with `raw_json`, so they are neither
+parsed by the driver nor re-encoded on the way out. The dict shapes match
+JournalEntryOut / EntryAnalysisOut.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import Text, and_, cast, select
+from sqlalchemy.orm import Session
+
+from app.core.responses import raw_json
+from app.models.entry_analysis import EntryAnalysis
+from app.models.entry_analysis_translation import EntryAnalysisTranslation
+from app.models.journal_entry import JournalEntry
+
+_ANALYSIS_JSONB_FIELDS = ("emotions", "themes", "pillar_weights", "pillar_scores", "recommendations", "signals", "risk_flags")
+_TRANSLATED_JSONB_FIELDS = ("emotions", "themes", "recommendations", "signals")
+
+ENTRY_COLUMNS = (
+    JournalEntry.id,
+    JournalEntry.text,
+    JournalEntry.mood_score,
+    JournalEntry.energy_score,
+    JournalEntry.created_at,
+)
+
+ANALYSIS_COLUMNS = (
+    EntryAnalysis.id,
+    EntryAnalysis.entry_id,
+    EntryAnalysis.user_id,
+    EntryAnalysis.language,
+    EntryAnalysis.reflection,
+    EntryAnalysis.rationale_summary,
+    EntryAnalysis.created_at,
+    *(cast(getattr(EntryAnalysis, f), Text).label(f) for f in _ANALYSIS_JSONB_FIELDS),
+)
+
+
+def entry_payload(row) -> dict:
+    return {
+        "id": str(row.id),
+        "text": row.text,
+        "mood_score": row.mood_score,
+        "energy_score": row.energy_score,
+        "created_at": row.created_at,
+    }
+
+
+def analysis_payload(row) -> dict:
+    return {
+        "id": str(row.id),
+        "entry_id": str(row.entry_id),
+        "user_id": str(row.user_id),
+        "language": row.language,
+        "emotions": raw_json(row.emotions),
+        "themes": raw_json(row.themes),
+        "pillar_weights": raw_json(row.pillar_weights),
+        "pillar_scores": raw_json(row.pillar_scores),
+        "reflection": row.reflection,
+        "recommendations": raw_json(row.recommendations),
+        "signals": raw_json(row.signals),
+        "rationale_summary": row.rationale_summary,
+        "risk_flags": raw_json(row.risk_flags),
+    }
+
+
+TRANSLATION_COLUMNS = (
+    EntryAnalysisTranslation.language.label("t_language"),
+    EntryAnalysisTranslation.reflection.label("t_reflection"),
+    EntryAnalysisTranslation.rationale_summary.label("t_rationale_summary"),
+    *(cast(getattr(EntryAnalysisTranslation, f), Text).label(f"t_{f}") for f in _TRANSLATED_JSONB_FIELDS),
+)
+
+
+def fresh_translation(language: str):
+    """Join condition for the `language` variant of an analysis, if it is not outdated."""
+
+    return and_(
+        EntryAnalysisTranslation.analysis_id == EntryAnalysis.id,
+        EntryAnalysisTranslation.language == language,
+        EntryAnalysisTranslation.source_updated_at == EntryAnalysis.updated_at,
+    )
+
+
+def get_analysis_payload(db: Session, analysis_id: uuid.UUID, language: str | None = None) -> dict | None:
+    """With `language`, the stored variant in that language (if fresh) replaces the user-facing fields."""
+
+    if language is None:
+        row = db.execute(select(*ANALYSIS_COLUMNS).where(EntryAnalysis.id == analysis_id)).first()
+        return analysis_payload(row) if row is not None else None
+
+    row = db.execute(
+        select(*ANALYSIS_COLUMNS, *TRANSLATION_COLUMNS)
+        .outerjoin(EntryAnalysisTranslation, fresh_translation(language))
+        .where(EntryAnalysis.id == analysis_id)
+    ).first()
+    if row is None:
+        return None
+    payload = analysis_payload(row)
+    if row.t_language is not None:
+        payload["language"] = row.t_language
+        payload["reflection"] = row.t_reflection
+        payload["rationale_summary"] = row.t_rationale_summary
+        for f in _TRANSLATED_JSONB_FIELDS:
+            payload[f] = raw_json(getattr(row, f"t_{f}"))
+    return payload
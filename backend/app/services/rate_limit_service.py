@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Window boundaries come from the database clock so every worker and instance agrees.
+_HIT_SQL = text(
+    """
+    INSERT INTO rate_limit_counters AS c (key, window_start, count)
+    VALUES (:key, to_timestamp(floor(extract(epoch FROM now()) / :period) * :period), 1)
+    ON CONFLICT (key) DO UPDATE SET
+        count = CASE WHEN c.window_start = EXCLUDED.window_start THEN c.count + 1 ELSE 1 END,
+        window_start = EXCLUDED.window_start
+    RETURNING count, extract(epoch FROM window_start - now()) + :period AS remaining_s
+    """
+)
+
+# Only while the window the request was counted in is still current; a new window starts at 0 anyway.
+_REFUND_SQL = text(
+    """
+    UPDATE rate_limit_counters SET count = count - 1
+    WHERE key = :key
+      AND count > 0
+      AND window_start = to_timestamp(floor(extract(epoch FROM now()) / :period) * :period)
+    """
+)
+
+
+def hit_shared_counter(db: Session, key: str, limit: int, period_s: float) -> float:
+    """Count one request for `key` in the current fixed window.
+
+    Returns 0 if it is within `limit`, otherwise the seconds until the window resets.
+    """
+
+    row = db.execute(_HIT_SQL, {"key": key, "period": period_s}).one()
+    db.commit()
+    if row.count <= limit:
+        return 0.0
+    return max(float(row.remaining_s), 0.0)
+
+
+def refund_shared_counter(db: Session, key: str, period_s: float) -> None:
+    """Take back one request counted by `hit_shared_counter` in the current window."""
+
+    db.execute(_REFUND_SQL, {"key": key, "period": period_s})
+    db.commit()
@@ -2,25 +2,33 @@ from __future__ import annotations
 
 import logging
 import uuid
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
-from app.llm.client import get_chat
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+from app.llm.client import chat_messages, get_chat
 from app.llm.parsers import parse_with_repair
 from app.llm.prompts import WEEKLY_REPORT_SYSTEM, WEEKLY_REPORT_USER_TEMPLATE
 from app.llm.fix_prompts import WEEKLY_REPORT_JSON_FIX_SYSTEM
 from app.models.entry_analysis import EntryAnalysis
 from app.models.journal_entry import JournalEntry
+from app.models.user import User
 from app.models.weekly_report import WeeklyReport
+from app.schemas.common import PILLARS
 from app.schemas.report import WeeklyReportLLMOutput
 from app.services.language_utils import detect_language, translate_text
 
 logger = logging.getLogger(__name__)
 
+# Namespace for pg_advisory_xact_lock(namespace, hashtext(user_id)) around report computation.
+REPORT_LOCK_NAMESPACE = 7301
+
+_report_flight: SingleFlight[WeeklyReport] = SingleFlight()
+
 
 def _ensure_weekly_report_language(chat, result: WeeklyReportLLMOutput, target_language: str) -> WeeklyReportLLMOutput:
     target = (target_language or "").strip().lower()
@@ -56,10 +64,85 @@ def _fallback_report(language: str, week_start: date, week_end: date) -> WeeklyR
     )
 
 
-def compute_weekly_report(db: Session, user_id, user_language: str) -> WeeklyReport:
+def _current_window() -> tuple[date, date]:
     today = date.today()
-    week_start = today - timedelta(days=6)
-    week_end = today
+    return today - timedelta(days=6), today
+
+
+def latest_weekly_report_id(db: Session, user_id, user_language: str, week_end: date) -> uuid.UUID | None:
+    return db.scalar(
+        select(WeeklyReport.id)
+        .where(
+            WeeklyReport.user_id == user_id,
+            WeeklyReport.week_end_date == week_end,
+            WeeklyReport.language == user_language,
+        )
+        .order_by(WeeklyReport.created_at.desc())
+        .limit(1)
+    )
+
+
+def get_fresh_weekly_report(
+    db: Session, user_id, user_language: str, *, created_after: datetime | None = None
+) -> WeeklyReport | None:
+    """Return the stored report for today's window if no analysis was written or replaced after it.
+
+    With `created_after`, only a report stored after that moment qualifies.
+    """
+
+    week_start, week_end = _current_window()
+    report = db.scalars(
+        select(WeeklyReport)
+        .where(
+            WeeklyReport.user_id == user_id,
+            WeeklyReport.week_end_date == week_end,
+            WeeklyReport.language == user_language,
+        )
+        .order_by(WeeklyReport.created_at.desc())
+        .limit(1)
+    ).first()
+    if report is None or (created_after is not None and report.created_at < created_after):
+        return None
+
+    latest_analysis_at = db.scalar(
+        select(func.max(EntryAnalysis.updated_at)).where(EntryAnalysis.user_id == user_id)
+    )
+    if latest_analysis_at is not None and latest_analysis_at > report.created_at:
+        return None
+    return report
+
+
+def users_needing_weekly_report(db: Session) -> list[tuple[uuid.UUID, str]]:
+    """(user_id, language) for users with analyses this week but no report covering the latest one."""
+
+    week_start, week_end = _current_window()
+    latest_analysis = (
+        select(EntryAnalysis.user_id, func.max(EntryAnalysis.updated_at).label("at"))
+        .where(EntryAnalysis.created_at >= week_start)
+        .group_by(EntryAnalysis.user_id)
+        .subquery()
+    )
+    latest_report = (
+        select(WeeklyReport.user_id, WeeklyReport.language, func.max(WeeklyReport.created_at).label("at"))
+        .where(WeeklyReport.week_end_date == week_end)
+        .group_by(WeeklyReport.user_id, WeeklyReport.language)
+        .subquery()
+    )
+    stmt = (
+        select(User.id, User.preferred_language)
+        .join(latest_analysis, latest_analysis.c.user_id == User.id)
+        .outerjoin(
+            latest_report,
+            and_(latest_report.c.user_id == User.id, latest_report.c.language == User.preferred_language),
+        )
+        .where(or_(latest_report.c.at.is_(None), latest_report.c.at < latest_analysis.c.at))
+        .order_by(User.id)
+    )
+    return [(row.id, row.preferred_language) for row in db.execute(stmt)]
+
+
+def compute_weekly_report(db: Session, user_id, user_language: str, *, fallback_on_error: bool = True) -> WeeklyReport:
+    week_start, week_end = _current_window()
 
     stmt = select(JournalEntry).where(
         JournalEntry.user_id == user_id,
@@ -68,11 +151,16 @@ def compute_weekly_report(db: Session, user_id, user_language: str) -> WeeklyRep
     ).order_by(JournalEntry.created_at)
     entries = db.scalars(stmt).all()
 
-    stmt_a = select(EntryAnalysis).where(
+    # Only the columns the prompt needs; scores come from the typed columns, not the JSONB blob.
+    stmt_a = select(
+        EntryAnalysis.entry_id,
+        EntryAnalysis.themes,
+        *(getattr(EntryAnalysis, f"{p}_score") for p in PILLARS),
+    ).where(
         EntryAnalysis.user_id == user_id,
         EntryAnalysis.entry_id.in_([e.id for e in entries]),
     )
-    analyses = db.scalars(stmt_a).all()
+    analyses = db.execute(stmt_a).all()
 
     entry_stats = [
         {
@@ -87,7 +175,7 @@ def compute_weekly_report(db: Session, user_id, user_language: str) -> WeeklyRep
     analyses_dump = [
         {
             "entry_id": a.entry_id,
-            "pillar_scores": a.pillar_scores,
+            "pillar_scores": {p: getattr(a, f"{p}_score") for p in PILLARS},
             "themes": a.themes,
         }
         for a in analyses
@@ -101,18 +189,19 @@ def compute_weekly_report(db: Session, user_id, user_language: str) -> WeeklyRep
         analyses=analyses_dump,
     )
 
+    fallback = False
     try:
         chat = get_chat()
-        resp = chat.invoke([
-            SystemMessage(content=WEEKLY_REPORT_SYSTEM),
-            HumanMessage(content=user_prompt),
-        ])
+        resp = chat.invoke(chat_messages(WEEKLY_REPORT_SYSTEM, user_prompt))
         raw = str(resp.content)
         result = parse_with_repair(WeeklyReportLLMOutput, raw, system_prompt=WEEKLY_REPORT_JSON_FIX_SYSTEM)
         result = _ensure_weekly_report_language(chat, result, user_language)
     except Exception as e:
+        if not fallback_on_error:
+            raise
         logger.exception("Weekly report LLM failed for user %s", user_id)
         result = _fallback_report(user_language, week_start, week_end)
+        fallback = True
 
     report = WeeklyReport(
         id=uuid.uuid4(),
@@ -128,7 +217,67 @@ def compute_weekly_report(db: Session, user_id, user_language: str) -> WeeklyRep
         daily_recommendation=result.daily_recommendation,
         weekly_goal=result.weekly_goal,
     )
+    if fallback:
+        # Reports are served from storage while fresh, so a fallback is never stored:
+        # the next view (or the nightly job) retries the LLM instead of pinning it.
+        return report
     db.add(report)
     db.commit()
     db.refresh(report)
     return report
+
+
+def _lock_user_report(db: Session, user_id) -> None:
+    """Serialize report computation for one user across workers until the transaction ends."""
+
+    db.execute(select(func.pg_advisory_xact_lock(REPORT_LOCK_NAMESPACE, func.hashtext(str(user_id)))))
+
+
+def get_or_compute_weekly_report(db: Session, user_id, user_language: str) -> WeeklyReport:
+    """`compute_weekly_report` for request handlers: single-flight per user, debounced.
+
+    Concurrent callers in this process wait for one computation; other workers wait on an
+    advisory lock. A fresh report stored within REPORT_DEBOUNCE_SECONDS (or while a caller
+    was waiting) is returned instead of making another LLM call.
+    """
+
+    def compute() -> WeeklyReport:
+        requested_at = datetime.now(timezone.utc)
+        debounce = timedelta(seconds=settings.report_debounce_seconds)
+        if debounce:
+            recent = get_fresh_weekly_report(db, user_id, user_language, created_after=requested_at - debounce)
+            if recent is not None:
+                return recent
+
+        _lock_user_report(db, user_id)
+        try:
+            # Another worker may have stored one while we waited for the lock.
+            recent = get_fresh_weekly_report(db, user_id, user_language, created_after=requested_at - debounce)
+            if recent is not None:
+                return recent
+            return compute_weekly_report(db, user_id, user_language)
+        finally:
+            # Ends the transaction, which releases the lock when compute_weekly_report did not commit.
+            db.commit()
+
+    report, joined = _report_flight.do((user_id, user_language), compute)
+    if joined and report.created_at is not None:
+        # The leader's instance belongs to its session; load our own copy.
+        report = db.get(WeeklyReport, report.id) or report
+    return report
+
+
+def precompute_weekly_report(db: Session, user_id, user_language: str) -> WeeklyReport | None:
+    """Nightly job variant: under the same advisory lock as request handlers, no fallback.
+
+    Returns None when a fresh report already exists (e.g. a user view computed one while the
+    job was running), so the job never stores a second report next to it.
+    """
+
+    _lock_user_report(db, user_id)
+    try:
+        if get_fresh_weekly_report(db, user_id, user_language) is not None:
+            return None
+        return compute_weekly_report(db, user_id, user_language, fallback_on_error=False)
+    finally:
+        db.commit()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import and_, case, cast, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Session
+
+from app.models.journal_entry import JournalEntry
+
+# ts_headline runs only on the returned page; the text is HTML-escaped first so the
+# snippet is safe to render with its <mark> highlights.
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=12, MaxFragments=2, FragmentDelimiter=\" … \""
+
+
+def _config(language: str):
+    # Explicit cast: an untyped parameter inside CASE would resolve to text, not regconfig.
+    return cast(literal("english" if language == "en" else "german"), REGCONFIG)
+
+
+def _escape_html(col):
+    return func.replace(func.replace(func.replace(col, "&", "&amp;"), "<", "&lt;"), ">", "&gt;")
+
+
+def search_entries(db: Session, user_id: uuid.UUID, query: str, limit: int, offset: int) -> tuple[list, bool]:
+    """Ranked full-text search over a user's entries.
+
+    Each entry is matched with the text search configuration of its own language. The
+    match is an OR of one predicate per language so both can use the GIN index.
+    Returns (rows, has_more); rows carry id, created_at, mood/energy, rank and snippet.
+    """
+
+    q_en = func.websearch_to_tsquery(_config("en"), query)
+    q_de = func.websearch_to_tsquery(_config("de"), query)
+    is_en = JournalEntry.language == "en"
+    row_query = case((is_en, q_en), else_=q_de)
+
+    matches = (
+        select(
+            JournalEntry.id,
+            JournalEntry.created_at,
+            JournalEntry.mood_score,
+            JournalEntry.energy_score,
+            JournalEntry.language,
+            JournalEntry.text,
+            func.ts_rank_cd(JournalEntry.search_vector, row_query).label("rank"),
+        )
+        .where(
+            JournalEntry.user_id == user_id,
+            or_(
+                and_(is_en, JournalEntry.search_vector.op("@@")(q_en)),
+                and_(~is_en, JournalEntry.search_vector.op("@@")(q_de)),
+            ),
+        )
+        .order_by(func.ts_rank_cd(JournalEntry.search_vector, row_query).desc(), JournalEntry.created_at.desc())
+        .limit(limit + 1)
+        .offset(offset)
+        .subquery()
+    )
+
+    page_en = matches.c.language == "en"
+    headline = func.ts_headline(
+        case((page_en, _config("en")), else_=_config("de")),
+        _escape_html(matches.c.text),
+        case((page_en, q_en), else_=q_de),
+        HEADLINE_OPTIONS,
+    )
+    stmt = select(
+        matches.c.id,
+        matches.c.created_at,
+        matches.c.mood_score,
+        matches.c.energy_score,
+        matches.c.rank,
+        headline.label("snippet"),
+    ).order_by(matches.c.rank.desc(), matches.c.created_at.desc())
+
+    rows = list(db.execute(stmt))
+    return rows[:limit], len(rows) > limit
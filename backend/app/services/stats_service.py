@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import math
+import uuid
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from sqlalchemy import Date, cast, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.daily_user_stats import DailyUserStats
+from app.models.entry_analysis import EntryAnalysis
+from app.models.journal_entry import JournalEntry
+from app.schemas.common import PILLARS
+
+_SUM_COLUMNS = ("entry_count", "mood_sum", "energy_sum", *(f"{p}_sum" for p in PILLARS))
+
+
+def _entry_day(entry: JournalEntry) -> date:
+    return entry.created_at.date()
+
+
+def record_new_analysis(db: Session, entry: JournalEntry, pillar_scores: dict) -> None:
+    """Fold one newly analyzed entry into its day's rollup row (no re-read of other rows)."""
+
+    values = {
+        "user_id": entry.user_id,
+        "day": _entry_day(entry),
+        "entry_count": 1,
+        "mood_min": entry.mood_score,
+        "mood_max": entry.mood_score,
+        "mood_sum": entry.mood_score,
+        "energy_min": entry.energy_score,
+        "energy_max": entry.energy_score,
+        "energy_sum": entry.energy_score,
+        **{f"{p}_sum": int(pillar_scores.get(p, 5)) for p in PILLARS},
+    }
+    stmt = insert(DailyUserStats).values(**values)
+    t = DailyUserStats.__table__.c
+    set_ = {c: t[c] + stmt.excluded[c] for c in _SUM_COLUMNS}
+    set_.update(
+        mood_min=func.least(t.mood_min, stmt.excluded.mood_min),
+        mood_max=func.greatest(t.mood_max, stmt.excluded.mood_max),
+        energy_min=func.least(t.energy_min, stmt.excluded.energy_min),
+        energy_max=func.greatest(t.energy_max, stmt.excluded.energy_max),
+        updated_at=func.now(),
+    )
+    db.execute(stmt.on_conflict_do_update(index_elements=[t.user_id, t.day], set_=set_))
+    db.commit()
+
+
+def _day_aggregate(key_filter):
+    day = cast(func.date(JournalEntry.created_at), DailyUserStats.day.type)
+    pillar_sums = [func.sum(getattr(EntryAnalysis, f"{p}_score")).label(f"{p}_sum") for p in PILLARS]
+    return (
+        select(
+            JournalEntry.user_id,
+            day.label("day"),
+            func.count().label("entry_count"),
+            func.min(JournalEntry.mood_score).label("mood_min"),
+            func.max(JournalEntry.mood_score).label("mood_max"),
+            func.sum(JournalEntry.mood_score).label("mood_sum"),
+            func.min(JournalEntry.energy_score).label("energy_min"),
+            func.max(JournalEntry.energy_score).label("energy_max"),
+            func.sum(JournalEntry.energy_score).label("energy_sum"),
+            *pillar_sums,
+        )
+        .join(EntryAnalysis, EntryAnalysis.entry_id == JournalEntry.id)
+        .where(key_filter(JournalEntry.user_id, day))
+        .group_by(JournalEntry.user_id, day)
+    )
+
+
+def rebuild_days_for_entries(db: Session, entry_ids: Iterable[uuid.UUID]) -> None:
+    """Recompute the rollup rows of the days containing `entry_ids` from the source tables.
+
+    Used when existing analyses are replaced (recompute, bulk re-analysis), where adding
+    the new values would double count.
+    """
+
+    ids = list(entry_ids)
+    if not ids:
+        return
+    keys = (
+        select(JournalEntry.user_id, cast(func.date(JournalEntry.created_at), DailyUserStats.day.type))
+        .where(JournalEntry.id.in_(ids))
+        .distinct()
+    )
+    source = _day_aggregate(lambda user_col, day_col: tuple_(user_col, day_col).in_(keys))
+    columns = [c.name for c in DailyUserStats.__table__.columns if c.name != "updated_at"]
+    stmt = insert(DailyUserStats).from_select(columns, source)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "day"],
+        set_={**{c: stmt.excluded[c] for c in columns if c not in ("user_id", "day")}, "updated_at": func.now()},
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def get_daily_stats(db: Session, user_id: uuid.UUID, start: date, end: date) -> list[DailyUserStats]:
+    stmt = (
+        select(DailyUserStats)
+        .where(DailyUserStats.user_id == user_id, DailyUserStats.day >= start, DailyUserStats.day <= end)
+        .order_by(DailyUserStats.day)
+    )
+    return list(db.scalars(stmt).all())
+
+
+def pillar_means(row: DailyUserStats) -> dict[str, float]:
+    return {p: getattr(row, f"{p}_sum") / row.entry_count for p in PILLARS}
+
+
+def summarize(rows: list[DailyUserStats]) -> dict:
+    """Exact range averages from day rows (weighted by entries per day)."""
+
+    count = sum(r.entry_count for r in rows)
+    if not count:
+        return {"entry_count": 0, "mood_avg": None, "energy_avg": None, "pillar_scores_avg": {}}
+    return {
+        "entry_count": count,
+        "mood_avg": round(sum(r.mood_sum for r in rows) / count, 2),
+        "energy_avg": round(sum(r.energy_sum for r in rows) / count, 2),
+        "pillar_scores_avg": {p: round(sum(getattr(r, f"{p}_sum") for r in rows) / count, 2) for p in PILLARS},
+    }
+
+
+def stats_version(db: Session, user_id: uuid.UUID, start: date, end: date) -> tuple:
+    """Cheap fingerprint of the rollup rows in a range; changes whenever any of them does."""
+
+    return db.execute(
+        select(func.max(DailyUserStats.updated_at), func.count(), func.coalesce(func.sum(DailyUserStats.entry_count), 0))
+        .where(DailyUserStats.user_id == user_id, DailyUserStats.day >= start, DailyUserStats.day <= end)
+    ).one()
+
+
+def bucket_days_for(days: int, points: int) -> int:
+    return max(1, math.ceil(days / points))
+
+
+def get_trend_buckets(db: Session, user_id: uuid.UUID, start: date, end: date, points: int) -> dict:
+    """Downsample the day rollups of a range to at most `points` equal-width buckets.
+
+    Bucketing happens in SQL over the day rows; averages are weighted by entries, so a
+    bucket's value equals the mean over all entries it covers. Empty buckets are omitted.
+    """
+
+    bucket_days = bucket_days_for((end - start).days + 1, points)
+    # Bucket in a subquery: with server-side parameter binding, repeating the expression in
+    # GROUP BY would yield distinct placeholders that Postgres does not treat as equal.
+    days = (
+        select(
+            ((DailyUserStats.day - literal(start, Date)) // bucket_days).label("bucket"),
+            *(getattr(DailyUserStats, c) for c in _SUM_COLUMNS),
+        )
+        .where(DailyUserStats.user_id == user_id, DailyUserStats.day >= start, DailyUserStats.day <= end)
+        .subquery()
+    )
+    stmt = (
+        select(days.c.bucket, *(func.sum(days.c[c]).label(c) for c in _SUM_COLUMNS))
+        .group_by(days.c.bucket)
+        .order_by(days.c.bucket)
+    )
+
+    out: dict = {"bucket_days": bucket_days, "dates": [], "entry_count": [], "mood": [], "energy": []}
+    out.update({p: [] for p in PILLARS})
+    for row in db.execute(stmt):
+        count = row.entry_count
+        out["dates"].append(start + timedelta(days=row.bucket * bucket_days))
+        out["entry_count"].append(count)
+        out["mood"].append(round(row.mood_sum / count, 2))
+        out["energy"].append(round(row.energy_sum / count, 2))
+        for p in PILLARS:
+            out[p].append(round(getattr(row, f"{p}_sum") / count, 2))
+    return out
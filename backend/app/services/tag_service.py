@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.entry_tag import EntryTag
+from app.models.journal_entry import JournalEntry
+from app.schemas.tags import TagKind
+
+_SIGNAL_KINDS = {"keywords": "keyword", "phrases": "phrase", "triggers": "trigger"}
+MAX_TAG_LENGTH = 200
+
+
+def normalize_tag(value: str) -> str:
+    """Lowercase and collapse whitespace (kept in sync with the 0008 backfill SQL)."""
+
+    return " ".join(value.split()).lower()[:MAX_TAG_LENGTH]
+
+
+def tags_from_analysis(themes: list, signals: dict) -> list[tuple[str, str, str]]:
+    """(kind, value_norm, value) for an analysis, deduplicated per kind."""
+
+    sources: list[tuple[str, list]] = [("theme", themes or [])]
+    sources += [(kind, (signals or {}).get(key) or []) for key, kind in _SIGNAL_KINDS.items()]
+
+    seen: set[tuple[str, str]] = set()
+    out = []
+    for kind, values in sources:
+        for value in values:
+            if not isinstance(value, str):
+                continue
+            norm = normalize_tag(value)
+            if not norm or (kind, norm) in seen:
+                continue
+            seen.add((kind, norm))
+            out.append((kind, norm, value.strip()))
+    return out
+
+
+def replace_entry_tags(db: Session, rows: list[dict]) -> None:
+    """Rewrite the tags of the entries behind `rows` (analysis_row_values dicts)."""
+
+    if not rows:
+        return
+    entry_ids = [r["entry_id"] for r in rows]
+    created = dict(db.execute(select(JournalEntry.id, JournalEntry.created_at).where(JournalEntry.id.in_(entry_ids))).all())
+
+    values = []
+    for r in rows:
+        created_at: datetime | None = created.get(r["entry_id"])
+        if created_at is None:
+            continue
+        values += [
+            {
+                "entry_id": r["entry_id"],
+                "kind": kind,
+                "value_norm": norm,
+                "user_id": r["user_id"],
+                "value": value,
+                "created_at": created_at,
+            }
+            for kind, norm, value in tags_from_analysis(r.get("themes"), r.get("signals"))
+        ]
+
+    db.execute(delete(EntryTag).where(EntryTag.entry_id.in_(entry_ids)))
+    if values:
+        db.execute(insert(EntryTag).values(values).on_conflict_do_nothing())
+    db.commit()
+
+
+def tag_frequencies(
+    db: Session, user_id: uuid.UUID, kind: TagKind, limit: int, since: datetime | None = None
+) -> list:
+    """Most frequent tags of one kind: rows of (value_norm, value, entry_count, last_seen)."""
+
+    stmt = select(
+        EntryTag.value_norm,
+        func.max(EntryTag.value).label("value"),
+        func.count().label("entry_count"),
+        func.max(EntryTag.created_at).label("last_seen"),
+    ).where(EntryTag.user_id == user_id, EntryTag.kind == kind)
+    if since is not None:
+        stmt = stmt.where(EntryTag.created_at >= since)
+    stmt = (
+        stmt.group_by(EntryTag.value_norm)
+        .order_by(func.count().desc(), EntryTag.value_norm)
+        .limit(limit)
+    )
+    return list(db.execute(stmt))
+
+
+def entries_by_tag(
+    db: Session, user_id: uuid.UUID, kind: TagKind, value: str, limit: int, offset: int
+) -> tuple[list[JournalEntry], bool]:
+    """Entries carrying a tag, newest first. Returns (entries, has_more)."""
+
+    ids = (
+        select(EntryTag.entry_id, EntryTag.created_at)
+        .where(EntryTag.user_id == user_id, EntryTag.kind == kind, EntryTag.value_norm == normalize_tag(value))
+        .order_by(EntryTag.created_at.desc())
+        .limit(limit + 1)
+        .offset(offset)
+        .subquery()
+    )
+    stmt = (
+        select(JournalEntry)
+        .join(ids, ids.c.entry_id == JournalEntry.id)
+        .order_by(ids.c.created_at.desc())
+    )
+    entries = list(db.scalars(stmt).all())
+    return entries[:limit], len(entries) > limit
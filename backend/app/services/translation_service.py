@@ -0,0 +1,216 @@
+"""Cached per-language variants of analyses, generated in batches after a language change.
+
+Only the user-facing strings are translated (reflection, rationale, themes, emotion names,
+recommendations, signals). Several analyses are flattened into one line list and translated
+with a single LLM call, instead of ~10 calls per analysis as in `_ensure_output_language`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.llm.chunking import CHARS_PER_TOKEN
+from app.llm.client import MAX_OUTPUT_TOKENS, get_chat
+from app.models.entry_analysis import EntryAnalysis
+from app.models.entry_analysis_translation import EntryAnalysisTranslation
+from app.models.user import User
+from app.services.language_utils import translate_batch
+from app.services.payload_service import fresh_translation
+
+logger = logging.getLogger(__name__)
+
+# List fields in flattening order: (column, key inside the JSONB object or None for a list column).
+_LIST_FIELDS = (
+    ("themes", None),
+    ("recommendations", "daily"),
+    ("recommendations", "weekly"),
+    ("signals", "keywords"),
+    ("signals", "phrases"),
+    ("signals", "triggers"),
+)
+
+TRANSLATED_COLUMNS = ("emotions", "themes", "reflection", "recommendations", "signals", "rationale_summary")
+
+# The reply repeats every line as a JSON string, often longer than the source (German runs
+# ~30% longer than English, plus quoting), so a batch's source text gets ~60% of the budget.
+MAX_BATCH_CHARS = MAX_OUTPUT_TOKENS * CHARS_PER_TOKEN * 5 // 8
+
+_running_lock = threading.Lock()
+_running: set[tuple[uuid.UUID, str]] = set()
+
+
+@dataclass(frozen=True)
+class _Layout:
+    emotions: int
+    lists: tuple[int, ...]
+
+    @property
+    def size(self) -> int:
+        return 2 + self.emotions + sum(self.lists)
+
+
+def _list_field(analysis, column: str, key: str | None) -> list[str]:
+    value = getattr(analysis, column) or ({} if key else [])
+    return [str(x) for x in (value.get(key, []) if key else value)]
+
+
+def flatten_analysis(analysis) -> tuple[list[str], _Layout]:
+    """The analysis' user-facing strings as one list, plus the layout to split them again."""
+
+    emotion_names = [str(e.get("name", "")) for e in analysis.emotions or []]
+    lists = [_list_field(analysis, column, key) for column, key in _LIST_FIELDS]
+    lines = [analysis.reflection, analysis.rationale_summary, *emotion_names]
+    for values in lists:
+        lines.extend(values)
+    return lines, _Layout(emotions=len(emotion_names), lists=tuple(len(v) for v in lists))
+
+
+def unflatten_analysis(analysis, lines: list[str], layout: _Layout) -> dict:
+    """Translated column values for EntryAnalysisTranslation; empty lines keep the original."""
+
+    original, _ = flatten_analysis(analysis)
+    lines = [new or old for new, old in zip(lines, original)]
+    reflection, rationale_summary = lines[0], lines[1]
+    pos = 2
+    emotions = [{**e, "name": lines[pos + i]} for i, e in enumerate(analysis.emotions or [])]
+    pos += layout.emotions
+
+    out = {
+        "reflection": reflection,
+        "rationale_summary": rationale_summary,
+        "emotions": emotions,
+        "themes": [],
+        "recommendations": dict(analysis.recommendations or {}),
+        "signals": dict(analysis.signals or {}),
+    }
+    for (column, key), count in zip(_LIST_FIELDS, layout.lists):
+        values = lines[pos : pos + count]
+        pos += count
+        if key is None:
+            out[column] = values
+        else:
+            out[column][key] = values
+    return out
+
+
+def _batches(analyses: list[EntryAnalysis], max_chars: int):
+    batch: list[tuple[EntryAnalysis, list[str], _Layout]] = []
+    chars = 0
+    for a in analyses:
+        lines, layout = flatten_analysis(a)
+        size = sum(len(line) for line in lines)
+        if batch and chars + size > max_chars:
+            yield batch
+            batch, chars = [], 0
+        batch.append((a, lines, layout))
+        chars += size
+    if batch:
+        yield batch
+
+
+def analyses_needing_translation(db: Session, user_id: uuid.UUID, language: str, limit: int) -> list[EntryAnalysis]:
+    """Newest first: analyses in another language without an up-to-date variant in `language`."""
+
+    stmt = (
+        select(EntryAnalysis)
+        .outerjoin(EntryAnalysisTranslation, fresh_translation(language))
+        .where(
+            EntryAnalysis.user_id == user_id,
+            EntryAnalysis.language != language,
+            EntryAnalysisTranslation.analysis_id.is_(None),
+        )
+        .order_by(EntryAnalysis.created_at.desc())
+        .limit(limit)
+    )
+    return list(db.scalars(stmt))
+
+
+def translate_analyses(db: Session, chat, analyses: list[EntryAnalysis], language: str) -> tuple[int, int]:
+    """Translate and store variants, one LLM call per batch; returns (stored, failed)."""
+
+    stored = failed = 0
+    max_chars = min(settings.translation_batch_chars, MAX_BATCH_CHARS)
+    for batch in _batches(analyses, max_chars):
+        flat = [line for _, lines, _ in batch for line in lines]
+        try:
+            translated = translate_batch(chat, flat, language)
+        except Exception:
+            logger.exception("Translating %d analyses to %s failed", len(batch), language)
+            failed += len(batch)
+            continue
+
+        rows, pos = [], 0
+        for analysis, lines, layout in batch:
+            values = unflatten_analysis(analysis, translated[pos : pos + layout.size], layout)
+            pos += layout.size
+            rows.append(
+                {
+                    "analysis_id": analysis.id,
+                    "language": language,
+                    "user_id": analysis.user_id,
+                    "source_updated_at": analysis.updated_at,
+                    **values,
+                }
+            )
+        stmt = insert(EntryAnalysisTranslation).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EntryAnalysisTranslation.analysis_id, EntryAnalysisTranslation.language],
+            set_={c: stmt.excluded[c] for c in ("source_updated_at", *TRANSLATED_COLUMNS)},
+        )
+        db.execute(stmt)
+        db.commit()
+        stored += len(batch)
+    return stored, failed
+
+
+def translate_user_analyses(user_id: uuid.UUID, language: str) -> None:
+    """Background job: translate a user's older analyses into `language`, newest first.
+
+    Stops early if the user switches language again; at most one job per (user, language)
+    runs per process.
+    """
+
+    key = (user_id, language)
+    with _running_lock:
+        if key in _running:
+            return
+        _running.add(key)
+
+    # Analyses stay loaded across the per-batch commits instead of being re-read one by one.
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        chat = get_chat()
+        attempted: set[uuid.UUID] = set()
+        total = failed = 0
+        while True:
+            if db.scalar(select(User.preferred_language).where(User.id == user_id)) != language:
+                break
+            pending = [
+                a
+                for a in analyses_needing_translation(
+                    db, user_id, language, settings.translation_job_size + len(attempted)
+                )
+                if a.id not in attempted
+            ][: settings.translation_job_size]
+            if not pending:
+                break
+            attempted.update(a.id for a in pending)
+            stored, batch_failed = translate_analyses(db, chat, pending, language)
+            total += stored
+            failed += batch_failed
+        logger.info("Translated %d analyses of user %s to %s (%d failed)", total, user_id, language, failed)
+    except Exception:
+        logger.exception("Translation job for user %s failed", user_id)
+    finally:
+        db.close()
+        with _running_lock:
+            _running.discard(key)
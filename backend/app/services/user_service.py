@@ -1,79 +1,109 @@
 from __future__ import annotations
 
-import json
 import uuid
+from collections.abc import Callable, Iterator
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Text, cast, select
 from sqlalchemy.orm import Session
 
+from app.core.database import SessionLocal
+from app.core.responses import dumps, raw_json
 from app.models.entry_analysis import EntryAnalysis
 from app.models.journal_entry import JournalEntry
 from app.models.user import User
 from app.models.weekly_report import WeeklyReport
+from app.services.payload_service import ANALYSIS_COLUMNS, ENTRY_COLUMNS, analysis_payload, entry_payload
 
+EXPORT_BATCH_SIZE = 500
 
-def export_user_data(db: Session, user_id) -> dict:
-    user = db.get(User, user_id)
-    if not user:
-        raise ValueError("User not found")
 
-    entries = db.scalars(select(JournalEntry).where(JournalEntry.user_id == user_id)).all()
-    analyses = db.scalars(select(EntryAnalysis).where(EntryAnalysis.user_id == user_id)).all()
-    reports = db.scalars(select(WeeklyReport).where(WeeklyReport.user_id == user_id)).all()
+def _json_array_body(result, to_item: Callable[[Any], dict]) -> Iterator[bytes]:
+    """Comma-separated JSON items of a `yield_per` result, one chunk per fetched batch."""
+
+    first = True
+    for batch in result.partitions():
+        chunk = b",".join(dumps(to_item(row)) for row in batch)
+        yield chunk if first else b"," + chunk
+        first = False
 
+
+def _report_export_item(r) -> dict:
     return {
-        "user": {
+        "id": str(r.id),
+        "week_start_date": r.week_start_date.isoformat(),
+        "week_end_date": r.week_end_date.isoformat(),
+        "language": r.language,
+        "pillar_scores_avg": raw_json(r.pillar_scores_avg),
+        "pillar_trends": raw_json(r.pillar_trends),
+        "recurring_patterns": raw_json(r.recurring_patterns),
+        "correlations": raw_json(r.correlations),
+        "summary": r.summary,
+        "daily_recommendation": r.daily_recommendation,
+        "weekly_goal": r.weekly_goal,
+        "created_at": r.created_at.isoformat(),
+    }
+
+
+def iter_user_export(user_id, *, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """All of a user's data as a streamed JSON document.
+
+    Rows are fetched in batches through a server-side cursor and encoded batch by batch,
+    so memory stays flat regardless of history size. JSONB columns are passed through as
+    raw JSON. Uses its own session because the body is produced after the route returns.
+    """
+
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        if not user:
+            raise ValueError("User not found")
+        user_out = {
             "id": str(user.id),
             "email": user.email,
             "preferred_language": user.preferred_language,
             "created_at": user.created_at.isoformat(),
-        },
-        "journal_entries": [
-            {
-                "id": str(e.id),
-                "text": e.text,
-                "mood_score": e.mood_score,
-                "energy_score": e.energy_score,
-                "created_at": e.created_at.isoformat(),
-            }
-            for e in entries
-        ],
-        "analyses": [
-            {
-                "id": str(a.id),
-                "entry_id": str(a.entry_id),
-                "language": a.language,
-                "emotions": a.emotions,
-                "themes": a.themes,
-                "pillar_weights": a.pillar_weights,
-                "pillar_scores": a.pillar_scores,
-                "reflection": a.reflection,
-                "recommendations": a.recommendations,
-                "signals": a.signals,
-                "rationale_summary": a.rationale_summary,
-                "risk_flags": a.risk_flags,
+        }
+
+        def stream(stmt):
+            return db.execute(stmt.execution_options(yield_per=batch_size))
+
+        yield b'{"user":' + dumps(user_out) + b',"journal_entries":['
+        yield from _json_array_body(
+            stream(select(*ENTRY_COLUMNS).where(JournalEntry.user_id == user_id).order_by(JournalEntry.created_at)),
+            lambda e: {**entry_payload(e), "created_at": e.created_at.isoformat()},
+        )
+        yield b'],"analyses":['
+        yield from _json_array_body(
+            stream(select(*ANALYSIS_COLUMNS).where(EntryAnalysis.user_id == user_id).order_by(EntryAnalysis.created_at)),
+            lambda a: {
+                **{k: v for k, v in analysis_payload(a).items() if k != "user_id"},
                 "created_at": a.created_at.isoformat(),
-            }
-            for a in analyses
-        ],
-        "weekly_reports": [
-            {
-                "id": str(r.id),
-                "week_start_date": r.week_start_date.isoformat(),
-                "week_end_date": r.week_end_date.isoformat(),
-                "language": r.language,
-                "pillar_scores_avg": r.pillar_scores_avg,
-                "pillar_trends": r.pillar_trends,
-                "recurring_patterns": r.recurring_patterns,
-                "correlations": r.correlations,
-                "summary": r.summary,
-                "daily_recommendation": r.daily_recommendation,
-                "weekly_goal": r.weekly_goal,
-                "created_at": r.created_at.isoformat(),
-            }
-            for r in reports
-        ],
-    }
+            },
+        )
+        yield b'],"weekly_reports":['
+        report_json = ("pillar_scores_avg", "pillar_trends", "recurring_patterns", "correlations")
+        yield from _json_array_body(
+            stream(
+                select(
+                    WeeklyReport.id,
+                    WeeklyReport.week_start_date,
+                    WeeklyReport.week_end_date,
+                    WeeklyReport.language,
+                    WeeklyReport.summary,
+                    WeeklyReport.daily_recommendation,
+                    WeeklyReport.weekly_goal,
+                    WeeklyReport.created_at,
+                    *(cast(getattr(WeeklyReport, f), Text).label(f) for f in report_json),
+                )
+                .where(WeeklyReport.user_id == user_id)
+                .order_by(WeeklyReport.created_at)
+            ),
+            _report_export_item,
+        )
+        yield b"]}"
+    finally:
+        db.close()
 
 
 def delete_user_account(db: Session, user_id) -> None:
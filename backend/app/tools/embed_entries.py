@@ -0,0 +1,53 @@
+"""Compute local embeddings for entries that have none (or an outdated version).
+
+    python -m app.tools.embed_entries --batch-size 500
+
+Needed once after the entry_embeddings migration and after EMBEDDING_VERSION changes;
+new entries are embedded when they are written. No LLM or network calls are made.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.core.database import SessionLocal
+from app.core.logging import configure_logging
+from app.services.embedding_service import entries_missing_embeddings, upsert_entry_embeddings
+
+
+def run(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    done = 0
+    db = SessionLocal()
+    try:
+        while not args.limit or done < args.limit:
+            size = args.batch_size if not args.limit else min(args.batch_size, args.limit - done)
+            batch = entries_missing_embeddings(db, size)
+            if not batch:
+                break
+            upsert_entry_embeddings(db, batch)
+            done += len(batch)
+            elapsed = time.perf_counter() - started
+            print(f"  {done} embedded  {done / elapsed:.0f} entries/s", flush=True)
+    finally:
+        db.close()
+    print(f"Embedding backfill finished: {done} entries in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Compute missing entry embeddings")
+    p.add_argument("--batch-size", type=int, default=500, help="Entries per batch upsert")
+    p.add_argument("--limit", type=int, default=0, help="Stop after this many entries (0 = all)")
+
+    args = p.parse_args()
+    if args.batch_size < 1:
+        raise SystemExit("--batch-size must be >= 1")
+
+    configure_logging()
+    return run(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
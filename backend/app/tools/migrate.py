@@ -0,0 +1,83 @@
+"""One-shot schema migration (run before new app instances start, not in their boot path).
+
+    python -m app.tools.migrate              # upgrade to head
+    python -m app.tools.migrate --check      # exit 1 if the database is behind, change nothing
+
+Runs are serialized with a Postgres advisory lock, so concurrent deploys (or a compose
+`migrate` service started twice) cannot race: the second run waits and then finds the
+schema already at head. The app itself only verifies the version at startup
+(app.core.schema).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.logging import configure_logging
+from app.core.schema import ALEMBIC_INI, current_revision, script_directory, wait_for_db
+
+# Arbitrary but fixed: every migrate run takes the same session-level advisory lock.
+MIGRATION_LOCK_ID = 0x4C5300001
+
+
+def _acquire_lock(conn, timeout_s: float) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not conn.execute(text("SELECT pg_try_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID}).scalar():
+        if time.monotonic() >= deadline:
+            raise SystemExit(f"Another migration still holds the lock after {timeout_s:.0f}s")
+        print("Waiting for a concurrent migration to finish...", flush=True)
+        time.sleep(2)
+
+
+def run(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    wait_for_db(engine, args.wait_timeout_s)
+    heads = set(script_directory().get_heads())
+
+    if args.check:
+        current = current_revision(engine)
+        print(f"Schema: {current or '(none)'}  head: {', '.join(sorted(heads))}")
+        return 0 if current in heads else 1
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        _acquire_lock(lock_conn, args.lock_timeout_s)
+        try:
+            before = current_revision(engine)
+            if before in heads and args.revision == "head":
+                print(f"Schema already at {before}")
+            else:
+                command.upgrade(Config(str(ALEMBIC_INI)), args.revision)
+                print(f"Migrated {before or '(empty)'} -> {current_revision(engine)}")
+        finally:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+    print(f"Migrations finished in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Apply database migrations under an advisory lock")
+    p.add_argument("--revision", default="head", help="Target revision (default: head)")
+    p.add_argument("--check", action="store_true", help="Only report whether the schema is at head")
+    p.add_argument(
+        "--wait-timeout-s",
+        type=float,
+        default=settings.db_startup_timeout_seconds * 4,
+        help="How long to wait for the database to accept connections",
+    )
+    p.add_argument("--lock-timeout-s", type=float, default=600.0, help="How long to wait for a concurrent run")
+
+    args = p.parse_args()
+    configure_logging()
+    return run(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+"""Precompute this week's reports for every user with new analyses (run nightly, after midnight).
+
+    python -m app.tools.precompute_reports --workers 8 --rpm 120
+
+The report endpoint then only reads stored reports. A run is resumable by construction:
+users whose report already covers their latest analysis are not selected again, so an
+interrupted run simply picks up the remaining users on the next invocation.
+
+Reports cover the 7 days ending on the run date. A stored report is only served until the
+user's next analysis, so the job mostly pays off for users who view their report before
+writing that day; after a new entry the first view recomputes the report on demand (under
+the same per-user advisory lock, and within RATE_LIMIT_REPORT_CURRENT).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from app.core.database import SessionLocal
+from app.core.logging import configure_logging
+from app.llm.client import llm_call_count, set_llm_rate_limit
+from app.services.report_service import precompute_weekly_report, users_needing_weekly_report
+
+logger = logging.getLogger("app.tools.precompute_reports")
+
+
+def _compute_one(user_id: uuid.UUID, language: str) -> float:
+    db = SessionLocal()
+    try:
+        t0 = time.perf_counter()
+        precompute_weekly_report(db, user_id, language)
+        return time.perf_counter() - t0
+    finally:
+        db.close()
+
+
+def _p95(values: list[float]) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=20, method="inclusive")[-1]
+
+
+def run(args: argparse.Namespace) -> int:
+    set_llm_rate_limit(args.rpm)
+
+    db = SessionLocal()
+    try:
+        users = users_needing_weekly_report(db)
+    finally:
+        db.close()
+    if args.limit:
+        users = users[: args.limit]
+
+    print(f"Users needing a report: {len(users)}")
+    if args.dry_run or not users:
+        return 0
+
+    started = time.perf_counter()
+    calls_at_start = llm_call_count()
+    latencies: list[float] = []
+    failed = 0
+
+    # LLM-bound work, so threads are enough; the global rate limit is shared by all of them.
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(_compute_one, uid, lang): uid for uid, lang in users}
+        for i, fut in enumerate(as_completed(futures), start=1):
+            try:
+                latencies.append(fut.result())
+            except Exception:
+                failed += 1
+                logger.exception("Weekly report failed for user %s", futures[fut])
+            if i % args.progress_every == 0:
+                print(f"  {i}/{len(users)} done", flush=True)
+
+    elapsed = time.perf_counter() - started
+    print("Weekly report precompute finished")
+    print(f"  users: {len(users)}  processed: {len(latencies)}  failed: {failed}")
+    print(f"  llm_calls: {llm_call_count() - calls_at_start}  elapsed_s: {elapsed:.1f}")
+    if latencies:
+        print(f"  report_latency_s: p50={statistics.median(latencies):.2f}  p95={_p95(latencies):.2f}  max={max(latencies):.2f}")
+    return 0 if failed == 0 else 2
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Precompute weekly reports for users with new analyses")
+    p.add_argument("--workers", type=int, default=4, help="Concurrent report computations")
+    p.add_argument("--rpm", type=int, default=60, help="LLM requests per minute across all workers (0 = unlimited)")
+    p.add_argument("--limit", type=int, default=0, help="Only process this many users (0 = all)")
+    p.add_argument("--progress-every", type=int, default=50, help="Print progress every N users")
+    p.add_argument("--dry-run", action="store_true", help="Only print how many users need a report")
+
+    args = p.parse_args()
+    if args.workers < 1:
+        raise SystemExit("--workers must be >= 1")
+    if args.progress_every < 1:
+        raise SystemExit("--progress-every must be >= 1")
+
+    configure_logging()
+    return run(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,43 @@
+"""Delete expired Idempotency-Key records (run periodically, e.g. hourly).
+
+    python -m app.tools.purge_idempotency_keys --batch-size 5000
+
+Keys expire IDEMPOTENCY_TTL_HOURS after they were claimed. Requests only replace an
+expired key when a client reuses it, so without this job the table keeps every key ever sent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.core.database import SessionLocal
+from app.core.logging import configure_logging
+from app.services.idempotency_service import purge_expired_keys
+
+
+def run(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        deleted = purge_expired_keys(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+    print(f"Purged {deleted} expired idempotency keys in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Delete expired idempotency keys")
+    p.add_argument("--batch-size", type=int, default=5000, help="Rows deleted per transaction")
+
+    args = p.parse_args()
+    if args.batch_size < 1:
+        raise SystemExit("--batch-size must be >= 1")
+
+    configure_logging()
+    return run(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,195 @@
+"""Re-run entry analyses in bulk, e.g. after prompt changes.
+
+    python -m app.tools.reanalyze --since 2026-01-01 --workers 8 --rpm 120 --checkpoint reanalyze.ckpt
+
+Entries are analyzed by a bounded worker pool; every LLM call waits for the process-wide
+budget (--rpm). Results are written with one upsert per batch, and the ids of written
+entries are appended to the checkpoint file so an interrupted run resumes where it stopped.
+Entries whose LLM calls fail are counted as failed, left unchanged and not checkpointed, so
+a re-run retries them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.logging import configure_logging
+from app.llm.client import llm_call_count, set_llm_rate_limit
+from app.models.entry_analysis import EntryAnalysis
+from app.models.journal_entry import JournalEntry
+from app.models.user import User
+from app.services.analysis_service import analysis_row_values, analyze_entry_output, upsert_analyses
+
+logger = logging.getLogger("app.tools.reanalyze")
+
+
+def _select_entries(db: Session, args: argparse.Namespace) -> list[tuple[uuid.UUID, str]]:
+    """Return (entry_id, output language) for the selection, oldest first."""
+
+    stmt = (
+        select(JournalEntry.id, User.preferred_language)
+        .join(User, User.id == JournalEntry.user_id)
+        .order_by(JournalEntry.created_at, JournalEntry.id)
+    )
+    if args.user:
+        ids = [u for u in args.user if "@" not in u]
+        emails = [u for u in args.user if "@" in u]
+        stmt = stmt.where((User.id.in_([uuid.UUID(u) for u in ids])) | (User.email.in_(emails)))
+    if args.since:
+        stmt = stmt.where(JournalEntry.created_at >= args.since)
+    if args.until:
+        stmt = stmt.where(JournalEntry.created_at < args.until + timedelta(days=1))
+    if args.language:
+        stmt = stmt.where(User.preferred_language == args.language)
+    if args.only_missing:
+        stmt = stmt.where(~select(EntryAnalysis.id).where(EntryAnalysis.entry_id == JournalEntry.id).exists())
+    if args.limit:
+        stmt = stmt.limit(args.limit)
+    return [(row.id, row.preferred_language) for row in db.execute(stmt)]
+
+
+def _load_checkpoint(path: Path | None) -> set[str]:
+    if path is None or not path.exists():
+        return set()
+    return {line.strip() for line in path.read_text().splitlines() if line.strip()}
+
+
+def _analyze_one(entry_id: uuid.UUID, language: str) -> dict | None:
+    db = SessionLocal()
+    try:
+        entry = db.get(JournalEntry, entry_id)
+        if entry is None:
+            return None
+        # Raises instead of returning the generic fallback, which would overwrite a good analysis.
+        result = analyze_entry_output(db, entry, language, allow_fallback=False)
+        return analysis_row_values(entry.id, entry.user_id, language, result)
+    finally:
+        db.close()
+
+
+class _Progress:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self.calls_at_start = llm_call_count()
+
+    def report(self) -> None:
+        elapsed = time.perf_counter() - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        remaining = self.total - self.done - self.failed
+        eta = remaining / rate if rate > 0 else float("inf")
+        print(
+            f"  {self.done}/{self.total} written  failed={self.failed}  "
+            f"{rate:.2f} entries/s  llm_calls={llm_call_count() - self.calls_at_start}  "
+            f"elapsed={elapsed:.0f}s  eta={eta:.0f}s",
+            flush=True,
+        )
+
+
+def _flush(rows: list[dict], checkpoint: Path | None, progress: _Progress) -> None:
+    if not rows:
+        return
+    db = SessionLocal()
+    try:
+        upsert_analyses(db, rows)
+    finally:
+        db.close()
+    if checkpoint is not None:
+        with checkpoint.open("a") as f:
+            f.writelines(f"{r['entry_id']}\n" for r in rows)
+    progress.done += len(rows)
+    progress.report()
+    rows.clear()
+
+
+def run(args: argparse.Namespace) -> int:
+    set_llm_rate_limit(args.rpm)
+    checkpoint = Path(args.checkpoint) if args.checkpoint else None
+    done_ids = _load_checkpoint(checkpoint)
+
+    db = SessionLocal()
+    try:
+        selected = [(eid, lang) for eid, lang in _select_entries(db, args) if str(eid) not in done_ids]
+    finally:
+        db.close()
+
+    print(f"Selected {len(selected)} entries ({len(done_ids)} already in checkpoint)")
+    if args.dry_run or not selected:
+        return 0
+
+    progress = _Progress(len(selected))
+    pending: dict[Future, uuid.UUID] = {}
+    rows: list[dict] = []
+    queue = iter(selected)
+    # Keep a bounded number of tasks queued so huge selections don't allocate a future each.
+    window = args.workers * 2
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        while True:
+            while len(pending) < window:
+                item = next(queue, None)
+                if item is None:
+                    break
+                pending[pool.submit(_analyze_one, *item)] = item[0]
+            if not pending:
+                break
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                entry_id = pending.pop(fut)
+                try:
+                    row = fut.result()
+                except Exception:
+                    logger.exception("Re-analysis failed for entry %s", entry_id)
+                    progress.failed += 1
+                    continue
+                if row is not None:
+                    rows.append(row)
+            if len(rows) >= args.batch_size:
+                _flush(rows, checkpoint, progress)
+
+    _flush(rows, checkpoint, progress)
+    print("Re-analysis finished")
+    progress.report()
+    return 0 if progress.failed == 0 else 2
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Re-run entry analyses in bulk")
+    p.add_argument("--user", action="append", help="User id or email (repeatable)")
+    p.add_argument("--since", type=date.fromisoformat, help="Only entries created on/after this date (YYYY-MM-DD)")
+    p.add_argument("--until", type=date.fromisoformat, help="Only entries created on/before this date (YYYY-MM-DD)")
+    p.add_argument("--language", choices=["de", "en"], help="Only users whose preferred language is this")
+    p.add_argument("--only-missing", action="store_true", help="Only entries without an analysis")
+    p.add_argument("--limit", type=int, default=0, help="Stop after this many entries (0 = all)")
+
+    p.add_argument("--workers", type=int, default=4, help="Concurrent analyses")
+    p.add_argument("--rpm", type=int, default=60, help="LLM requests per minute across all workers (0 = unlimited)")
+    p.add_argument("--batch-size", type=int, default=50, help="Analyses per bulk upsert")
+    p.add_argument("--checkpoint", help="File of finished entry ids; appended to and used to resume")
+    p.add_argument("--dry-run", action="store_true", help="Only print how many entries would be re-analyzed")
+
+    args = p.parse_args()
+    if args.workers < 1:
+        raise SystemExit("--workers must be >= 1")
+    if args.batch_size < 1:
+        raise SystemExit("--batch-size must be >= 1")
+
+    configure_logging()
+    return run(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+"""Bytes on the wire and CPU per response for gzip levels and brotli qualities.
+
+Payloads are the real trusted-path bodies (see bench_serialization) for the analysis,
+entry list and export endpoints. Use it to pick COMPRESSION_GZIP_LEVEL /
+COMPRESSION_BROTLI_QUALITY:
+
+    python -m benchmarks.bench_compression --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import zlib
+
+from app.core.compression import _Compressor, brotli
+from app.core.responses import dumps
+from app.services.payload_service import analysis_payload, entry_payload
+from benchmarks.bench_serialization import analysis_row, entry_row
+
+GZIP_LEVELS = (1, 4, 6, 9)
+BROTLI_QUALITIES = (1, 4, 5, 8, 11)
+
+
+def _payloads(export_size: int) -> dict[str, bytes]:
+    return {
+        "analysis": dumps(analysis_payload(analysis_row())),
+        "entries (20)": dumps([entry_payload(entry_row(i)) for i in range(20)]),
+        f"export ({export_size})": dumps(
+            {
+                "journal_entries": [entry_payload(entry_row(i)) for i in range(export_size)],
+                "analyses": [analysis_payload(analysis_row()) for _ in range(export_size)],
+            }
+        ),
+    }
+
+
+def _measure(encoding: str, level: int, body: bytes, repeat: int) -> tuple[int, float]:
+    samples = []
+    size = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = _Compressor(encoding, gzip_level=level, brotli_quality=level).compress(body, final=True)
+        samples.append((time.perf_counter() - t0) * 1e6)
+        size = len(out)
+    return size, statistics.median(samples)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--repeat", type=int, default=50)
+    p.add_argument("--export-size", type=int, default=500)
+    args = p.parse_args()
+
+    configs = [("gzip", lvl) for lvl in GZIP_LEVELS]
+    if brotli is not None:
+        configs += [("br", q) for q in BROTLI_QUALITIES]
+    else:
+        print("brotli not installed; gzip only")
+
+    for name, body in _payloads(args.export_size).items():
+        repeat = args.repeat if len(body) < 100_000 else max(3, args.repeat // 10)
+        print(f"\n{name}: {len(body)} bytes raw")
+        print(f"  {'encoding':<9} {'bytes':>9} {'ratio':>6} {'cpu us':>10} {'MB/s':>7}")
+        for encoding, level in configs:
+            size, us = _measure(encoding, level, body, repeat)
+            print(
+                f"  {encoding + '-' + str(level):<9} {size:>9} {len(body) / size:>6.1f} {us:>10.1f} "
+                f"{len(body) / us:>7.1f}"
+            )
+    print(f"\nzlib {zlib.ZLIB_VERSION}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
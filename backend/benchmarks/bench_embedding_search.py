@@ -0,0 +1,66 @@
+"""Brute-force similar-entry search at 1k/10k/100k entries per user.
+
+Pure NumPy, no database: times embedding one entry, stacking the stored int8 vectors,
+and the top-k scan used by embedding_service.find_similar_entries.
+
+    python -m benchmarks.bench_embedding_search --sizes 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from app.llm.embeddings import embed, quantize, stack, top_k
+
+_WORDS = (
+    "arbeit müde familie freund schlaf sport stress ruhe angst freude dankbar gespräch projekt "
+    "termin urlaub regen sonne spaziergang kopfschmerzen meditation musik kochen abend morgen "
+    "work tired family friend sleep gym calm anxiety grateful deadline walk headache evening"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    p.add_argument("--k", type=int, default=3)
+    p.add_argument("--words", type=int, default=150, help="Words per synthetic entry")
+    p.add_argument("--repeat", type=int, default=7)
+    args = p.parse_args()
+
+    rng = random.Random(7)
+    query_text = _text(rng, args.words)
+    embed(query_text)  # build the projection once
+    print(f"embed one entry: {_median_ms(lambda: embed(query_text), args.repeat * 10):.3f} ms")
+
+    # Distinct stored vectors are expensive to produce at 100k; tile a pool of real ones.
+    pool = [quantize(embed(_text(rng, args.words))) for _ in range(2_000)]
+    query = embed(query_text)
+
+    print(f"{'entries':>8} {'stack ms':>9} {'top-k ms':>9} {'MB':>6}")
+    for n in args.sizes:
+        blobs = [pool[i % len(pool)] for i in range(n)]
+        stack_ms = _median_ms(lambda: stack(blobs), args.repeat)
+        matrix = stack(blobs)
+        search_ms = _median_ms(lambda: top_k(matrix, query, args.k), args.repeat)
+        print(f"{n:>8} {stack_ms:>9.2f} {search_ms:>9.2f} {matrix.nbytes / 1e6:>6.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
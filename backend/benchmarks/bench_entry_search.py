@@ -0,0 +1,119 @@
+"""Full-text entry search vs a naive ILIKE scan on a seeded corpus.
+
+Seeds a temporary `journal_entries` table (it shadows the real one for this session only,
+nothing persistent is written) with the generated search vector and GIN index, then times
+`search_service.search_entries` against `ILIKE '%term%'` for the same user:
+
+    python -m benchmarks.bench_entry_search --rows 1000000 --users 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.database import engine
+from app.models.journal_entry import SEARCH_VECTOR_EXPRESSION
+from app.services.search_service import search_entries
+
+WORDS_DE = (
+    "arbeit müde familie freund schlaf sport laufen stress ruhe angst freude dankbar "
+    "gespräch kollegen projekt termin urlaub regen sonne spaziergang kopfschmerzen "
+    "meditation musik buch kochen abend morgen wochenende streit versöhnung ziel"
+).split()
+WORDS_EN = (
+    "work tired family friend sleep gym running stress calm anxiety joy grateful "
+    "conversation colleagues project deadline vacation rain sunshine walk headache "
+    "meditation music book cooking evening morning weekend argument reconciliation goal"
+).split()
+
+QUERIES = ["müde arbeit", "spaziergang -regen", '"schlecht geschlafen"', "tired work", "grateful OR calm"]
+
+
+def _seed(conn, rows: int, users: int, words_per_entry: int) -> None:
+    conn.execute(
+        text(
+            "CREATE TEMP TABLE journal_entries ("
+            " id uuid PRIMARY KEY, user_id uuid NOT NULL, text text NOT NULL,"
+            " mood_score int NOT NULL, energy_score int NOT NULL,"
+            " created_at timestamptz NOT NULL, language varchar(2) NOT NULL,"
+            f" search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED)"
+        )
+    )
+    conn.execute(
+        text(
+            """
+            INSERT INTO journal_entries (id, user_id, text, mood_score, energy_score, created_at, language)
+            SELECT
+                gen_random_uuid(),
+                ('00000000-0000-0000-0000-' || lpad(to_hex(i % :users), 12, '0'))::uuid,
+                (SELECT string_agg(
+                            CASE WHEN i % 4 = 0 THEN (:en)[1 + floor(random() * cardinality(:en))::int]
+                                 ELSE (:de)[1 + floor(random() * cardinality(:de))::int] END,
+                            ' ')
+                 FROM generate_series(1, :words) AS w WHERE i > 0),
+                1 + floor(random() * 10)::int,
+                1 + floor(random() * 10)::int,
+                now() - (random() * interval '730 days'),
+                CASE WHEN i % 4 = 0 THEN 'en' ELSE 'de' END
+            FROM generate_series(1, :rows) AS i
+            """
+        ),
+        {"rows": rows, "users": users, "words": words_per_entry, "en": WORDS_EN, "de": WORDS_DE},
+    )
+    conn.execute(text("CREATE INDEX ON journal_entries (user_id, created_at)"))
+    conn.execute(text("CREATE INDEX ON journal_entries USING gin (search_vector)"))
+    conn.execute(text("ANALYZE journal_entries"))
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--rows", type=int, default=1_000_000)
+    p.add_argument("--users", type=int, default=1_000)
+    p.add_argument("--words", type=int, default=60, help="Words per seeded entry")
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+
+    user_id = uuid.UUID(int=7)
+    with engine.connect() as conn:
+        t0 = time.perf_counter()
+        _seed(conn, args.rows, args.users, args.words)
+        conn.commit()
+        print(f"seeded {args.rows} entries for {args.users} users in {time.perf_counter() - t0:.1f}s")
+
+        db = Session(bind=conn)
+        print(f"{'query':<26} {'fts ms':>9} {'ilike ms':>9} {'hits':>5}")
+        for q in QUERIES:
+            hits = len(search_entries(db, user_id, q, 20, 0)[0])
+            fts_ms = _median_ms(lambda: search_entries(db, user_id, q, 20, 0), args.repeat)
+            term = q.split()[0].strip('"')
+            ilike_ms = _median_ms(
+                lambda: conn.execute(
+                    text(
+                        "SELECT id FROM journal_entries WHERE user_id = :u AND text ILIKE :t "
+                        "ORDER BY created_at DESC LIMIT 20"
+                    ),
+                    {"u": user_id, "t": f"%{term}%"},
+                ).fetchall(),
+                args.repeat,
+            )
+            print(f"{q:<26} {fts_ms:>9.2f} {ilike_ms:>9.2f} {hits:>5}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
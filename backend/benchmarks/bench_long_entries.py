@@ -0,0 +1,110 @@
+"""Latency and JSON-repair rate of the entry analysis across entry length buckets.
+
+Talks to the configured Groq model (GROQ_API_KEY must be set); no database is needed.
+
+    python -m benchmarks.bench_long_entries --runs 3
+    python -m benchmarks.bench_long_entries --buckets 1000,20000 --chunk-threshold 1000000  # single-pass baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import UTC, datetime
+
+import app.llm.parsers as parsers
+from app.core.config import settings
+from app.llm import fix_prompts
+from app.llm.chunking import estimate_tokens
+from app.llm.client import get_chat
+from app.models.journal_entry import JournalEntry
+from app.services.analysis_service import generate_analysis
+
+_FIX_PROMPTS = {
+    v for k, v in vars(fix_prompts).items() if k.endswith("_SYSTEM") and isinstance(v, str)
+}
+
+_PARAGRAPHS = [
+    "Heute Morgen bin ich schon müde aufgewacht. Die Nacht war unruhig, ich habe lange über das Projekt nachgedacht.",
+    "Im Büro war es laut, und die Deadline für Freitag macht mir Druck. Ich merke, dass ich kaum abschalten kann.",
+    "Am Nachmittag habe ich mit meiner Schwester telefoniert. Das tat gut, wir haben viel gelacht.",
+    "Beim Spaziergang am Abend war die Luft kühl, und mein Kopf wurde etwas ruhiger.",
+    "Ich frage mich, ob ich mir zu viel vornehme. Vielleicht darf ich auch mal Nein sagen.",
+]
+
+
+def _entry_text(chars: int) -> str:
+    parts: list[str] = []
+    i = 0
+    while sum(len(p) + 2 for p in parts) < chars:
+        parts.append(_PARAGRAPHS[i % len(_PARAGRAPHS)])
+        i += 1
+    return "\n\n".join(parts)[:chars]
+
+
+class _CountingChat:
+    def __init__(self, chat):
+        self._chat = chat
+        self.calls = 0
+        self.repairs = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        if messages and getattr(messages[0], "content", None) in _FIX_PROMPTS:
+            self.repairs += 1
+        return self._chat.invoke(messages)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--buckets", default="500,2000,5000,10000,20000", help="Entry lengths in characters")
+    p.add_argument("--runs", type=int, default=3, help="Analyses per bucket")
+    p.add_argument("--language", default="de", choices=["de", "en"])
+    p.add_argument("--chunk-threshold", type=int, default=None, help="Override ANALYSIS_CHUNK_THRESHOLD_TOKENS")
+    args = p.parse_args()
+
+    if args.chunk_threshold is not None:
+        settings.analysis_chunk_threshold_tokens = args.chunk_threshold
+
+    chat = _CountingChat(get_chat())
+    # Repairs inside parse_with_repair go through the parser module's own client.
+    parsers.get_chat = lambda: chat
+
+    print(f"chunk threshold: {settings.analysis_chunk_threshold_tokens} tokens")
+    print(f"{'chars':>7} {'~tokens':>8} {'p50 s':>7} {'max s':>7} {'calls/run':>10} {'repairs/run':>12}")
+    for chars in [int(x) for x in args.buckets.split(",") if x.strip()]:
+        text = _entry_text(chars)
+        latencies: list[float] = []
+        calls_before, repairs_before = chat.calls, chat.repairs
+        for _ in range(args.runs):
+            entry = JournalEntry(
+                id=uuid.uuid4(),
+                user_id=uuid.uuid4(),
+                text=text,
+                mood_score=5,
+                energy_score=4,
+                created_at=datetime.now(UTC),
+            )
+            t0 = time.perf_counter()
+            generate_analysis(
+                entry,
+                args.language,
+                scores_context="No prior entries.",
+                narrative_context="No prior entries.",
+                fallback_context=lambda: "No prior entries.",
+                chat=chat,
+            )
+            latencies.append(time.perf_counter() - t0)
+        calls = (chat.calls - calls_before) / args.runs
+        repairs = (chat.repairs - repairs_before) / args.runs
+        print(
+            f"{chars:>7} {estimate_tokens(text):>8} {statistics.median(latencies):>7.2f} "
+            f"{max(latencies):>7.2f} {calls:>10.1f} {repairs:>12.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""JSONB extraction vs typed pillar columns for analytical aggregates.
+
+Seeds a temporary table shaped like `entry_analysis` (nothing persistent is written) and
+times the same aggregates both ways against DATABASE_URL:
+
+    python -m benchmarks.bench_pillar_columns --rows 1000000 --users 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+PILLARS = ("geist", "herz", "seele", "koerper", "aura")
+
+_SEED = """
+INSERT INTO bench_analysis (user_id, created_at, pillar_scores, geist_score, herz_score, seele_score, koerper_score, aura_score)
+SELECT
+    s.user_id,
+    s.created_at,
+    jsonb_build_object('geist', s.g, 'herz', s.h, 'seele', s.s, 'koerper', s.k, 'aura', s.a),
+    s.g, s.h, s.s, s.k, s.a
+FROM (
+    SELECT
+        (i % :users) AS user_id,
+        now() - (random() * interval '365 days') AS created_at,
+        1 + floor(random() * 10)::int AS g,
+        1 + floor(random() * 10)::int AS h,
+        1 + floor(random() * 10)::int AS s,
+        1 + floor(random() * 10)::int AS k,
+        1 + floor(random() * 10)::int AS a
+    FROM generate_series(1, :rows) AS i
+) s
+"""
+
+_DROP_QUERY = """
+SELECT user_id FROM bench_analysis
+WHERE created_at >= now() - interval '60 days'
+GROUP BY user_id
+HAVING avg({recent}) FILTER (WHERE created_at >= now() - interval '30 days')
+     - avg({recent}) FILTER (WHERE created_at < now() - interval '30 days') <= -2
+"""
+
+QUERIES = {
+    "user 90d avg herz": (
+        "SELECT avg((pillar_scores->>'herz')::int) FROM bench_analysis "
+        "WHERE user_id = 42 AND created_at >= now() - interval '90 days'",
+        "SELECT avg(herz_score) FROM bench_analysis "
+        "WHERE user_id = 42 AND created_at >= now() - interval '90 days'",
+    ),
+    "all users 90d avg per pillar": (
+        "SELECT " + ", ".join(f"avg((pillar_scores->>'{p}')::int)" for p in PILLARS)
+        + " FROM bench_analysis WHERE created_at >= now() - interval '90 days'",
+        "SELECT " + ", ".join(f"avg({p}_score)" for p in PILLARS)
+        + " FROM bench_analysis WHERE created_at >= now() - interval '90 days'",
+    ),
+    "users whose koerper dropped": (
+        _DROP_QUERY.format(recent="(pillar_scores->>'koerper')::int"),
+        _DROP_QUERY.format(recent="koerper_score"),
+    ),
+}
+
+
+def _time(conn, sql: str, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        conn.execute(text(sql)).fetchall()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--rows", type=int, default=1_000_000)
+    p.add_argument("--users", type=int, default=5_000)
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(
+            text(
+                "CREATE TEMP TABLE bench_analysis ("
+                " id bigserial PRIMARY KEY, user_id int NOT NULL, created_at timestamptz NOT NULL,"
+                " pillar_scores jsonb NOT NULL,"
+                " geist_score smallint NOT NULL, herz_score smallint NOT NULL, seele_score smallint NOT NULL,"
+                " koerper_score smallint NOT NULL, aura_score smallint NOT NULL)"
+            )
+        )
+        t0 = time.perf_counter()
+        conn.execute(text(_SEED), {"rows": args.rows, "users": args.users})
+        conn.execute(text("CREATE INDEX ON bench_analysis (user_id, created_at)"))
+        conn.execute(
+            text(
+                "CREATE INDEX ON bench_analysis (user_id, created_at) "
+                "INCLUDE (geist_score, herz_score, seele_score, koerper_score, aura_score)"
+            )
+        )
+        conn.execute(text("VACUUM ANALYZE bench_analysis"))
+        print(f"seeded {args.rows} rows for {args.users} users in {time.perf_counter() - t0:.1f}s")
+
+        print(f"{'query':<32} {'jsonb ms':>10} {'typed ms':>10} {'speedup':>8}")
+        for name, (jsonb_sql, typed_sql) in QUERIES.items():
+            jsonb_ms = _time(conn, jsonb_sql, args.repeat)
+            typed_ms = _time(conn, typed_sql, args.repeat)
+            print(f"{name:<32} {jsonb_ms:>10.2f} {typed_ms:>10.2f} {jsonb_ms / typed_ms:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
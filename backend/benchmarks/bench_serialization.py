@@ -0,0 +1,140 @@
+"""Serialization cost per endpoint: validated pydantic path vs the trusted orjson path.
+
+No database or server: rows are synthetic and shaped like what the driver returns.
+
+- "validated": JSONB parsed by the driver (json.loads), response model built field by
+  field, validated again for `response_model`, dumped and encoded with the stdlib
+  (what the routes did before).
+- "trusted": JSONB kept as text and embedded as orjson fragments via payload_service,
+  rendered by FastJSONResponse.
+
+    python -m benchmarks.bench_serialization --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.responses import FastJSONResponse
+from app.schemas.analysis import EntryAnalysisOut
+from app.schemas.journal import JournalEntryOut
+from app.services.payload_service import analysis_payload, entry_payload
+
+_JSONB = {
+    "emotions": [{"name": "erschöpft", "intensity": 0.7}, {"name": "hoffnungsvoll", "intensity": 0.4}],
+    "themes": ["arbeit", "schlaf", "familie"],
+    "pillar_weights": {"geist": 0.3, "herz": 0.2, "seele": 0.2, "koerper": 0.2, "aura": 0.1},
+    "pillar_scores": {"geist": 4, "herz": 6, "seele": 5, "koerper": 3, "aura": 5},
+    "recommendations": {"daily": ["Kurzer Spaziergang", "Früher schlafen"], "weekly": ["Ein freier Abend"]},
+    "signals": {"keywords": ["deadline", "müde"], "phrases": ["kann nicht abschalten"], "triggers": ["projekt"]},
+    "risk_flags": {"self_harm": False, "crisis": False, "medical": False, "violence": False},
+}
+_NOW = datetime(2026, 10, 19, 8, 30, tzinfo=timezone.utc)
+
+
+def entry_row(i: int) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid.uuid4(), text=f"Eintrag {i}: " + "Heute war ein langer Tag. " * 40,
+                           mood_score=5, energy_score=4, created_at=_NOW)
+
+
+def analysis_row() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(), entry_id=uuid.uuid4(), user_id=uuid.uuid4(), language="de",
+        reflection="Danke, dass du das teilst. " * 20, rationale_summary="Signale: Druck, wenig Schlaf.",
+        created_at=_NOW, **{k: json.dumps(v) for k, v in _JSONB.items()},
+    )
+
+
+def _stdlib_render(content) -> bytes:
+    return JSONResponse(content).body
+
+
+def _validated_analysis(row) -> bytes:
+    parsed = {k: json.loads(getattr(row, k)) for k in _JSONB}  # driver-side JSONB decoding
+    out = EntryAnalysisOut(id=str(row.id), entry_id=str(row.entry_id), user_id=str(row.user_id),
+                           language=row.language, reflection=row.reflection,
+                           rationale_summary=row.rationale_summary, **parsed)
+    adapter = TypeAdapter(EntryAnalysisOut)
+    return _stdlib_render(adapter.dump_python(adapter.validate_python(out), mode="json"))
+
+
+def _validated_entries(rows) -> bytes:
+    items = [JournalEntryOut(**entry_payload(r)) for r in rows]
+    adapter = TypeAdapter(list[JournalEntryOut])
+    return _stdlib_render(adapter.dump_python(adapter.validate_python(items), mode="json"))
+
+
+def _validated_export(entries, analyses) -> bytes:
+    return _stdlib_render(
+        {
+            "journal_entries": [{**entry_payload(e), "created_at": e.created_at.isoformat()} for e in entries],
+            "analyses": [
+                {**{k: json.loads(getattr(a, k)) for k in _JSONB}, "id": str(a.id), "reflection": a.reflection}
+                for a in analyses
+            ],
+        }
+    )
+
+
+def _trusted_export(entries, analyses) -> bytes:
+    return FastJSONResponse(
+        {
+            "journal_entries": [{**entry_payload(e), "created_at": e.created_at.isoformat()} for e in entries],
+            "analyses": [analysis_payload(a) for a in analyses],
+        }
+    ).body
+
+
+def _median_us(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--repeat", type=int, default=200)
+    p.add_argument("--export-size", type=int, default=1000, help="Entries (and analyses) in the export case")
+    args = p.parse_args()
+
+    analysis = analysis_row()
+    entries_20 = [entry_row(i) for i in range(20)]
+    entries_100 = [entry_row(i) for i in range(100)]
+    export_entries = [entry_row(i) for i in range(args.export_size)]
+    export_analyses = [analysis_row() for _ in range(args.export_size)]
+    export_repeat = max(3, args.repeat // 20)
+
+    cases = [
+        ("GET /journal/{id}/analysis", args.repeat,
+         lambda: _validated_analysis(analysis), lambda: FastJSONResponse(analysis_payload(analysis)).body),
+        ("GET /journal?limit=20", args.repeat,
+         lambda: _validated_entries(entries_20), lambda: FastJSONResponse([entry_payload(r) for r in entries_20]).body),
+        ("GET /journal?limit=100", args.repeat,
+         lambda: _validated_entries(entries_100), lambda: FastJSONResponse([entry_payload(r) for r in entries_100]).body),
+        (f"GET /export ({args.export_size})", export_repeat,
+         lambda: _validated_export(export_entries, export_analyses),
+         lambda: _trusted_export(export_entries, export_analyses)),
+    ]
+
+    print(f"{'endpoint':<30} {'validated us':>13} {'trusted us':>11} {'speedup':>8}")
+    for name, repeat, slow, fast in cases:
+        slow_us = _median_us(slow, repeat)
+        fast_us = _median_us(fast, repeat)
+        print(f"{name:<30} {slow_us:>13.1f} {fast_us:>11.1f} {slow_us / fast_us:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
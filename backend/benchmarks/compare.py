@@ -0,0 +1,72 @@
+"""Compare a pytest-benchmark JSON run against benchmarks/baseline.json and flag regressions.
+
+    python -m pytest benchmarks/test_hot_paths.py --benchmark-only --benchmark-json=/tmp/bench.json
+    python -m benchmarks.compare /tmp/bench.json --threshold-pct 25
+    python -m benchmarks.compare /tmp/bench.json --update      # accept the run as the new baseline
+
+The baseline stores one median per benchmark in microseconds. Absolute numbers depend on
+the machine, so refresh it with --update on the machine that runs the comparison (e.g. the
+CI runner) before relying on it. Exit status 1 means at least one benchmark got slower than
+the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def load_run(path: Path) -> dict[str, float]:
+    """Benchmark name -> median in microseconds, from a --benchmark-json file."""
+
+    data = json.loads(path.read_text())
+    return {b["name"]: b["stats"]["median"] * 1e6 for b in data["benchmarks"]}
+
+
+def compare(current: dict[str, float], baseline: dict[str, float], threshold_pct: float) -> list[tuple]:
+    """(name, baseline_us, current_us, change_pct, status) rows; status is ok, REGRESSION, faster, new or missing."""
+
+    rows = []
+    for name in sorted(set(current) | set(baseline)):
+        old, new = baseline.get(name), current.get(name)
+        if old is None or new is None:
+            rows.append((name, old, new, None, "new" if old is None else "missing"))
+            continue
+        change = (new / old - 1) * 100
+        status = "REGRESSION" if change > threshold_pct else "faster" if change < -threshold_pct else "ok"
+        rows.append((name, old, new, change, status))
+    return rows
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("run", type=Path, help="JSON written by pytest --benchmark-json")
+    p.add_argument("--baseline", type=Path, default=BASELINE)
+    p.add_argument("--threshold-pct", type=float, default=25.0, help="Allowed slowdown of the median")
+    p.add_argument("--update", action="store_true", help="Write the run's medians as the new baseline")
+    args = p.parse_args()
+
+    current = load_run(args.run)
+    if args.update:
+        medians = {name: round(us, 3) for name, us in current.items()}
+        baseline = {"unit": "us", "statistic": "median", "benchmarks": medians}
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"wrote {len(current)} benchmarks to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["benchmarks"]
+    rows = compare(current, baseline, args.threshold_pct)
+    print(f"{'benchmark':<40} {'baseline us':>12} {'current us':>11} {'change':>8}  status")
+    for name, old, new, change, status in rows:
+        old_s = f"{old:.1f}" if old is not None else "-"
+        new_s = f"{new:.1f}" if new is not None else "-"
+        change_s = f"{change:+.0f}%" if change is not None else "-"
+        print(f"{name:<40} {old_s:>12} {new_s:>11} {change_s:>8}  {status}")
+    return 1 if any(status == "REGRESSION" for *_, status in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""pytest-benchmark suite for the pure-Python work done on every analysis, report or request.
+
+No database, network or LLM: the fixtures are shaped like real model outputs and rows.
+
+    python -m pytest benchmarks/test_hot_paths.py --benchmark-only --benchmark-json=/tmp/bench.json
+    python -m benchmarks.compare /tmp/bench.json            # exit 1 if slower than benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.responses import FastJSONResponse
+from app.core.security import _decode_token, create_access_token
+from app.llm.parsers import extract_json_object, parse_and_validate
+from app.schemas.analysis import EntryAnalysisLLMOutput, EntryAnalysisOut
+from app.schemas.common import Language
+from app.schemas.report import CurrentReportOut, TrendPoint
+from app.services.analysis_service import _strip_meta_labels
+from app.services.payload_service import analysis_payload
+
+_ANALYSIS = {
+    "emotions": [
+        {"name": "erschöpft", "intensity": 0.7},
+        {"name": "hoffnungsvoll", "intensity": 0.4},
+        {"name": "gereizt", "intensity": 0.3},
+    ],
+    "themes": ["arbeit", "schlaf", "familie"],
+    "pillar_weights": {"geist": 0.3, "herz": 0.2, "seele": 0.2, "koerper": 0.2, "aura": 0.1},
+    "pillar_scores": {"geist": 4, "herz": 6, "seele": 5, "koerper": 3, "aura": 5},
+    "reflection": "Danke, dass du das teilst. Es klingt, als hätte dich die Woche viel Kraft gekostet. " * 8,
+    "recommendations": {"daily": ["Kurzer Spaziergang", "Früher schlafen"], "weekly": ["Ein freier Abend"]},
+    "signals": {"keywords": ["deadline", "müde"], "phrases": ["kann nicht abschalten"], "triggers": ["projekt"]},
+    "rationale_summary": "Signale: Druck bei der Arbeit, wenig Schlaf, Rückhalt in der Familie.",
+    "risk_flags": {"self_harm": False, "crisis": False, "medical": False, "violence": False},
+}
+_ANALYSIS_JSON = json.dumps(_ANALYSIS, ensure_ascii=False, indent=2)
+
+LLM_OUTPUTS = {
+    "bare": _ANALYSIS_JSON,
+    "fenced": f"```json\n{_ANALYSIS_JSON}\n```",
+    "prose": f"Hier ist die Analyse des Eintrags:\n\n{_ANALYSIS_JSON}\n\nIch hoffe, das hilft dir weiter.",
+    # Long model chatter after the object: the regex runs to the end and backtracks to the last "}".
+    "trailing_prose": f"{_ANALYSIS_JSON}\n\n" + "Hinweis: Die Werte für Geist und Herz sind von 1 bis 10 skaliert. " * 300,
+    # Braces in the prose: a greedy `\{.*\}` spans prose and object and fails json.loads.
+    "braces_in_prose": f"Felder: {{geist}}, {{herz}}.\n```json\n{_ANALYSIS_JSON}\n```\nVorlage: {{\"summary\": ...}}",
+}
+
+_REFLECTION = (
+    "Was ich wahrnehme:\n"
+    "Kurz & freundlich: Du hast diese Woche viel getragen.\n"
+    + "Es ist verständlich, dass du müde bist. Gönn dir Pausen.\n" * 12
+    + "Summary: Achte auf deinen Schlaf."
+)
+
+
+@pytest.mark.benchmark(group="extract_json_object")
+@pytest.mark.parametrize("shape", LLM_OUTPUTS)
+def test_extract_json_object(benchmark, shape):
+    text = LLM_OUTPUTS[shape]
+    result = benchmark(extract_json_object, text)
+    assert json.loads(result)["themes"] == _ANALYSIS["themes"]
+
+
+@pytest.mark.benchmark(group="parse_and_validate")
+@pytest.mark.parametrize("shape", ["bare", "prose", "braces_in_prose"])
+def test_parse_and_validate(benchmark, shape):
+    result = benchmark(parse_and_validate, EntryAnalysisLLMOutput, LLM_OUTPUTS[shape])
+    assert result.pillar_scores.geist == 4
+
+
+@pytest.mark.benchmark(group="strip_meta_labels")
+def test_strip_meta_labels(benchmark):
+    result = benchmark(_strip_meta_labels, _REFLECTION)
+    assert not result.startswith("Was ich wahrnehme")
+
+
+@pytest.mark.benchmark(group="response_building")
+def test_entry_analysis_out(benchmark):
+    ids = {"id": str(uuid.uuid4()), "entry_id": str(uuid.uuid4()), "user_id": str(uuid.uuid4())}
+
+    def build() -> bytes:
+        out = EntryAnalysisOut(**ids, language=Language.de, **_ANALYSIS)
+        return FastJSONResponse(out.model_dump(mode="json")).body
+
+    assert b"ersch" in benchmark(build)
+
+
+@pytest.mark.benchmark(group="response_building")
+def test_analysis_payload(benchmark):
+    row = SimpleNamespace(
+        id=uuid.uuid4(),
+        entry_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        language="de",
+        reflection=_ANALYSIS["reflection"],
+        rationale_summary=_ANALYSIS["rationale_summary"],
+        **{k: json.dumps(v) for k, v in _ANALYSIS.items() if k not in ("reflection", "rationale_summary")},
+    )
+    assert b"ersch" in benchmark(lambda: FastJSONResponse(analysis_payload(row)).body)
+
+
+@pytest.mark.benchmark(group="response_building")
+def test_current_report_out(benchmark):
+    end = date(2026, 10, 19)
+    series = [
+        {"date": end - timedelta(days=6 - i), "geist": 4 + i % 3, "herz": 6, "seele": 5, "koerper": 3 + i % 2, "aura": 5}
+        for i in range(7)
+    ]
+
+    def build() -> bytes:
+        out = CurrentReportOut(
+            language=Language.de,
+            week_start_date=end - timedelta(days=6),
+            week_end_date=end,
+            pillar_scores_avg=_ANALYSIS["pillar_scores"],
+            pillar_trends={"geist": "down", "herz": "flat", "seele": "flat", "koerper": "down", "aura": "up"},
+            recurring_patterns=["Wenig Schlaf vor Deadlines", "Abends Grübeln"],
+            correlations=["Bewegung hebt die Stimmung am nächsten Tag"],
+            summary="Eine fordernde Woche mit wenig Erholung. " * 6,
+            daily_recommendation="Vor dem Schlafen zehn Minuten ohne Bildschirm.",
+            weekly_goal="Zwei Abende bewusst frei halten.",
+            series=[TrendPoint(**p) for p in series],
+        )
+        return FastJSONResponse(out.model_dump(mode="json")).body
+
+    assert b"week_start_date" in benchmark(build)
+
+
+@pytest.mark.benchmark(group="jwt")
+def test_jwt_encode(benchmark):
+    token = benchmark(create_access_token, user_id=str(uuid.uuid4()), email="bench@example.com")
+    assert token.count(".") == 2
+
+
+@pytest.mark.benchmark(group="jwt")
+def test_jwt_decode(benchmark):
+    token = create_access_token(user_id=str(uuid.uuid4()), email="bench@example.com")
+    assert benchmark(_decode_token, token)["email"] == "bench@example.com"
@@ -0,0 +1,96 @@
+"""Production server profile: `gunicorn -c gunicorn.conf.py app.main:app` (start.sh does this).
+
+Environment:
+    WEB_CONCURRENCY                 worker processes (default: CPU count)
+    GUNICORN_PRELOAD                import the app once in the master and fork (default: true)
+    GUNICORN_MAX_REQUESTS(_JITTER)  recycle a worker after ~N requests (default: 2000 +- 200)
+    GUNICORN_TIMEOUT                seconds before a silent worker is killed (default: 120)
+    GUNICORN_GRACEFUL_TIMEOUT       seconds a stopping worker gets to finish (default: 60)
+    DB_MAX_CONNECTIONS              Postgres max_connections; read from the server when unset
+    UVICORN_LOOP / UVICORN_HTTP     event loop / HTTP parser (default: uvloop / httptools)
+
+Workers size their DB pools from DB_MAX_CONNECTIONS and WEB_CONCURRENCY (app/core/database.py),
+so this module resolves both before the app is imported and exports them.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    return int(value) if value else default
+
+
+def _server_max_connections() -> int | None:
+    """max_connections minus the superuser-reserved slots, or None if the DB is unreachable."""
+
+    url = os.environ.get("DATABASE_URL", "")
+    if not url:
+        return None
+    # libpq does not understand SQLAlchemy driver suffixes (postgresql+psycopg://).
+    url = url.replace("+psycopg2://", "://").replace("+psycopg://", "://")
+    try:
+        import psycopg
+
+        with psycopg.connect(url, connect_timeout=5) as conn:
+            row = conn.execute(
+                "SELECT current_setting('max_connections')::int"
+                " - current_setting('superuser_reserved_connections')::int"
+            ).fetchone()
+    except Exception as exc:  # noqa: BLE001
+        print(f"gunicorn.conf: could not read max_connections ({exc}); using the default", file=sys.stderr)
+        return None
+    return int(row[0])
+
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = _env_int("WEB_CONCURRENCY", multiprocessing.cpu_count())
+worker_class = "app.core.workers.UvicornWorker"
+
+# Imports (langchain, pydantic models, numpy) happen once and are shared copy-on-write.
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() not in ("0", "false", "no")
+
+# Recycle workers to bound slow memory growth; the jitter keeps them from restarting together.
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 2000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 200)
+
+timeout = _env_int("GUNICORN_TIMEOUT", 120)
+# POST /api/journal runs the entry's analysis (several LLM calls) inside the request, so a
+# draining worker (recycled or redeployed) needs time to finish requests still waiting on the LLM.
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 60)
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+
+os.environ["WEB_CONCURRENCY"] = str(workers)
+if not os.environ.get("DB_MAX_CONNECTIONS", "").strip():
+    detected = _server_max_connections()
+    if detected is not None:
+        os.environ["DB_MAX_CONNECTIONS"] = str(detected)
+
+
+def post_fork(server, worker) -> None:
+    # With preload the engine was created in the master; never share its pooled sockets.
+    from app.core.database import engine
+
+    engine.dispose(close=False)
+
+    # LLM_REQUESTS_PER_MINUTE is a process-wide budget; split it so all workers together keep it.
+    from app.core.config import settings
+    from app.llm.client import set_llm_rate_limit
+
+    if settings.llm_requests_per_minute > 0:
+        set_llm_rate_limit(max(1, settings.llm_requests_per_minute // max(1, settings.web_concurrency)))
+
+
+def when_ready(server) -> None:
+    # The app imports langchain lazily; with preload, import it once in the master before
+    # forking so workers share it (their /healthz warm-up then only builds the client).
+    if preload_app:
+        import langchain_core.messages  # noqa: F401
+        import langchain_groq  # noqa: F401
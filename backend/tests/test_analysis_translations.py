@@ -0,0 +1,111 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services import translation_service
+from app.services.language_utils import translate_batch, translate_lines
+from app.services.translation_service import flatten_analysis, translate_analyses, unflatten_analysis
+
+
+def _analysis(reflection="Danke fürs Teilen.") -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        updated_at=datetime(2026, 10, 19, tzinfo=timezone.utc),
+        reflection=reflection,
+        rationale_summary="Signale: Druck.",
+        emotions=[{"name": "müde", "intensity": 0.7}, {"name": "hoffnungsvoll", "intensity": 0.4}],
+        themes=["arbeit", "schlaf"],
+        recommendations={"daily": ["Spaziergang"], "weekly": []},
+        signals={"keywords": ["deadline"], "phrases": [], "triggers": ["projekt"]},
+    )
+
+
+class _UpperChat:
+    """Stands in for the LLM: "translates" by upper-casing every line."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        payload = json.loads(messages[-1].content.split("Input JSON:\n", 1)[1])
+        return SimpleNamespace(content=json.dumps({"lines": [line.upper() for line in payload["lines"]]}))
+
+
+class _FakeSession:
+    def __init__(self) -> None:
+        self.rows = []
+
+    def execute(self, stmt):
+        self.rows.extend(stmt.compile().params.items())
+
+    def commit(self):
+        pass
+
+
+def test_flatten_and_unflatten_round_trip():
+    a = _analysis()
+    lines, layout = flatten_analysis(a)
+    assert len(lines) == layout.size == 2 + 2 + 2 + 1 + 0 + 1 + 0 + 1
+    out = unflatten_analysis(a, [line.upper() for line in lines], layout)
+    assert out["reflection"] == "DANKE FÜRS TEILEN."
+    assert out["emotions"] == [{"name": "MÜDE", "intensity": 0.7}, {"name": "HOFFNUNGSVOLL", "intensity": 0.4}]
+    assert out["themes"] == ["ARBEIT", "SCHLAF"]
+    assert out["recommendations"] == {"daily": ["SPAZIERGANG"], "weekly": []}
+    assert out["signals"] == {"keywords": ["DEADLINE"], "phrases": [], "triggers": ["PROJEKT"]}
+
+
+def test_empty_translated_line_keeps_the_original():
+    a = _analysis()
+    lines, layout = flatten_analysis(a)
+    out = unflatten_analysis(a, ["", *lines[1:]], layout)
+    assert out["reflection"] == a.reflection
+
+
+def test_analyses_are_translated_in_batches(monkeypatch):
+    monkeypatch.setattr(settings, "translation_batch_chars", 500)
+    analyses = [_analysis("Ein langer Tag. " * 10) for _ in range(6)]  # ~230 chars each
+    chat = _UpperChat()
+    stored, failed = translate_analyses(_FakeSession(), chat, analyses, "en")
+    assert (stored, failed) == (6, 0)
+    assert chat.calls == 3
+
+
+def test_failed_batch_is_reported_and_skipped(monkeypatch):
+    def broken(chat, lines, language):
+        raise ValueError("misaligned")
+
+    monkeypatch.setattr(translation_service, "translate_batch", broken)
+    assert translate_analyses(_FakeSession(), _UpperChat(), [_analysis()], "en") == (0, 1)
+
+
+def test_batches_are_capped_by_the_output_budget(monkeypatch):
+    monkeypatch.setattr(settings, "translation_batch_chars", 100_000)
+    size = sum(len(line) for line in flatten_analysis(_analysis("Ein langer Tag. " * 60))[0])
+    analyses = [_analysis("Ein langer Tag. " * 60) for _ in range(8)]  # ~1000 chars each
+    chat = _UpperChat()
+    translate_analyses(_FakeSession(), chat, analyses, "en")
+    per_batch = translation_service.MAX_BATCH_CHARS // size
+    assert chat.calls == -(-len(analyses) // per_batch) > 1
+
+
+class _PaddedChat:
+    """Translates correctly but appends an empty line, as models sometimes do."""
+
+    def invoke(self, messages):
+        payload = json.loads(messages[-1].content.split("Input JSON:\n", 1)[1])
+        return SimpleNamespace(content=json.dumps({"lines": [*(line.upper() for line in payload["lines"]), ""]}))
+
+
+def test_translate_lines_ignores_empty_reply_lines():
+    assert translate_lines(_PaddedChat(), ["müde", "arbeit"], "en", max_items=5) == ["MÜDE", "ARBEIT"]
+
+
+def test_translate_batch_counts_empty_reply_lines():
+    with pytest.raises(ValueError):
+        translate_batch(_PaddedChat(), ["müde", "arbeit"], "en")
@@ -0,0 +1,77 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.llm.chunking import estimate_tokens, split_into_chunks
+from app.services.analysis_service import _condense_long_entry
+
+
+class _FakeChat:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        payload = {
+            "summary": f"digest {self.calls}",
+            "emotions": [{"name": "tired", "intensity": 0.6}],
+            "themes": ["work"],
+            "signals": {"keywords": [], "phrases": [], "triggers": ["deadline"]},
+        }
+        return SimpleNamespace(content=json.dumps(payload))
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("a" * 401) == 101
+
+
+def test_split_respects_budget_and_keeps_text():
+    paragraphs = [f"Paragraph {i}. " + "Sentence here. " * 30 for i in range(20)]
+    text = "\n\n".join(paragraphs)
+    chunks = split_into_chunks(text, max_tokens=200)
+    assert len(chunks) > 1
+    assert all(len(c) <= 200 * 4 for c in chunks)
+    assert "".join(chunks).replace("\n", "").replace(" ", "") == text.replace("\n", "").replace(" ", "")
+
+
+def test_split_hard_cuts_unbroken_text():
+    chunks = split_into_chunks("x" * 1000, max_tokens=50)
+    assert [len(c) for c in chunks] == [200] * 5
+
+
+def test_short_entry_is_not_condensed():
+    chat = _FakeChat()
+    assert _condense_long_entry(chat, "Heute war ein guter Tag.", "de") == "Heute war ein guter Tag."
+    assert chat.calls == 0
+
+
+def test_long_entry_is_condensed_per_chunk():
+    chat = _FakeChat()
+    text = "\n\n".join("Ein langer Absatz über die Arbeit. " * 40 for _ in range(20))
+    condensed = _condense_long_entry(chat, text, "de")
+    assert chat.calls == len(split_into_chunks(text, 1200))
+    assert chat.calls > 1
+    assert "Part 1: digest" in condensed
+    assert "Triggers noticed: deadline" in condensed
+    assert len(condensed) < len(text) // 4
+
+
+class _DownChat:
+    def invoke(self, messages):
+        raise ConnectionError("provider unavailable")
+
+
+_LONG_TEXT = "\n\n".join("Ein langer Absatz über die Arbeit. " * 40 for _ in range(20))
+
+
+def test_failed_digest_keeps_the_head_of_the_chunk():
+    condensed = _condense_long_entry(_DownChat(), _LONG_TEXT, "de")
+    assert "Part 1: Ein langer Absatz" in condensed
+
+
+def test_failed_digest_raises_without_fallback():
+    # Bulk re-analysis must not replace a stored analysis with one built from truncated chunks.
+    with pytest.raises(ConnectionError):
+        _condense_long_entry(_DownChat(), _LONG_TEXT, "de", allow_fallback=False)
@@ -0,0 +1,71 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, choose_encoding, skip_compression
+
+_BIG = {"reflection": "Danke, dass du das teilst. " * 200}
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+
+@app.get("/big")
+def big():
+    return _BIG
+
+
+@app.get("/small")
+def small():
+    return {"ok": True}
+
+
+@app.get("/raw")
+@skip_compression
+def raw():
+    return _BIG
+
+
+@app.get("/stream")
+def stream():
+    def body():
+        yield b"["
+        for i in range(50):
+            yield (b"," if i else b"") + b'{"i": %d, "text": "Heute war ein langer Tag."}' % i
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+client = TestClient(app)
+
+
+def test_choose_encoding_respects_q_values_and_prefers_brotli():
+    assert choose_encoding("gzip, br", brotli_available=True) == "br"
+    assert choose_encoding("gzip, br", brotli_available=False) == "gzip"
+    assert choose_encoding("br;q=0.5, gzip", brotli_available=True) == "gzip"
+    assert choose_encoding("identity", brotli_available=True) is None
+    assert choose_encoding("*;q=0", brotli_available=True) is None
+
+
+def test_large_json_is_gzipped_with_length_and_vary():
+    r = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in r.headers["vary"]
+    assert int(r.headers["content-length"]) < len(r.content)
+    assert r.json() == _BIG
+
+
+def test_below_threshold_and_opted_out_routes_are_not_compressed():
+    assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/raw", headers={"Accept-Encoding": "gzip"}).headers
+
+
+def test_streaming_response_is_compressed_incrementally():
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as r:
+        raw = b"".join(r.iter_raw())
+    assert r.headers["content-encoding"] == "gzip"
+    assert "content-length" not in r.headers
+    assert gzip.decompress(raw).startswith(b'[{"i": 0')
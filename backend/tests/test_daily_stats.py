@@ -0,0 +1,44 @@
+from datetime import date
+
+from app.models.daily_user_stats import DailyUserStats
+from app.services.stats_service import bucket_days_for, pillar_means, summarize
+
+
+def _row(day: int, count: int, pillar_sum: int, mood_sum: int) -> DailyUserStats:
+    return DailyUserStats(
+        day=date(2026, 1, day),
+        entry_count=count,
+        mood_min=1,
+        mood_max=10,
+        mood_sum=mood_sum,
+        energy_min=1,
+        energy_max=10,
+        energy_sum=5 * count,
+        geist_sum=pillar_sum,
+        herz_sum=pillar_sum,
+        seele_sum=pillar_sum,
+        koerper_sum=pillar_sum,
+        aura_sum=pillar_sum,
+    )
+
+
+def test_pillar_means_divide_by_entry_count():
+    assert pillar_means(_row(1, 2, 14, 8))["geist"] == 7
+
+
+def test_summarize_weights_days_by_entries():
+    rows = [_row(1, 1, 2, 2), _row(2, 3, 24, 24)]
+    out = summarize(rows)
+    assert out["entry_count"] == 4
+    assert out["mood_avg"] == 6.5
+    assert out["pillar_scores_avg"]["herz"] == 6.5
+
+
+def test_summarize_empty_range():
+    assert summarize([]) == {"entry_count": 0, "mood_avg": None, "energy_avg": None, "pillar_scores_avg": {}}
+
+
+def test_bucket_days_cover_range_in_at_most_points_buckets():
+    assert bucket_days_for(7, 60) == 1
+    assert bucket_days_for(90, 60) == 2
+    assert bucket_days_for(366, 60) == 7
@@ -0,0 +1,21 @@
+from app.core.database import MAX_CONNECTIONS_PER_WORKER, pool_limits
+
+
+def test_pools_of_all_workers_fit_max_connections():
+    for workers in (1, 2, 3, 4, 8, 16):
+        pool_size, max_overflow = pool_limits(100, 10, workers)
+        assert pool_size >= 1
+        assert workers * (pool_size + max_overflow) <= 90
+
+
+def test_share_is_split_between_pool_and_overflow():
+    assert pool_limits(100, 10, 4) == (11, 11)
+
+
+def test_single_worker_is_capped():
+    pool_size, max_overflow = pool_limits(500, 10, 1)
+    assert pool_size + max_overflow == MAX_CONNECTIONS_PER_WORKER
+
+
+def test_tiny_server_still_gets_a_connection_per_worker():
+    assert pool_limits(10, 10, 4) == (1, 1)
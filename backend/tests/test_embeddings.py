@@ -0,0 +1,76 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.llm.embeddings import DIM, embed, quantize, stack, top_k
+from app.services.embedding_service import find_similar_entries
+
+
+def test_embed_is_deterministic_unit_vector():
+    a = embed("Stress bei der Arbeit wegen der Deadline")
+    assert a.shape == (DIM,)
+    assert np.isclose(np.linalg.norm(a), 1.0, atol=1e-5)
+    assert np.array_equal(a, embed("Stress bei der Arbeit wegen der Deadline"))
+
+
+def test_embed_without_content_words_is_zero():
+    assert not embed("und die der 123").any()
+
+
+def test_top_k_ranks_related_entry_first_on_quantized_vectors():
+    stored = [
+        "Schöner Spaziergang im Wald mit meiner Schwester",
+        "Projekt Deadline macht Stress bei der Arbeit",
+        "Gut geschlafen, ruhiger Morgen mit Kaffee",
+    ]
+    matrix = stack([quantize(embed(t)) for t in stored])
+    idx, scores = top_k(matrix, embed("Arbeit war stressig, die Deadline im Projekt drückt"), 2)
+    assert idx[0] == 1
+    assert scores[0] > scores[1]
+
+
+def test_top_k_handles_empty_and_small_inputs():
+    assert top_k(stack([]), embed("arbeit"), 3)[0].size == 0
+    idx, _ = top_k(stack([quantize(embed("arbeit"))]), embed("arbeit"), 5)
+    assert idx.tolist() == [0]
+
+
+class _EmbeddingSession:
+    """Stored vectors of one user; the vector query is answered by applying its filters."""
+
+    def __init__(self, entries) -> None:
+        self.entries = {e.id: e for e in entries}
+
+    def execute(self, stmt):
+        params = stmt.compile().params
+        if "created_at_1" in params:
+            rows = [
+                SimpleNamespace(entry_id=e.id, vector=quantize(embed(e.text)))
+                for e in self.entries.values()
+                if e.id != params["entry_id_1"] and e.created_at < params["created_at_1"]
+            ]
+        else:
+            rows = [SimpleNamespace(**vars(e)) for e in self.entries.values() if e.id in params["id_1"]]
+        return SimpleNamespace(all=lambda: rows)
+
+
+def _entry(text, day):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        created_at=datetime(2026, 10, day, tzinfo=timezone.utc),
+        mood_score=5,
+        energy_score=5,
+        text=text,
+    )
+
+
+def test_similar_entries_are_older_than_the_entry():
+    older = _entry("Streit mit meiner Schwester wegen der Arbeit", 1)
+    entry = _entry("Wieder Streit mit meiner Schwester", 5)
+    later = _entry("Streit mit meiner Schwester, schon wieder", 9)
+    db = _EmbeddingSession([older, entry, later])
+
+    hits = find_similar_entries(db, uuid.uuid4(), entry.text, entry.id, 5, 0.0, before=entry.created_at)
+    assert [row.id for _, row in hits] == [older.id]
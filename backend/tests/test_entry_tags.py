@@ -0,0 +1,21 @@
+from app.services.tag_service import normalize_tag, tags_from_analysis
+
+
+def test_normalize_tag_lowercases_and_collapses_whitespace():
+    assert normalize_tag("  Work\t  Deadline ") == "work deadline"
+
+
+def test_tags_from_analysis_covers_themes_and_signals_and_dedupes():
+    tags = tags_from_analysis(
+        ["Arbeit", "arbeit ", ""],
+        {"keywords": ["Stress"], "phrases": [], "triggers": ["Work deadline", "work  deadline"]},
+    )
+    assert tags == [
+        ("theme", "arbeit", "Arbeit"),
+        ("keyword", "stress", "Stress"),
+        ("trigger", "work deadline", "Work deadline"),
+    ]
+
+
+def test_tags_from_analysis_tolerates_missing_signals():
+    assert tags_from_analysis([], {}) == []
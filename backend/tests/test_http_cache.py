@@ -0,0 +1,19 @@
+from app.core.http_cache import etag_matches, make_etag
+
+
+def test_make_etag_is_strong_by_default_and_stable():
+    tag = make_etag("trends", 1, "2026-01-01")
+    assert tag.startswith('"')
+    assert make_etag("trends", weak=True) == f"W/{make_etag('trends')}"
+    assert tag == make_etag("trends", 1, "2026-01-01")
+    assert tag != make_etag("trends", 2, "2026-01-01")
+
+
+def test_etag_matches_weak_comparison_and_lists():
+    tag = make_etag("x")
+    assert etag_matches(tag, tag)
+    assert etag_matches(f"W/{tag}", tag)
+    assert etag_matches(f'"other", {tag}', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches('"other"', tag)
+    assert not etag_matches(None, tag)
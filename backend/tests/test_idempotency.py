@@ -0,0 +1,49 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.idempotency_service import (
+    STATUS_IN_PROGRESS,
+    IdempotencyKeyInProgress,
+    begin_request,
+)
+
+
+class _StaleKeySession:
+    """Holds one stale in-progress key; `won` decides whether the conditional UPDATE matches."""
+
+    def __init__(self, won: bool) -> None:
+        self.won = won
+        self.statements = []
+        self.record = SimpleNamespace(
+            request_hash="h",
+            status=STATUS_IN_PROGRESS,
+            created_at=datetime.now(UTC) - timedelta(seconds=settings.idempotency_lock_timeout_seconds + 1),
+            expires_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+
+    def get(self, _model, _pk, **kwargs):
+        return self.record
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(first=lambda: ("k",) if self.won else None)
+
+    def commit(self):
+        pass
+
+
+def test_stale_key_takeover_is_conditional_on_the_claim_read():
+    db = _StaleKeySession(won=True)
+    assert begin_request(db, uuid.uuid4(), "k", "h") is None
+    where = str(db.statements[0].whereclause)
+    assert "idempotency_keys.created_at = :created_at_1" in where
+    assert "idempotency_keys.status" in where
+
+
+def test_only_one_worker_takes_over_a_stale_key():
+    with pytest.raises(IdempotencyKeyInProgress):
+        begin_request(_StaleKeySession(won=False), uuid.uuid4(), "k", "h")
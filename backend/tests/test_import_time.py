@@ -0,0 +1,41 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parents[1]
+# Cumulative `import app.main` time; generous so slow CI machines pass, tight enough to
+# catch the LLM stack (~0.5-1s) coming back to module level. Override with IMPORT_BUDGET_MS.
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "2500"))
+LAZY_PREFIXES = ("langchain", "langchain_core", "langchain_groq", "groq", "langsmith")
+
+
+def _import_app_main() -> tuple[str, str]:
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, app.main; print(','.join(sorted(sys.modules)))",
+        ],
+        cwd=BACKEND,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return proc.stdout, proc.stderr
+
+
+def test_app_import_does_not_load_llm_stack():
+    stdout, _ = _import_app_main()
+    loaded = [m for m in stdout.strip().split(",") if m.split(".")[0] in LAZY_PREFIXES]
+    assert loaded == []
+
+
+def test_app_import_within_budget():
+    _, stderr = _import_app_main()
+    m = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| app\.main$", stderr, re.MULTILINE)
+    assert m, "app.main missing from -X importtime output"
+    assert int(m.group(1)) / 1000.0 < IMPORT_BUDGET_MS
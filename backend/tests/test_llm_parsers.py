@@ -1,8 +1,10 @@
 import json
+import random
 
 import pytest
 
-from app.llm.parsers import extract_json_object, parse_and_validate
+from app.llm.parsers import _span_end, extract_json_object, parse_and_validate
+from app.services.analysis_service import _NarrativeOut, _SignalsAndScoresOut
 from app.schemas.analysis import EntryAnalysisLLMOutput
 
 
@@ -39,3 +41,143 @@ def test_parse_and_validate_invalid_json():
     raw = "not json"
     with pytest.raises((json.JSONDecodeError, ValueError)):
         parse_and_validate(EntryAnalysisLLMOutput, raw)
+
+
+def test_extract_json_object_ignores_braces_in_trailing_prose():
+    text = '{"themes": ["arbeit"]}\n\nHinweis: Felder wie {geist} sind 1-10 skaliert.'
+    assert extract_json_object(text) == '{"themes": ["arbeit"]}'
+
+
+def test_extract_json_object_returns_first_of_several_objects():
+    text = 'Analyse: {"a": 1}\nAlternative: {"a": 2}'
+    assert extract_json_object(text) == '{"a": 1}'
+
+
+def test_extract_json_object_skips_candidates_that_do_not_parse():
+    text = 'Schema {geist, herz} und {"ok": true}'
+    assert extract_json_object(text) == '{"ok": true}'
+
+
+def test_extract_json_object_braces_and_quotes_inside_strings():
+    obj = '{"reflection": "Sie sagte \\"{nicht jetzt}\\" und ging } weg", "n": [1, {"x": "\\\\"}]}'
+    assert extract_json_object(f"```json\n{obj}\n```\nFertig.") == obj
+
+
+def test_extract_json_object_unclosed_brace_is_not_searched():
+    # An unclosed `{` may be a truncated reply; its inner objects must not be taken instead.
+    with pytest.raises(ValueError):
+        extract_json_object('Ein { offenes "Zitat und dann {"a": {"b": 2}}')
+
+
+def test_extract_json_object_does_not_return_objects_nested_in_a_failed_candidate():
+    assert extract_json_object('{ siehe unten: {"a": 1} } Ende') == '{ siehe unten: {"a": 1} }'
+    with pytest.raises(json.JSONDecodeError):
+        parse_and_validate(_NarrativeOut, '{ siehe unten: {"reflection": "x"} } Ende')
+
+
+def test_parse_and_validate_truncated_narrative_fails():
+    raw = (
+        '{"reflection":"Das klingt sehr schwer.","recommendations":{"daily":["Pause"],"weekly":[]},'
+        '"rationale_summary":"Hinweise auf Selbstgefährdung.","risk_flags":{"self_harm":true,"cri'
+    )
+    with pytest.raises(ValueError):
+        parse_and_validate(_NarrativeOut, raw)
+
+
+def test_parse_and_validate_truncated_scores_fail():
+    raw = (
+        '{"emotions":[{"name":"traurig","intensity":0.8}],"themes":["verlust"],'
+        '"pillar_weights":{"geist":0.2,"herz":0.4,"seele":0.2,"koerper":0.1,"aura":0.1},'
+        '"pillar_scores":{"geist":3,"herz":2,"seele":3,"koerper":4,"aura":3},"signals":{"keywords":["trau'
+    )
+    with pytest.raises(ValueError):
+        parse_and_validate(_SignalsAndScoresOut, raw)
+
+
+def test_parse_and_validate_rejects_object_without_model_fields():
+    with pytest.raises(ValueError):
+        parse_and_validate(_NarrativeOut, 'Beispiel: {"daily": ["Pause"], "weekly": []}')
+
+
+def test_parse_and_validate_skips_example_object_before_the_answer():
+    text = (
+        'Format der Empfehlungen: {"daily": ["..."], "weekly": ["..."]}\n\n'
+        '{"reflection": "Danke fürs Teilen.", "recommendations": {"daily": ["Pause"], "weekly": []}}'
+    )
+    result = parse_and_validate(_NarrativeOut, text)
+    assert result.reflection == "Danke fürs Teilen."
+    assert result.recommendations.daily == ["Pause"]
+
+
+def test_parse_and_validate_truncated_answer_after_example_raises_json_error():
+    text = 'Beispiel: {"daily": []}\n{"reflection": "Danke", "recommendations": {"daily": [,]}}'
+    with pytest.raises(json.JSONDecodeError):
+        parse_and_validate(_NarrativeOut, text)
+
+
+def test_extract_json_object_no_object():
+    with pytest.raises(ValueError):
+        extract_json_object("Keine Daten } hier {")
+
+
+def test_parse_and_validate_invalid_candidate_raises_json_error():
+    with pytest.raises(json.JSONDecodeError):
+        parse_and_validate(EntryAnalysisLLMOutput, 'Antwort: {"emotions": [,]}')
+
+
+def _reference_span_end(text: str, start: int) -> int | None:
+    """Character-by-character version of _span_end, for the fuzz test."""
+
+    depth, in_string, escaped = 0, False, False
+    for pos in range(start, len(text)):
+        ch = text[pos]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+    return None
+
+
+def _random_value(rng: random.Random, depth: int = 0):
+    kind = rng.randrange(6 if depth < 3 else 3)
+    if kind == 0:
+        return rng.choice([None, True, False, rng.randint(-100, 100), rng.random()])
+    if kind in (1, 2):
+        return "".join(rng.choice('ab {}[]"\\\n:,äß`') for _ in range(rng.randrange(12)))
+    if kind == 3:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    return {f"k{i}{_random_value(rng, 3)}": _random_value(rng, depth + 1) for i in range(rng.randrange(4))}
+
+
+# No unclosed `{` in the prose: everything after it is treated as a truncated object.
+_PROSE = ["Hier ist die Analyse:", "```json", "```", "Felder wie {geist}", "ein } zu viel", "Er sagte \"hi\"", "\\n", "Fertig."]
+
+
+def test_span_end_matches_reference_on_random_text():
+    rng = random.Random(1234)
+    for _ in range(2000):
+        text = "".join(rng.choice('{}"\\ab ') for _ in range(rng.randrange(40)))
+        for start in (i for i, ch in enumerate(text) if ch == "{"):
+            assert _span_end(text, start) == _reference_span_end(text, start)
+
+
+def test_extract_json_object_fuzz_prose_around_object():
+    rng = random.Random(4321)
+    for _ in range(500):
+        obj = {f"k{i}": _random_value(rng) for i in range(rng.randrange(1, 5))}
+        encoded = json.dumps(obj, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 2]))
+        before = " ".join(rng.choice(_PROSE) for _ in range(rng.randrange(4)))
+        after = " ".join(rng.choice(_PROSE) for _ in range(rng.randrange(4)))
+        text = f"{before}\n{encoded}\n{after}"
+        assert json.loads(extract_json_object(text)) == obj, text
@@ -0,0 +1,49 @@
+import pytest
+
+from app.core.rate_limit import KeyedTokenBuckets, TokenBucket, parse_rate
+
+
+def test_bucket_allows_burst_then_reports_wait():
+    bucket = TokenBucket(rate=1.0, capacity=3)
+    assert [bucket.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    wait = bucket.try_acquire()
+    assert 0 < wait <= 1.0
+
+
+def test_bucket_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_keyed_buckets_are_independent_per_key():
+    buckets = KeyedTokenBuckets(rate=0.01, capacity=2)
+    assert [buckets.try_acquire("a") for _ in range(2)] == [0.0, 0.0]
+    assert buckets.try_acquire("a") > 0
+    assert buckets.try_acquire("b") == 0.0
+
+
+def test_released_tokens_are_returned_up_to_capacity():
+    buckets = KeyedTokenBuckets(rate=0.01, capacity=1)
+    assert buckets.try_acquire("a") == 0.0
+    buckets.release("a")
+    buckets.release("a")
+    assert buckets.try_acquire("a") == 0.0
+    assert buckets.try_acquire("a") > 0
+
+
+def test_keyed_buckets_evict_least_recently_used():
+    buckets = KeyedTokenBuckets(rate=0.01, capacity=1, max_keys=2)
+    for key in ("a", "b", "c"):
+        buckets.try_acquire(key)
+    assert len(buckets) == 2
+    assert buckets.try_acquire("a") == 0.0  # evicted, so it starts with a full bucket again
+
+
+def test_parse_rate():
+    assert parse_rate("30/hour") == (30, 3600.0)
+    assert parse_rate("5/10min") == (5, 600.0)
+    assert parse_rate("100/day") == (100, 86400.0)
+    assert parse_rate("") is None
+    assert parse_rate("0/hour") is None
+    with pytest.raises(ValueError):
+        parse_rate("30 per hour")
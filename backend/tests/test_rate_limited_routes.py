@@ -0,0 +1,138 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.rate_limits import check_rate_limit, rate_limited, reset_rate_limits
+from app.api.routes import journal, metrics
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.metrics import rate_limit_requests, render_metrics
+from app.core.security import get_current_user
+
+_users = {"alice": SimpleNamespace(id=uuid.uuid4()), "bob": SimpleNamespace(id=uuid.uuid4())}
+
+app = FastAPI()
+
+
+@app.post("/limited", dependencies=[Depends(rate_limited("report_recompute"))])
+def limited():
+    return {"ok": True}
+
+
+def _current_user(user: str = "alice"):
+    return _users[user]
+
+
+app.dependency_overrides[get_current_user] = _current_user
+app.dependency_overrides[get_db] = lambda: None
+client = TestClient(app)
+
+metrics_app = FastAPI()
+metrics_app.include_router(metrics.router)
+metrics_client = TestClient(metrics_app)
+
+
+@pytest.fixture(autouse=True)
+def _budget(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(settings, "rate_limit_backend", "memory")
+    monkeypatch.setattr(settings, "rate_limit_report_recompute", "2/hour")
+    monkeypatch.setattr(settings, "rate_limit_global", "")
+    reset_rate_limits()
+    yield
+    reset_rate_limits()
+
+
+def test_over_budget_returns_429_with_retry_after():
+    assert [client.post("/limited").status_code for _ in range(2)] == [200, 200]
+    r = client.post("/limited")
+    assert r.status_code == 429
+    # 2/hour refills one request every 30 minutes
+    assert 1700 <= int(r.headers["Retry-After"]) <= 1800
+
+
+def test_budgets_are_per_user():
+    for _ in range(3):
+        client.post("/limited")
+    assert client.post("/limited", params={"user": "bob"}).status_code == 200
+
+
+def test_global_budget_is_shared(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_global", "1/hour")
+    assert client.post("/limited").status_code == 200
+    assert client.post("/limited", params={"user": "bob"}).status_code == 429
+
+
+def test_limited_requests_are_counted():
+    before = rate_limit_requests.value(endpoint="report_recompute", outcome="limited")
+    for _ in range(4):
+        client.post("/limited")
+    assert rate_limit_requests.value(endpoint="report_recompute", outcome="limited") == before + 2
+    assert 'rate_limit_requests_total{endpoint="report_recompute",outcome="limited"' in render_metrics()
+
+
+def test_disabled_never_limits(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_enabled", False)
+    assert {client.post("/limited").status_code for _ in range(5)} == {200}
+
+
+def _journal_client(monkeypatch, stored):
+    abandoned = []
+    monkeypatch.setattr(journal, "begin_request", lambda db, user_id, key, request_hash: stored)
+    monkeypatch.setattr(journal, "abandon_request", lambda db, user_id, key: abandoned.append(key))
+    journal_app = FastAPI()
+    journal_app.include_router(journal.router)
+    journal_app.dependency_overrides[get_current_user] = _current_user
+    journal_app.dependency_overrides[get_db] = lambda: None
+    return TestClient(journal_app), abandoned
+
+
+def _create(client, key="k1"):
+    return client.post("/api/journal", json={"text": "Heute war gut.", "mood_score": 7, "energy_score": 6}, headers={"Idempotency-Key": key})
+
+
+def test_idempotent_replays_do_not_spend_budget(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_journal_create", "1/hour")
+    entry = {"id": str(uuid.uuid4()), "text": "Heute war gut.", "mood_score": 7, "energy_score": 6}
+    stored = {"entry": {**entry, "created_at": "2026-10-19T08:00:00Z"}, "analysis_status": "ready"}
+    client, _ = _journal_client(monkeypatch, (201, stored))
+    for _ in range(3):
+        r = _create(client)
+        assert r.status_code == 201
+        assert r.headers["Idempotent-Replayed"] == "true"
+    check_rate_limit(None, _users["alice"], "journal_create")  # the one request is still available
+
+
+def test_new_request_over_budget_releases_its_key(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_journal_create", "1/hour")
+    check_rate_limit(None, _users["alice"], "journal_create")
+    client, abandoned = _journal_client(monkeypatch, None)
+    assert _create(client, "k2").status_code == 429
+    assert abandoned == ["k2"]
+
+
+def test_metrics_are_off_by_default(monkeypatch):
+    monkeypatch.setattr(settings, "metrics_enabled", type(settings)().metrics_enabled)
+    assert metrics_client.get("/metrics").status_code == 404
+
+
+def test_metrics_token_is_required_when_set(monkeypatch):
+    monkeypatch.setattr(settings, "metrics_enabled", True)
+    monkeypatch.setattr(settings, "metrics_token", "s3cret")
+    assert metrics_client.get("/metrics").status_code == 401
+    assert metrics_client.get("/metrics", headers={"Authorization": "Bearer nope"}).status_code == 401
+    r = metrics_client.get("/metrics", headers={"Authorization": "Bearer s3cret"})
+    assert r.status_code == 200
+    assert "rate_limit_requests_total" in r.text
+
+
+def test_global_429_does_not_cost_the_user_a_token(monkeypatch):
+    monkeypatch.setattr(settings, "rate_limit_global", "1/hour")
+    assert client.post("/limited").status_code == 200
+    assert [client.post("/limited", params={"user": "bob"}).status_code for _ in range(3)] == [429, 429, 429]
+
+    monkeypatch.setattr(settings, "rate_limit_global", "")
+    assert [client.post("/limited", params={"user": "bob"}).status_code for _ in range(3)] == [200, 200, 429]
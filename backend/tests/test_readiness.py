@@ -0,0 +1,27 @@
+from app.core import readiness
+from app.llm import client
+
+
+def test_llm_warm_up_is_retried_after_a_failure(monkeypatch):
+    attempts = []
+    states = []
+
+    def flaky_warm_up():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("provider unavailable")
+        return True
+
+    def sleep(_delay):
+        states.append(readiness.checks()["llm"])
+
+    monkeypatch.setattr(client, "warm_up", flaky_warm_up)
+    monkeypatch.setattr(readiness.time, "sleep", sleep)
+    monkeypatch.setattr(readiness, "ping_db", lambda: True)
+    monkeypatch.setattr(readiness, "_checks", {"db": readiness.PENDING, "llm": readiness.PENDING})
+
+    readiness.warm_up(max_delay_s=0.01)
+
+    assert states == [readiness.ERROR, readiness.ERROR]
+    assert readiness.checks() == {"db": readiness.OK, "llm": readiness.OK}
+    assert readiness.is_ready()
@@ -0,0 +1,123 @@
+import argparse
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import analysis_service
+from app.tools import reanalyze
+
+
+class _DownChat:
+    def invoke(self, messages):
+        raise ConnectionError("provider unavailable")
+
+
+def _entry() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        text="Heute war ein langer Tag.",
+        mood_score=4,
+        energy_score=3,
+        created_at=datetime(2026, 10, 19, 8, 30, tzinfo=timezone.utc),
+    )
+
+
+def _generate(entry, **kwargs):
+    return analysis_service.generate_analysis(
+        entry, "de", scores_context="", narrative_context="", fallback_context=lambda: "", chat=_DownChat(), **kwargs
+    )
+
+
+def test_generate_analysis_degrades_by_default():
+    # Live requests still get something to show: default scores or the generic fallback.
+    result = _generate(_entry())
+    assert result.pillar_scores.geist == 5
+
+
+def test_generate_analysis_raises_without_fallback():
+    with pytest.raises(analysis_service.AnalysisFailedError):
+        _generate(_entry(), allow_fallback=False)
+
+
+class _FakeSession:
+    def __init__(self, entries: dict) -> None:
+        self.entries = entries
+
+    def get(self, _model, entry_id):
+        return self.entries.get(entry_id)
+
+    def close(self) -> None:
+        pass
+
+
+def test_llm_outage_does_not_overwrite_or_checkpoint(monkeypatch, tmp_path):
+    entries = {e.id: e for e in (_entry(), _entry())}
+    upserts = []
+    monkeypatch.setattr(reanalyze, "set_llm_rate_limit", lambda rpm: None)
+    monkeypatch.setattr(reanalyze, "SessionLocal", lambda: _FakeSession(entries))
+    monkeypatch.setattr(reanalyze, "_select_entries", lambda db, args: [(eid, "de") for eid in entries])
+    monkeypatch.setattr(reanalyze, "upsert_analyses", lambda db, rows: upserts.append(list(rows)))
+    monkeypatch.setattr(analysis_service, "get_chat", lambda: _DownChat())
+    monkeypatch.setattr(analysis_service, "_get_user_context", lambda db, entry: ("", ""))
+    monkeypatch.setattr(analysis_service, "_get_last_entries_context", lambda db, entry: "")
+
+    checkpoint = tmp_path / "reanalyze.ckpt"
+    args = argparse.Namespace(rpm=0, checkpoint=str(checkpoint), dry_run=False, workers=2, batch_size=10)
+
+    assert reanalyze.run(args) == 2
+    assert upserts == []
+    assert not checkpoint.exists() or checkpoint.read_text() == ""
+
+
+class _HistorySession:
+    """Entry history in memory; the last-entries query is answered by applying its filters."""
+
+    def __init__(self, entries, analyzed_ids) -> None:
+        self.entries = entries
+        self.analyzed_ids = analyzed_ids
+
+    def scalar(self, stmt):
+        # memory_predates: an analysis of this entry or a later one?
+        since = stmt.compile().params["created_at_1"]
+        return next((e.id for e in self.entries if e.id in self.analyzed_ids and e.created_at >= since), None)
+
+    def execute(self, stmt):
+        params = stmt.compile().params
+        rows = [
+            SimpleNamespace(**vars(e), text_head=e.text[:100])
+            for e in self.entries
+            if e.id != params["id_1"] and e.created_at < params["created_at_1"]
+        ]
+        return SimpleNamespace(all=lambda: sorted(rows, key=lambda r: r.created_at, reverse=True)[: params["param_1"]])
+
+
+def test_reanalysis_context_does_not_see_later_entries(monkeypatch):
+    day = timedelta(days=1)
+    old, middle, newest = _entry(), _entry(), _entry()
+    for i, e in enumerate((old, middle, newest)):
+        e.user_id, e.created_at, e.text = old.user_id, old.created_at + i * day, f"Eintrag {i}"
+    db = _HistorySession([old, middle, newest], analyzed_ids={old.id, middle.id, newest.id})
+    memory = SimpleNamespace(analysis_count=3, themes={"zukunft": 3.0})
+    monkeypatch.setattr(analysis_service, "get_user_memory", lambda db, user_id: memory)
+    monkeypatch.setattr(analysis_service, "render_similar_entries_context", lambda db, entry: "")
+
+    scores_context, _ = analysis_service._get_user_context(db, middle)
+
+    assert "Eintrag 0" in scores_context
+    assert "Eintrag 2" not in scores_context
+    assert "zukunft" not in scores_context
+
+
+def test_first_analysis_of_the_newest_entry_uses_memory(monkeypatch):
+    entry = _entry()
+    memory = SimpleNamespace(
+        analysis_count=2, pillar_avgs={}, mood_avg=5.0, energy_avg=5.0, themes={"zukunft": 2.0}, triggers={}
+    )
+    monkeypatch.setattr(analysis_service, "get_user_memory", lambda db, user_id: memory)
+    monkeypatch.setattr(analysis_service, "render_similar_entries_context", lambda db, entry: "")
+
+    scores_context, narrative_context = analysis_service._get_user_context(_HistorySession([entry], set()), entry)
+    assert "zukunft" in scores_context and "zukunft" in narrative_context
@@ -0,0 +1,137 @@
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services import report_service
+
+
+class _FakeSession:
+    def __init__(self, stored: dict) -> None:
+        self.stored = stored
+
+    def commit(self) -> None:
+        pass
+
+    def get(self, _model, report_id):
+        return self.stored.get(report_id)
+
+
+@pytest.fixture
+def fake_reports(monkeypatch):
+    stored: dict = {}
+    calls = []
+
+    def compute(db, user_id, user_language):
+        calls.append(user_id)
+        time.sleep(0.2)  # the LLM call
+        report = SimpleNamespace(id=uuid.uuid4(), created_at=datetime.now(timezone.utc), language=user_language)
+        stored[report.id] = report
+        return report
+
+    def fresh(db, user_id, user_language, *, created_after=None):
+        reports = [r for r in stored.values() if created_after is None or r.created_at >= created_after]
+        return max(reports, key=lambda r: r.created_at, default=None)
+
+    monkeypatch.setattr(report_service, "compute_weekly_report", compute)
+    monkeypatch.setattr(report_service, "get_fresh_weekly_report", fresh)
+    monkeypatch.setattr(report_service, "_lock_user_report", lambda db, user_id: None)
+    return stored, calls
+
+
+def test_concurrent_callers_share_one_computation(fake_reports):
+    stored, calls = fake_reports
+    user_id = uuid.uuid4()
+    results = []
+
+    def caller():
+        results.append(report_service.get_or_compute_weekly_report(_FakeSession(stored), user_id, "de"))
+
+    threads = [threading.Thread(target=caller) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert {r.id for r in results} == {next(iter(stored))}
+
+
+def test_recent_report_is_reused_within_debounce_window(fake_reports, monkeypatch):
+    stored, calls = fake_reports
+    monkeypatch.setattr(settings, "report_debounce_seconds", 60)
+    user_id = uuid.uuid4()
+    first = report_service.get_or_compute_weekly_report(_FakeSession(stored), user_id, "de")
+    second = report_service.get_or_compute_weekly_report(_FakeSession(stored), user_id, "de")
+    assert second.id == first.id
+    assert len(calls) == 1
+
+
+def test_without_debounce_sequential_calls_recompute(fake_reports, monkeypatch):
+    stored, calls = fake_reports
+    monkeypatch.setattr(settings, "report_debounce_seconds", 0)
+    user_id = uuid.uuid4()
+    report_service.get_or_compute_weekly_report(_FakeSession(stored), user_id, "de")
+    report_service.get_or_compute_weekly_report(_FakeSession(stored), user_id, "de")
+    assert len(calls) == 2
+
+
+class _AnalysisTimesSession:
+    """Answers the report lookup and `max(<EntryAnalysis column>)` from in-memory rows."""
+
+    def __init__(self, report, analyses) -> None:
+        self.report = report
+        self.analyses = analyses
+
+    def scalars(self, stmt):
+        return SimpleNamespace(first=lambda: self.report)
+
+    def scalar(self, stmt):
+        column = stmt.selected_columns[0].clauses.clauses[0].key
+        return max(getattr(a, column) for a in self.analyses)
+
+
+def test_report_is_stale_after_an_analysis_is_recomputed():
+    built = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+    report = SimpleNamespace(created_at=built)
+    analysis = SimpleNamespace(created_at=built - timedelta(hours=2), updated_at=built - timedelta(hours=2))
+    db = _AnalysisTimesSession(report, [analysis])
+    assert report_service.get_fresh_weekly_report(db, uuid.uuid4(), "de") is report
+
+    analysis.updated_at = built + timedelta(minutes=5)  # recompute / bulk re-analysis
+    assert report_service.get_fresh_weekly_report(db, uuid.uuid4(), "de") is None
+
+
+def test_precompute_compares_reports_against_analysis_updates():
+    seen = []
+    db = SimpleNamespace(execute=lambda stmt: seen.append(str(stmt)) or [])
+    assert report_service.users_needing_weekly_report(db) == []
+    assert "max(entry_analysis.updated_at)" in seen[0]
+
+
+def test_precompute_takes_the_report_lock_and_skips_fresh_reports(monkeypatch):
+    events = []
+    fresh = {"report": None}
+    monkeypatch.setattr(report_service, "_lock_user_report", lambda db, user_id: events.append("lock"))
+    monkeypatch.setattr(
+        report_service, "get_fresh_weekly_report", lambda db, user_id, language: events.append("fresh") or fresh["report"]
+    )
+    monkeypatch.setattr(
+        report_service,
+        "compute_weekly_report",
+        lambda db, user_id, language, fallback_on_error: events.append(("compute", fallback_on_error)) or "report",
+    )
+    db = _FakeSession({})
+
+    assert report_service.precompute_weekly_report(db, uuid.uuid4(), "de") == "report"
+    assert events == ["lock", "fresh", ("compute", False)]
+
+    # A user view stored a report while the job waited for the lock.
+    events.clear()
+    fresh["report"] = SimpleNamespace(id=uuid.uuid4())
+    assert report_service.precompute_weekly_report(db, uuid.uuid4(), "de") is None
+    assert events == ["lock", "fresh"]
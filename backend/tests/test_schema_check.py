@@ -0,0 +1,36 @@
+import itertools
+
+import pytest
+
+from app.core.schema import SchemaOutOfDateError, backoff_delays, compare_revision
+
+HEADS = {"0010_entry_analysis_updated_at"}
+KNOWN = {"0009_entry_embeddings", "0010_entry_analysis_updated_at"}
+
+
+def test_at_head_is_current():
+    assert compare_revision("0010_entry_analysis_updated_at", HEADS, KNOWN.__contains__) == "current"
+
+
+def test_behind_fails_fast():
+    with pytest.raises(SchemaOutOfDateError, match="0009_entry_embeddings"):
+        compare_revision("0009_entry_embeddings", HEADS, KNOWN.__contains__)
+
+
+def test_unmigrated_database_fails():
+    with pytest.raises(SchemaOutOfDateError):
+        compare_revision(None, HEADS, KNOWN.__contains__)
+
+
+def test_newer_schema_is_tolerated():
+    assert compare_revision("0011_from_a_newer_deploy", HEADS, KNOWN.__contains__) == "ahead"
+
+
+def test_backoff_grows_exponentially_up_to_cap():
+    delays = list(itertools.islice(backoff_delays(0.2, 5.0, rng=lambda: 1.0), 8))
+    assert delays == pytest.approx([0.2, 0.4, 0.8, 1.6, 3.2, 5.0, 5.0, 5.0])
+
+
+def test_backoff_is_jittered():
+    delays = list(itertools.islice(backoff_delays(0.2, 5.0, rng=lambda: 0.5), 3))
+    assert delays == pytest.approx([0.1, 0.2, 0.4])
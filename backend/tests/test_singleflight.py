@@ -0,0 +1,53 @@
+import threading
+import time
+
+import pytest
+
+from app.core.singleflight import SingleFlight
+from app.services.idempotency_service import request_fingerprint
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def work():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return "entry-1"
+
+    results = []
+
+    def caller():
+        results.append(flight.do("k", work))
+
+    threads = [threading.Thread(target=caller) for _ in range(5)]
+    threads[0].start()
+    started.wait()
+    for t in threads[1:]:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert sorted(results) == [("entry-1", False)] + [("entry-1", True)] * 4
+
+
+def test_errors_propagate_and_key_is_released():
+    flight = SingleFlight()
+
+    def boom():
+        raise RuntimeError("llm down")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", boom)
+    assert flight.do("k", lambda: 42) == (42, False)
+
+
+def test_request_fingerprint_is_order_independent():
+    a = request_fingerprint({"text": "hallo", "mood_score": 5, "energy_score": 3})
+    b = request_fingerprint({"energy_score": 3, "mood_score": 5, "text": "hallo"})
+    assert a == b
+    assert a != request_fingerprint({"text": "hallo!", "mood_score": 5, "energy_score": 3})
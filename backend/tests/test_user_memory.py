@@ -0,0 +1,59 @@
+import uuid
+
+from app.models.user_memory import UserMemory
+from app.services.memory_service import fold_analysis, render_user_memory
+
+
+def _memory() -> UserMemory:
+    return UserMemory(user_id=uuid.uuid4(), analysis_count=0)
+
+
+def _scores(value: int) -> dict:
+    return {"geist": value, "herz": value, "seele": value, "koerper": value, "aura": value}
+
+
+def test_first_analysis_seeds_averages():
+    m = fold_analysis(_memory(), mood=4, energy=6, pillar_scores=_scores(7), themes=["Work"], triggers=["Deadline"])
+    assert m.analysis_count == 1
+    assert m.mood_avg == 4
+    assert m.energy_avg == 6
+    assert m.pillar_avgs["herz"] == 7
+    assert m.themes == {"work": 1.0}
+    assert m.triggers == {"deadline": 1.0}
+
+
+def test_moving_average_and_decay():
+    m = _memory()
+    fold_analysis(m, mood=4, energy=4, pillar_scores=_scores(5), themes=["work"], triggers=[])
+    fold_analysis(m, mood=9, energy=4, pillar_scores=_scores(10), themes=["family"], triggers=[])
+    assert 4 < m.mood_avg < 9
+    assert m.pillar_avgs["geist"] == 6.0
+    assert m.themes["family"] > m.themes["work"]
+
+
+def test_recurring_theme_ranks_first():
+    m = _memory()
+    for theme in ["sleep", "work", "work", "friends", "work"]:
+        fold_analysis(m, mood=5, energy=5, pillar_scores=_scores(5), themes=[theme, theme.upper()], triggers=[])
+    assert list(m.themes)[0] == "work"
+    assert "Recurring themes: work" in render_user_memory(m)
+
+
+def test_render_without_memory():
+    assert render_user_memory(None) == "No prior entries."
+
+
+def test_render_ranks_labels_by_count_not_key_order():
+    # As read back from JSONB: keys ordered by length, not by frequency.
+    m = UserMemory(
+        user_id=uuid.uuid4(),
+        analysis_count=12,
+        mood_avg=5.0,
+        energy_avg=5.0,
+        pillar_avgs=_scores(5),
+        themes={"geld": 0.4, "arbeit": 3.2, "familie": 1.5, "schlafmangel": 2.1},
+        triggers={"lärm": 0.5, "deadline": 2.5},
+    )
+    rendered = render_user_memory(m)
+    assert "Recurring themes: arbeit, schlafmangel, familie, geld" in rendered
+    assert "Frequent triggers: deadline, lärm" in rendered
@@ -2,7 +2,7 @@
 
 import Link from "next/link";
 import { useRouter } from "next/navigation";
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { api } from "../../lib/api";
 import { t } from "../../lib/i18n";
 
@@ -23,6 +23,8 @@ export default function Journal() {
   const [energy, setEnergy] = useState(5);
   const [showForm, setShowForm] = useState(false);
   const [saving, setSaving] = useState(false);
+  // Reused when a failed save is retried unchanged, so the backend can deduplicate it.
+  const pendingSave = useRef<{ body: string; key: string } | null>(null);
 
   useEffect(() => {
     api
@@ -51,7 +53,12 @@ export default function Journal() {
       if (text.trim()) parts.push(`${t(lang, "intake.freeText")}: ${text.trim()}`);
 
       const finalText = parts.join("\n");
-      const created = await api.createEntry(finalText, mood, energy);
+      const body = JSON.stringify([finalText, mood, energy]);
+      if (pendingSave.current?.body !== body) {
+        pendingSave.current = { body, key: crypto.randomUUID() };
+      }
+      const created = await api.createEntry(finalText, mood, energy, pendingSave.current.key);
+      pendingSave.current = null;
 
       setDay("");
       setPositive("");
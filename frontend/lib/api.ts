@@ -55,9 +55,11 @@ export const api = {
       body: JSON.stringify({ preferred_language }),
     }),
 
-  createEntry: (text: string, mood_score: number, energy_score: number) =>
+  // Pass the same idempotencyKey when retrying a save so the backend does not create a duplicate entry.
+  createEntry: (text: string, mood_score: number, energy_score: number, idempotencyKey?: string) =>
     fetchAPI("/api/journal", {
       method: "POST",
+      headers: idempotencyKey ? { "Idempotency-Key": idempotencyKey } : undefined,
       body: JSON.stringify({ text, mood_score, energy_score }),
     }),
 
@@ -65,6 +67,9 @@ export const api = {
 
   getEntry: (id: string) => fetchAPI(`/api/journal/${id}`),
 
+  searchEntries: (q: string, offset = 0, limit = 20) =>
+    fetchAPI(`/api/journal/search?q=${encodeURIComponent(q)}&limit=${limit}&offset=${offset}`),
+
   getEntryAnalysis: (id: string) => fetchAPI(`/api/journal/${id}/analysis`),
 
   recomputeEntryAnalysis: (id: string) =>
@@ -76,6 +81,13 @@ export const api = {
 
   recomputeReport: () => fetchAPI("/api/report/recompute", { method: "POST" }),
 
+  getTrends: (days = 90, points = 60) => fetchAPI(`/api/report/trends?days=${days}&points=${points}`),
+
+  getTagFrequencies: (kind = "theme", limit = 30) => fetchAPI(`/api/tags?kind=${kind}&limit=${limit}`),
+
+  getEntriesByTag: (value: string, kind = "theme", offset = 0, limit = 20) =>
+    fetchAPI(`/api/tags/entries?kind=${kind}&value=${encodeURIComponent(value)}&limit=${limit}&offset=${offset}`),
+
   exportData: () => fetchAPI("/api/export"),
 
   deleteAccount: () => fetchAPI("/api/account", { method: "DELETE" }),
@@ -0,0 +1,243 @@
+"""Declarative workload mixes for tools/load_test.py (`--scenario tools/scenarios/<name>.json`).
+
+A scenario describes one *session* of a virtual user: which user (new or returning), how
+many actions, which actions (by weight), how long to think between them, and what the
+journal entries look like. load_test.py starts sessions like it starts flows (closed or
+open loop) and runs all of them over one shared connection pool.
+
+    {
+      "name": "production-mix",
+      "users": {"reuse": 0.8, "max_users": 300, "languages": {"de": 0.7, "en": 0.3}},
+      "session_actions": {"dist": "uniform", "min": 2, "max": 8},
+      "think_time_s": {"dist": "exponential", "mean": 2.0},
+      "entries": {
+        "corpus_dir": "corpus",
+        "length_chars": {"dist": "lognormal", "median": 600, "sigma": 0.9, "min": 40, "max": 20000},
+        "language_mismatch": 0.15
+      },
+      "actions": {"create_entry": 30, "list_entries": 25, "view_analysis": 20, "export": 1}
+    }
+
+Distributions: {"dist": "constant", "value"}, {"dist": "uniform", "min", "max"},
+{"dist": "exponential", "mean"} and {"dist": "lognormal", "median", "sigma"}; each can
+be clamped with "min"/"max". YAML files work too when PyYAML is installed.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - depends on the environment
+    yaml = None
+
+ACTIONS = (
+    "create_entry",
+    "view_analysis",
+    "list_entries",
+    "search",
+    "report",
+    "stats",
+    "trends",
+    "tags",
+    "export",
+    "switch_language",
+)
+LANGUAGES = ("de", "en")
+# JournalEntryCreate.text
+MAX_ENTRY_CHARS = 20000
+
+
+class ScenarioError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Distribution:
+    dist: str
+    value: float = 0.0
+    mean: float = 0.0
+    median: float = 0.0
+    sigma: float = 0.0
+    min: float | None = None
+    max: float | None = None
+
+    @classmethod
+    def parse(cls, spec, what: str) -> Distribution:
+        if isinstance(spec, (int, float)):
+            return cls(dist="constant", value=float(spec))
+        if not isinstance(spec, dict) or spec.get("dist") not in ("constant", "uniform", "exponential", "lognormal"):
+            raise ScenarioError(f"{what}: expected a number or {{'dist': constant|uniform|exponential|lognormal, ...}}")
+        try:
+            d = cls(**spec)
+        except TypeError as e:
+            raise ScenarioError(f"{what}: {e}") from None
+        if d.dist == "uniform" and (d.min is None or d.max is None or d.min > d.max):
+            raise ScenarioError(f"{what}: uniform needs min <= max")
+        if d.dist == "exponential" and d.mean <= 0:
+            raise ScenarioError(f"{what}: exponential needs mean > 0")
+        if d.dist == "lognormal" and d.median <= 0:
+            raise ScenarioError(f"{what}: lognormal needs median > 0")
+        return d
+
+    def sample(self, rng: random.Random) -> float:
+        if self.dist == "constant":
+            x = self.value
+        elif self.dist == "uniform":
+            x = rng.uniform(self.min, self.max)
+        elif self.dist == "exponential":
+            x = rng.expovariate(1.0 / self.mean)
+        else:
+            x = rng.lognormvariate(math.log(self.median), self.sigma)
+        if self.min is not None:
+            x = max(x, self.min)
+        if self.max is not None:
+            x = min(x, self.max)
+        return x
+
+
+class Corpus:
+    """Paragraphs per language, from `<corpus_dir>/<language>.txt` (separated by blank lines)."""
+
+    def __init__(self, paragraphs: dict[str, list[str]]) -> None:
+        self.paragraphs = paragraphs
+        self.words = {
+            lang: sorted({w.strip(".,;:!?\"'()").lower() for p in paras for w in p.split() if len(w) > 4})
+            for lang, paras in paragraphs.items()
+        }
+
+    @classmethod
+    def load(cls, directory: Path) -> Corpus:
+        paragraphs = {}
+        for lang in LANGUAGES:
+            path = directory / f"{lang}.txt"
+            if not path.exists():
+                continue
+            paras = [" ".join(p.split()) for p in path.read_text(encoding="utf-8").split("\n\n")]
+            paragraphs[lang] = [p for p in paras if p]
+        if not paragraphs:
+            raise ScenarioError(f"no corpus files ({', '.join(f'{lang}.txt' for lang in LANGUAGES)}) in {directory}")
+        return cls(paragraphs)
+
+    def entry(self, language: str, length: int, rng: random.Random) -> str:
+        """Random paragraphs in `language` until about `length` characters (cut at a word boundary)."""
+
+        paras = self.paragraphs.get(language) or next(iter(self.paragraphs.values()))
+        parts, size = [], 0
+        while size < length:
+            p = rng.choice(paras)
+            parts.append(p)
+            size += len(p) + 2
+        text = "\n\n".join(parts)
+        if len(text) > length:
+            text = text[:length].rsplit(" ", 1)[0] or text[:length]
+        return text[:MAX_ENTRY_CHARS]
+
+    def search_term(self, language: str, rng: random.Random) -> str:
+        words = self.words.get(language) or next(iter(self.words.values()))
+        return rng.choice(words) if words else "heute"
+
+
+@dataclass
+class VirtualUser:
+    email: str
+    language: str
+    token: str | None = None
+    # Most recent first; view_analysis picks from these.
+    entry_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Scenario:
+    name: str
+    actions: dict[str, float]
+    session_actions: Distribution
+    think_time_s: Distribution
+    entry_length: Distribution
+    language_mismatch: float
+    reuse: float
+    max_users: int
+    languages: dict[str, float]
+    corpus: Corpus
+
+    @classmethod
+    def load(cls, path: str | Path) -> Scenario:
+        path = Path(path)
+        text = path.read_text(encoding="utf-8")
+        if path.suffix in (".yaml", ".yml"):
+            if yaml is None:
+                raise ScenarioError(f"{path}: install PyYAML to read YAML scenarios, or use JSON")
+            data = yaml.safe_load(text)
+        else:
+            data = json.loads(text)
+        return cls.from_dict(data, base_dir=path.parent)
+
+    @classmethod
+    def from_dict(cls, data: dict, *, base_dir: Path) -> Scenario:
+        actions = {name: float(w) for name, w in (data.get("actions") or {}).items() if float(w) > 0}
+        unknown = set(actions) - set(ACTIONS)
+        if unknown:
+            raise ScenarioError(f"unknown actions {sorted(unknown)}; known: {', '.join(ACTIONS)}")
+        if not actions:
+            raise ScenarioError("a scenario needs at least one action with a positive weight")
+
+        users = data.get("users") or {}
+        languages = {lang: float(w) for lang, w in (users.get("languages") or {"de": 1}).items()}
+        if set(languages) - set(LANGUAGES) or sum(languages.values()) <= 0:
+            raise ScenarioError(f"users.languages: weights for {', '.join(LANGUAGES)}")
+
+        entries = data.get("entries") or {}
+        return cls(
+            name=data.get("name", "scenario"),
+            actions=actions,
+            session_actions=Distribution.parse(data.get("session_actions", 3), "session_actions"),
+            think_time_s=Distribution.parse(data.get("think_time_s", 0), "think_time_s"),
+            entry_length=Distribution.parse(entries.get("length_chars", 400), "entries.length_chars"),
+            language_mismatch=float(entries.get("language_mismatch", 0.0)),
+            reuse=float(users.get("reuse", 0.0)),
+            max_users=int(users.get("max_users", 0)),
+            languages=languages,
+            corpus=Corpus.load(base_dir / entries.get("corpus_dir", "corpus")),
+        )
+
+    def pick_action(self, rng: random.Random) -> str:
+        return rng.choices(list(self.actions), weights=list(self.actions.values()))[0]
+
+    def pick_language(self, rng: random.Random) -> str:
+        return rng.choices(list(self.languages), weights=list(self.languages.values()))[0]
+
+    def entry_text(self, user_language: str, rng: random.Random) -> str:
+        """An entry for a user: usually in their language, with `language_mismatch` in the other one."""
+
+        language = user_language
+        if rng.random() < self.language_mismatch:
+            language = next(lang for lang in LANGUAGES if lang != user_language)
+        length = max(1, int(self.entry_length.sample(rng)))
+        return self.corpus.entry(language, length, rng)
+
+
+class UserPool:
+    """Returning users (with `reuse` probability, always once `max_users` exist) or new ones."""
+
+    def __init__(self, scenario: Scenario, rng: random.Random, *, email_prefix: str, email_domain: str) -> None:
+        self.scenario = scenario
+        self.rng = rng
+        self.email_prefix = email_prefix
+        self.email_domain = email_domain
+        self.users: list[VirtualUser] = []
+
+    def pick(self) -> VirtualUser:
+        full = self.scenario.max_users and len(self.users) >= self.scenario.max_users
+        if self.users and (full or self.rng.random() < self.scenario.reuse):
+            return self.rng.choice(self.users)
+        user = VirtualUser(
+            email=f"{self.email_prefix}{len(self.users):05d}@{self.email_domain}",
+            language=self.scenario.pick_language(self.rng),
+        )
+        self.users.append(user)
+        return user
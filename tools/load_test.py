@@ -1,66 +1,170 @@
 #!/usr/bin/env python3
+"""Lebensschule load test: bulk users + entries, with per-endpoint latency histograms.
+
+Closed loop (default): at most --concurrency user flows run at once. Simple, but a slow
+server slows the generator down with it, so tail latencies are under-reported
+(coordinated omission).
+
+Open loop (--arrival constant|poisson --rate R): flows start on a fixed schedule of R per
+second, whether or not earlier flows have finished. A flow's latency is measured from its
+intended start, so time spent waiting behind a stalled generator still counts.
+
+    python3 tools/load_test.py --users 600 --arrival poisson --rate 10 --json-out run.json
+    python3 tools/load_test.py ... --baseline main.json --max-regression-pct 20
+
+With --scenario, each flow is a session from a workload mix (see load_scenarios.py) instead
+of the fixed register -> entries -> poll/report flow:
+
+    python3 tools/load_test.py --scenario tools/scenarios/production_mix.json --users 2000 --arrival poisson --rate 20
+
+All flows share one HTTP client and its keep-alive connection pool (--max-connections).
+"""
+
 from __future__ import annotations
 
 import argparse
 import asyncio
+import csv
+import json
+import math
+import random
 import secrets
-import statistics
 import time
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 
 import httpx
 
+from load_scenarios import Scenario, UserPool, VirtualUser
+
+ENDPOINTS = ("register", "login", "create_entry", "analysis_poll", "report")
+PERCENTILES = (("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("p999", 0.999))
+
+
+class LatencyHistogram:
+    """Log-bucketed latencies: constant memory, values reported within ~1% relative error."""
+
+    MIN_MS = 0.01
+    GROWTH = 1.01
+
+    def __init__(self) -> None:
+        self.buckets: Counter[int] = Counter()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        ms = max(ms, self.MIN_MS)
+        self.buckets[int(math.log(ms / self.MIN_MS, self.GROWTH))] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.MIN_MS * self.GROWTH ** (index + 1), self.max_ms)
+        return self.max_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
 
 @dataclass
-class Result:
-    ok: int = 0
-    failed: int = 0
-    latencies_ms: list[float] | None = None
-
-    def __post_init__(self) -> None:
-        if self.latencies_ms is None:
-            self.latencies_ms = []
-
-
-def _percentile(values: list[float], pct: float) -> float:
-    if not values:
-        return 0.0
-    values_sorted = sorted(values)
-    k = (len(values_sorted) - 1) * pct
-    f = int(k)
-    c = min(f + 1, len(values_sorted) - 1)
-    if f == c:
-        return values_sorted[f]
-    d0 = values_sorted[f] * (c - k)
-    d1 = values_sorted[c] * (k - f)
-    return d0 + d1
+class EndpointStats:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # HTTP status code, or the exception name for transport errors (e.g. "ReadTimeout").
+    statuses: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+
+    def summary(self) -> dict:
+        return {
+            "count": self.latency.count,
+            "errors": self.errors,
+            "mean_ms": round(self.latency.mean_ms, 2),
+            **{f"{name}_ms": round(self.latency.percentile(q), 2) for name, q in PERCENTILES},
+            "max_ms": round(self.latency.max_ms, 2),
+            "statuses": dict(sorted(self.statuses.items())),
+        }
+
+
+class RequestFailed(RuntimeError):
+    pass
+
+
+class Recorder:
+    """Times every request per endpoint and counts responses by status code."""
+
+    def __init__(self) -> None:
+        self.endpoints: dict[str, EndpointStats] = {name: EndpointStats() for name in ENDPOINTS}
+        self.flow = EndpointStats()
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        method: str,
+        url: str,
+        *,
+        expected: tuple[int, ...],
+        **kwargs,
+    ) -> httpx.Response:
+        stats = self.endpoints.setdefault(endpoint, EndpointStats())
+        t0 = time.perf_counter()
+        try:
+            r = await client.request(method, url, timeout=30.0, **kwargs)
+        except httpx.HTTPError as e:
+            stats.latency.record((time.perf_counter() - t0) * 1000.0)
+            stats.statuses[type(e).__name__] += 1
+            stats.errors += 1
+            raise RequestFailed(f"{endpoint}: {type(e).__name__}: {e}") from e
+        stats.latency.record((time.perf_counter() - t0) * 1000.0)
+        stats.statuses[str(r.status_code)] += 1
+        if r.status_code not in expected:
+            stats.errors += 1
+            raise RequestFailed(f"{endpoint} failed: {r.status_code} {r.text[:200]}")
+        return r
+
+    def summary(self) -> dict[str, dict]:
+        rows = {name: stats.summary() for name, stats in self.endpoints.items() if stats.latency.count}
+        rows["flow"] = self.flow.summary()
+        return rows
 
 
 async def register_or_login(
     client: httpx.AsyncClient,
+    recorder: Recorder,
     *,
     email: str,
     password: str,
     preferred_language: str,
 ) -> str:
     # Try register (idempotent-ish). If already exists -> login.
-    r = await client.post(
+    await recorder.request(
+        client,
+        "register",
+        "POST",
         "/api/auth/register",
         json={"email": email, "password": password, "preferred_language": preferred_language},
-        timeout=30.0,
+        expected=(201, 400),
     )
-    if r.status_code not in (201, 400):
-        raise RuntimeError(f"register failed for {email}: {r.status_code} {r.text}")
 
     # Always login to get a bearer token for concurrency-safe auth.
-    r2 = await client.post(
+    r = await recorder.request(
+        client,
+        "login",
+        "POST",
         "/api/auth/login",
         json={"email": email, "password": password},
-        timeout=30.0,
+        expected=(200,),
     )
-    if r2.status_code != 200:
-        raise RuntimeError(f"login failed for {email}: {r2.status_code} {r2.text}")
-    data = r2.json()
+    data = r.json()
     token = data.get("access_token")
     if not token:
         raise RuntimeError(f"login response missing access_token for {email}: {data}")
@@ -69,20 +173,22 @@ async def register_or_login(
 
 async def create_entry(
     client: httpx.AsyncClient,
+    recorder: Recorder,
     *,
     token: str,
     text: str,
     mood_score: int,
     energy_score: int,
 ) -> str:
-    r = await client.post(
+    r = await recorder.request(
+        client,
+        "create_entry",
+        "POST",
         "/api/journal",
         headers={"Authorization": f"Bearer {token}"},
         json={"text": text, "mood_score": mood_score, "energy_score": energy_score},
-        timeout=30.0,
+        expected=(201,),
     )
-    if r.status_code != 201:
-        raise RuntimeError(f"create_entry failed: {r.status_code} {r.text}")
     data = r.json()
     entry_id = (data.get("entry") or {}).get("id")
     if not entry_id:
@@ -90,18 +196,20 @@ async def create_entry(
     return entry_id
 
 
-async def maybe_fetch_report(client: httpx.AsyncClient, *, token: str) -> None:
-    r = await client.get(
+async def maybe_fetch_report(client: httpx.AsyncClient, recorder: Recorder, *, token: str) -> None:
+    await recorder.request(
+        client,
+        "report",
+        "GET",
         "/api/report/current",
         headers={"Authorization": f"Bearer {token}"},
-        timeout=30.0,
+        expected=(200,),
     )
-    if r.status_code != 200:
-        raise RuntimeError(f"report/current failed: {r.status_code} {r.text}")
 
 
 async def maybe_poll_analysis(
     client: httpx.AsyncClient,
+    recorder: Recorder,
     *,
     token: str,
     entry_id: str,
@@ -109,23 +217,32 @@ async def maybe_poll_analysis(
     interval_s: float,
 ) -> None:
     deadline = time.time() + timeout_s
+    etag: str | None = None
     while time.time() < deadline:
-        r = await client.get(
+        headers = {"Authorization": f"Bearer {token}"}
+        if etag:
+            # Like a browser revalidating: unchanged "not ready yet" answers come back as 304.
+            headers["If-None-Match"] = etag
+        r = await recorder.request(
+            client,
+            "analysis_poll",
+            "GET",
             f"/api/journal/{entry_id}/analysis",
-            headers={"Authorization": f"Bearer {token}"},
-            timeout=30.0,
+            headers=headers,
+            expected=(200, 304),
         )
-        if r.status_code != 200:
-            raise RuntimeError(f"analysis poll failed: {r.status_code} {r.text}")
-        if r.json() is not None:
-            return
+        if r.status_code == 200:
+            if r.json() is not None:
+                return
+            etag = r.headers.get("ETag")
         await asyncio.sleep(interval_s)
     raise RuntimeError(f"analysis not ready after {timeout_s}s for entry_id={entry_id}")
 
 
 async def run_user_flow(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
     *,
-    base_url: str,
     email: str,
     password: str,
     preferred_language: str,
@@ -137,95 +254,324 @@ async def run_user_flow(
     poll_timeout_s: float,
     poll_interval_s: float,
 ) -> None:
-    async with httpx.AsyncClient(base_url=base_url) as client:
-        token = await register_or_login(
+    token = await register_or_login(
+        client,
+        recorder,
+        email=email,
+        password=password,
+        preferred_language=preferred_language,
+    )
+
+    created_entry_ids: list[str] = []
+    for i in range(entries_per_user):
+        text = f"Load test entry {i + 1}/{entries_per_user}: {secrets.token_hex(16)}"
+        entry_id = await create_entry(
             client,
-            email=email,
-            password=password,
-            preferred_language=preferred_language,
+            recorder,
+            token=token,
+            text=text,
+            mood_score=mood_score,
+            energy_score=energy_score,
         )
+        created_entry_ids.append(entry_id)
 
-        created_entry_ids: list[str] = []
-        for i in range(entries_per_user):
-            text = f"Load test entry {i + 1}/{entries_per_user}: {secrets.token_hex(16)}"
-            entry_id = await create_entry(
+    if poll_analysis:
+        for entry_id in created_entry_ids:
+            await maybe_poll_analysis(
                 client,
+                recorder,
                 token=token,
-                text=text,
-                mood_score=mood_score,
-                energy_score=energy_score,
+                entry_id=entry_id,
+                timeout_s=poll_timeout_s,
+                interval_s=poll_interval_s,
             )
-            created_entry_ids.append(entry_id)
 
-        if poll_analysis:
-            for entry_id in created_entry_ids:
-                await maybe_poll_analysis(
-                    client,
-                    token=token,
-                    entry_id=entry_id,
-                    timeout_s=poll_timeout_s,
-                    interval_s=poll_interval_s,
-                )
+    if fetch_report:
+        await maybe_fetch_report(client, recorder, token=token)
+
+
+async def run_action(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    scenario: Scenario,
+    user: VirtualUser,
+    action: str,
+    rng: random.Random,
+) -> None:
+    auth = {"Authorization": f"Bearer {user.token}"}
+    if action == "view_analysis" and not user.entry_ids:
+        action = "create_entry"
+
+    if action == "create_entry":
+        entry_id = await create_entry(
+            client,
+            recorder,
+            token=user.token,
+            text=scenario.entry_text(user.language, rng),
+            mood_score=rng.randint(1, 10),
+            energy_score=rng.randint(1, 10),
+        )
+        user.entry_ids.insert(0, entry_id)
+        del user.entry_ids[50:]
+    elif action == "view_analysis":
+        # Skewed towards the newest entries, like the journal page.
+        entry_id = user.entry_ids[min(int(rng.expovariate(0.5)), len(user.entry_ids) - 1)]
+        await recorder.request(
+            client, "view_analysis", "GET", f"/api/journal/{entry_id}/analysis", headers=auth, expected=(200,)
+        )
+    elif action == "list_entries":
+        await recorder.request(client, "list_entries", "GET", "/api/journal", params={"limit": 20}, headers=auth, expected=(200,))
+    elif action == "search":
+        q = scenario.corpus.search_term(user.language, rng)
+        await recorder.request(client, "search", "GET", "/api/journal/search", params={"q": q}, headers=auth, expected=(200,))
+    elif action == "report":
+        await maybe_fetch_report(client, recorder, token=user.token)
+    elif action == "stats":
+        await recorder.request(client, "stats", "GET", "/api/report/stats", params={"days": 30}, headers=auth, expected=(200,))
+    elif action == "trends":
+        await recorder.request(client, "trends", "GET", "/api/report/trends", headers=auth, expected=(200,))
+    elif action == "tags":
+        await recorder.request(client, "tags", "GET", "/api/tags", headers=auth, expected=(200,))
+    elif action == "export":
+        await recorder.request(client, "export", "GET", "/api/export", headers=auth, expected=(200,))
+    elif action == "switch_language":
+        # Makes the user's existing analyses a language mismatch and starts the translation job.
+        language = "en" if user.language == "de" else "de"
+        await recorder.request(
+            client, "switch_language", "PATCH", "/api/me", json={"preferred_language": language}, headers=auth, expected=(200,)
+        )
+        user.language = language
 
-        if fetch_report:
-            await maybe_fetch_report(client, token=token)
 
+async def run_session(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    scenario: Scenario,
+    user: VirtualUser,
+    *,
+    password: str,
+    rng: random.Random,
+) -> None:
+    """One visit of a (new or returning) user: log in if needed, then think and act."""
 
-async def main_async(args: argparse.Namespace) -> int:
+    if user.token is None:
+        user.token = await register_or_login(
+            client, recorder, email=user.email, password=password, preferred_language=user.language
+        )
+    for i in range(max(1, round(scenario.session_actions.sample(rng)))):
+        if i:
+            await asyncio.sleep(scenario.think_time_s.sample(rng))
+        await run_action(client, recorder, scenario, user, scenario.pick_action(rng), rng)
+
+
+def arrival_offsets(arrival: str, rate: float, count: int, rng: random.Random) -> list[float]:
+    """Intended start of each flow, in seconds from the start of the run."""
+
+    if arrival == "constant":
+        return [i / rate for i in range(count)]
+    offsets, t = [], 0.0
+    for _ in range(count):
+        offsets.append(t)
+        t += rng.expovariate(rate)
+    return offsets
+
+
+def compare_to_baseline(current: dict, baseline: dict, max_regression_pct: float) -> list[str]:
+    """Endpoints whose p50/p99 or error rate got worse than the baseline run by more than the threshold."""
+
+    regressions = []
+    limit = 1 + max_regression_pct / 100.0
+    for endpoint, old in baseline.get("endpoints", {}).items():
+        new = current["endpoints"].get(endpoint)
+        if not new or not old.get("count"):
+            continue
+        for key in ("p50_ms", "p99_ms"):
+            if old[key] > 0 and new[key] > old[key] * limit:
+                regressions.append(f"{endpoint} {key}: {old[key]:.1f} -> {new[key]:.1f}")
+        old_rate = old["errors"] / old["count"]
+        new_rate = new["errors"] / new["count"] if new["count"] else 0.0
+        if new_rate > old_rate * limit and new_rate - old_rate > 0.001:
+            regressions.append(f"{endpoint} error rate: {old_rate:.2%} -> {new_rate:.2%}")
+    return regressions
+
+
+def write_csv(path: str, endpoints: dict[str, dict]) -> None:
+    columns = ["count", "errors", "mean_ms", *(f"{name}_ms" for name, _ in PERCENTILES), "max_ms"]
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["endpoint", *columns, "statuses"])
+        for endpoint, row in endpoints.items():
+            statuses = ";".join(f"{k}:{v}" for k, v in row["statuses"].items())
+            writer.writerow([endpoint, *(row[c] for c in columns), statuses])
+
+
+async def main_async(args: argparse.Namespace, scenario: Scenario | None) -> int:
+    recorder = Recorder()
+    ok = failed = dropped = 0
+    in_flight = 0
+    max_lag_ms = 0.0
+    open_loop = args.arrival != "closed"
     sem = asyncio.Semaphore(args.concurrency)
-    result = Result()
+    rng = random.Random(args.seed)
+    pool = (
+        UserPool(scenario, rng, email_prefix=args.email_prefix, email_domain=args.email_domain) if scenario else None
+    )
+    flow_kwargs = dict(
+        password=args.password,
+        preferred_language=args.preferred_language,
+        entries_per_user=args.entries_per_user,
+        mood_score=args.mood_score,
+        energy_score=args.energy_score,
+        fetch_report=args.fetch_report,
+        poll_analysis=args.poll_analysis,
+        poll_timeout_s=args.poll_timeout_s,
+        poll_interval_s=args.poll_interval_s,
+    )
 
-    async def wrapped(i: int) -> None:
-        email = f"{args.email_prefix}{i:05d}@{args.email_domain}"
-        t0 = time.perf_counter()
+    async def run_one(client: httpx.AsyncClient, i: int) -> str:
+        if pool is None:
+            email = f"{args.email_prefix}{i:05d}@{args.email_domain}"
+            await run_user_flow(client, recorder, **flow_kwargs, email=email)
+            return email
+        user = pool.pick()
+        await run_session(client, recorder, scenario, user, password=args.password, rng=rng)
+        return user.email
+
+    async def flow(client: httpx.AsyncClient, i: int, intended: float) -> None:
+        nonlocal ok, failed, in_flight
         try:
-            async with sem:
-                await run_user_flow(
-                    base_url=args.base_url,
-                    email=email,
-                    password=args.password,
-                    preferred_language=args.preferred_language,
-                    entries_per_user=args.entries_per_user,
-                    mood_score=args.mood_score,
-                    energy_score=args.energy_score,
-                    fetch_report=args.fetch_report,
-                    poll_analysis=args.poll_analysis,
-                    poll_timeout_s=args.poll_timeout_s,
-                    poll_interval_s=args.poll_interval_s,
-                )
-            result.ok += 1
+            if open_loop:
+                await run_one(client, i)
+            else:
+                async with sem:
+                    await run_one(client, i)
+            ok += 1
         except Exception as e:  # noqa: BLE001
-            result.failed += 1
+            failed += 1
+            recorder.flow.errors += 1
             if args.verbose:
-                print(f"[FAIL] user={email}: {e}")
+                print(f"[FAIL] flow={i}: {e}")
         finally:
-            result.latencies_ms.append((time.perf_counter() - t0) * 1000.0)
-
-    await asyncio.gather(*(wrapped(i) for i in range(args.users)))
-
-    lat = result.latencies_ms
-    p50 = _percentile(lat, 0.50)
-    p95 = _percentile(lat, 0.95)
-    avg = statistics.mean(lat) if lat else 0.0
+            in_flight -= 1
+            recorder.flow.latency.record((time.perf_counter() - intended) * 1000.0)
+
+    # One client for all flows: connections are kept alive and reused like a fleet of
+    # browsers behind a proxy, instead of a TCP/TLS handshake per simulated user.
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits) as client:
+        started = time.perf_counter()
+        if open_loop:
+            tasks = []
+            offsets = arrival_offsets(args.arrival, args.rate, args.users, random.Random(args.seed))
+            for i, offset in enumerate(offsets):
+                intended = started + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                max_lag_ms = max(max_lag_ms, (time.perf_counter() - intended) * 1000.0)
+                if in_flight >= args.max_in_flight:
+                    # Queueing here would hide the server's slowness again; count it instead.
+                    dropped += 1
+                    recorder.flow.statuses["dropped"] += 1
+                    continue
+                in_flight += 1
+                tasks.append(asyncio.create_task(flow(client, i, intended)))
+            await asyncio.gather(*tasks)
+        else:
+            in_flight = args.users
+            await asyncio.gather(*(flow(client, i, started) for i in range(args.users)))
+    elapsed_s = time.perf_counter() - started
+
+    flow_stats = recorder.flow.latency
+    report = {
+        "config": {
+            "base_url": args.base_url,
+            "scenario": scenario.name if scenario else None,
+            "users": args.users,
+            "arrival": args.arrival,
+            "rate": args.rate if open_loop else None,
+            "concurrency": None if open_loop else args.concurrency,
+            "entries_per_user": args.entries_per_user,
+            "fetch_report": args.fetch_report,
+            "poll_analysis": args.poll_analysis,
+        },
+        "elapsed_s": round(elapsed_s, 2),
+        "flows": {
+            "ok": ok,
+            "failed": failed,
+            "dropped": dropped,
+            "per_s": round(flow_stats.count / elapsed_s, 2),
+        },
+        "max_schedule_lag_ms": round(max_lag_ms, 2) if open_loop else None,
+        "endpoints": recorder.summary(),
+    }
 
     print("Load test finished")
     print(f"  base_url: {args.base_url}")
-    print(f"  users: {args.users}  concurrency: {args.concurrency}")
-    print(f"  entries_per_user: {args.entries_per_user}  fetch_report: {args.fetch_report}  poll_analysis: {args.poll_analysis}")
-    print(f"  ok: {result.ok}  failed: {result.failed}")
-    print(f"  latency_ms: avg={avg:.1f}  p50={p50:.1f}  p95={p95:.1f}")
+    if open_loop:
+        print(f"  users: {args.users}  arrival: {args.arrival}  rate: {args.rate}/s  max_in_flight: {args.max_in_flight}")
+    else:
+        print(f"  users: {args.users}  concurrency: {args.concurrency}")
+    if scenario:
+        print(f"  scenario: {scenario.name}  distinct users: {len(pool.users)}")
+    else:
+        print(f"  entries_per_user: {args.entries_per_user}  fetch_report: {args.fetch_report}  poll_analysis: {args.poll_analysis}")
+    print(f"  ok: {ok}  failed: {failed}  dropped: {dropped}")
+    print(
+        f"  latency_ms (flow): avg={flow_stats.mean_ms:.1f}  p50={flow_stats.percentile(0.5):.1f}"
+        f"  p99={flow_stats.percentile(0.99):.1f}  max={flow_stats.max_ms:.1f}"
+    )
+    print(f"  elapsed_s: {elapsed_s:.1f}  flows/s: {flow_stats.count / elapsed_s:.1f}")
+    if open_loop and max_lag_ms > 100:
+        print(f"  warning: the generator started flows up to {max_lag_ms:.0f} ms late; results understate latency")
+    print()
+    print(f"  {'endpoint':<14} {'count':>7} {'err':>5} {'p50':>8} {'p90':>8} {'p99':>8} {'p99.9':>8} {'max':>8}  statuses")
+    for endpoint, row in report["endpoints"].items():
+        statuses = " ".join(f"{k}:{v}" for k, v in row["statuses"].items())
+        print(
+            f"  {endpoint:<14} {row['count']:>7} {row['errors']:>5} {row['p50_ms']:>8.1f} {row['p90_ms']:>8.1f}"
+            f" {row['p99_ms']:>8.1f} {row['p999_ms']:>8.1f} {row['max_ms']:>8.1f}  {statuses}"
+        )
+
+    if args.json_out:
+        with open(args.json_out, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.csv_out:
+        write_csv(args.csv_out, report["endpoints"])
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.max_regression_pct)
+        for line in regressions:
+            print(f"  regression: {line}")
+        if regressions:
+            return 3
 
-    return 0 if result.failed == 0 else 2
+    return 0 if failed == 0 and dropped == 0 else 2
 
 
 def main() -> int:
     p = argparse.ArgumentParser(description="Lebensschule concurrency/load test: bulk users + entries")
     p.add_argument("--base-url", default="http://localhost:8000", help="Backend base URL")
 
-    p.add_argument("--users", type=int, default=25, help="Number of users to simulate")
-    p.add_argument("--concurrency", type=int, default=10, help="Max concurrent user flows")
+    p.add_argument("--users", type=int, default=25, help="Number of flows (sessions with --scenario) to run")
+    p.add_argument("--concurrency", type=int, default=10, help="Closed loop: max concurrent user flows")
     p.add_argument("--entries-per-user", type=int, default=2, help="Journal entries per user")
 
+    p.add_argument(
+        "--arrival",
+        choices=["closed", "constant", "poisson"],
+        default="closed",
+        help="closed: bounded by --concurrency; constant/poisson: open loop, flows start at --rate per second",
+    )
+    p.add_argument("--rate", type=float, default=0.0, help="Open loop: flows started per second")
+    p.add_argument("--max-in-flight", type=int, default=1000, help="Open loop: drop (and count) flows beyond this")
+    p.add_argument("--seed", type=int, default=None, help="Seed for arrival times and scenario choices")
+    p.add_argument("--max-connections", type=int, default=100, help="Size of the shared HTTP connection pool")
+
+    p.add_argument("--scenario", help="Workload mix (JSON/YAML); each flow is one session instead of the fixed flow")
+
     p.add_argument("--email-prefix", default="loadtest_user_", help="Email local-part prefix")
     p.add_argument("--email-domain", default="example.com", help="Email domain")
     p.add_argument("--password", default="Password123!", help="Password used for all generated users")
@@ -239,6 +585,11 @@ def main() -> int:
     p.add_argument("--poll-timeout-s", type=float, default=30.0)
     p.add_argument("--poll-interval-s", type=float, default=1.0)
 
+    p.add_argument("--json-out", help="Write config, flow counts and per-endpoint latencies as JSON")
+    p.add_argument("--csv-out", help="Write one row per endpoint as CSV")
+    p.add_argument("--baseline", help="JSON from an earlier run; exit 3 if p50/p99 or error rate regressed")
+    p.add_argument("--max-regression-pct", type=float, default=20.0, help="Allowed slowdown against --baseline")
+
     p.add_argument("--verbose", action="store_true", help="Print per-user errors")
 
     args = p.parse_args()
@@ -247,8 +598,17 @@ def main() -> int:
         raise SystemExit("--concurrency must be >= 1")
     if args.users < 1:
         raise SystemExit("--users must be >= 1")
+    if args.arrival != "closed" and args.rate <= 0:
+        raise SystemExit("--rate must be > 0 with --arrival constant/poisson")
+
+    scenario = None
+    if args.scenario:
+        try:
+            scenario = Scenario.load(args.scenario)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"--scenario {args.scenario}: {e}")
 
-    return asyncio.run(main_async(args))
+    return asyncio.run(main_async(args, scenario))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Time from launching a server command until its first successful response.
+
+    python3 tools/time_to_first_request.py --runs 5 --url http://localhost:8000/healthz -- \\
+        docker compose run --rm -p 8000:8000 backend
+
+Each run starts the command, polls --url every --interval-s until it returns 2xx, records the
+elapsed time, then stops the process. Run it once per variant (e.g. before/after a start-path
+change) against the same, already-migrated database and compare the medians.
+"""
+
+from __future__ import annotations
+
+import argparse
+import signal
+import statistics
+import subprocess
+import time
+
+import httpx
+
+
+def _one_run(cmd: list[str], url: str, timeout_s: float, interval_s: float) -> float | None:
+    started = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        with httpx.Client(timeout=2.0) as client:
+            while time.perf_counter() - started < timeout_s:
+                if proc.poll() is not None:
+                    print(f"  command exited with {proc.returncode} before serving")
+                    return None
+                try:
+                    if client.get(url).is_success:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                time.sleep(interval_s)
+        print(f"  no successful response within {timeout_s:.0f}s")
+        return None
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Measure time-to-first-request of a server command")
+    p.add_argument("--url", default="http://localhost:8000/healthz", help="URL polled until it returns 2xx")
+    p.add_argument("--runs", type=int, default=3)
+    p.add_argument("--timeout-s", type=float, default=180.0)
+    p.add_argument("--interval-s", type=float, default=0.05)
+    p.add_argument("--pause-s", type=float, default=2.0, help="Pause between runs (port release)")
+    p.add_argument("cmd", nargs=argparse.REMAINDER, help="Server command, after --")
+
+    args = p.parse_args()
+    cmd = args.cmd[1:] if args.cmd[:1] == ["--"] else args.cmd
+    if not cmd:
+        raise SystemExit("Pass the server command after --")
+
+    samples: list[float] = []
+    for i in range(1, args.runs + 1):
+        elapsed = _one_run(cmd, args.url, args.timeout_s, args.interval_s)
+        if elapsed is not None:
+            samples.append(elapsed)
+            print(f"  run {i}: {elapsed:.2f}s")
+        time.sleep(args.pause_s)
+
+    if not samples:
+        print("No run served a request")
+        return 2
+    print(f"time_to_first_request_s: median={statistics.median(samples):.2f}  min={min(samples):.2f}  max={max(samples):.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())